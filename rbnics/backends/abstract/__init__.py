@@ -8,6 +8,9 @@ from rbnics.backends.abstract.abs import abs
 from rbnics.backends.abstract.affine_expansion_storage import AffineExpansionStorage
 from rbnics.backends.abstract.assign import assign
 from rbnics.backends.abstract.basis_functions_matrix import BasisFunctionsMatrix
+from rbnics.backends.abstract.batched_linear_program_solver import BatchedLinearProgramSolver
+from rbnics.backends.abstract.batched_linear_solver import BatchedLinearSolver
+from rbnics.backends.abstract.batched_product import batched_product
 from rbnics.backends.abstract.copy import copy
 from rbnics.backends.abstract.eigen_solver import EigenSolver
 from rbnics.backends.abstract.evaluate import evaluate
@@ -48,6 +51,9 @@ __all__ = [
     "AffineExpansionStorage",
     "assign",
     "BasisFunctionsMatrix",
+    "BatchedLinearProgramSolver",
+    "BatchedLinearSolver",
+    "batched_product",
     "copy",
     "EigenSolver",
     "evaluate",
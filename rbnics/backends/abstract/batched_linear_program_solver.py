@@ -0,0 +1,31 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.utils.decorators import ABCMeta, AbstractBackend, abstractmethod
+
+
+@AbstractBackend
+class BatchedLinearProgramSolver(object, metaclass=ABCMeta):
+    def __init__(self, costs, inequality_constraints_matrices, inequality_constraints_vectors, bounds):
+        """
+        Solve several independent linear programs, each one of the form described in LinearProgramSolver.
+        The k-th linear program is defined by the k-th entry of each input parameter.
+        Besides the parameters of LinearProgramSolver, the "batch_size" parameter sets the number of linear
+        programs which are solved together.
+        """
+        pass
+
+    @abstractmethod
+    def set_parameters(self, parameters):
+        pass
+
+    @abstractmethod
+    def solve(self):
+        """
+        Return the list of optimal costs. The entry corresponding to a linear program which could not be solved
+        is None.
+        """
+        pass
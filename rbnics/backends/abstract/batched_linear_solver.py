@@ -0,0 +1,21 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.utils.decorators import ABCMeta, AbstractBackend, abstractmethod
+
+
+@AbstractBackend
+class BatchedLinearSolver(object, metaclass=ABCMeta):
+    def __init__(self, lhs, solutions, rhs, bcs=None):
+        pass
+
+    @abstractmethod
+    def set_parameters(self, parameters):
+        pass
+
+    @abstractmethod
+    def solve(self):
+        pass
@@ -0,0 +1,19 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.utils.decorators import abstract_backend
+
+
+# batched_product function to evaluate affine expansions for several parameters at once.
+# For affine expansions of order 1 (e.g. reduced operators) it returns, for each index k, the sum over q of
+#     thetas[k][q] * operators[q]
+# For affine expansions of order 2 (e.g. error estimation operators) it returns a vector with, for each index k,
+# the sum over q1, q2 of
+#     thetas[k][q1] * thetas2[k][q2] * transpose(functions[k]) * operators[q1, q2] * functions2[k]
+# where functions (and functions2) are required only if operators store vectors (and matrices).
+@abstract_backend
+def batched_product(thetas, operators, thetas2=None, functions=None, functions2=None):
+    pass
@@ -23,6 +23,10 @@ class LinearProgramSolver(object, metaclass=ABCMeta):
         """
         pass
 
+    @abstractmethod
+    def set_parameters(self, parameters):
+        pass
+
     @abstractmethod
     def solve(self):
         pass
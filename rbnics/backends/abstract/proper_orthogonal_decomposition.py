@@ -18,6 +18,12 @@ class ProperOrthogonalDecomposition(object, metaclass=ABCMeta):
     def clear(self):
         pass
 
+    # Set parameters of the algorithm used to compute the POD modes, e.g.
+    # method ("exact", "randomized" or "incremental"), oversampling, power_iterations, seed and rank
+    @abstractmethod
+    def set_parameters(self, parameters):
+        pass
+
     # Store a snapshot in the snapshot matrix
     @abstractmethod
     def store_snapshot(self, snapshot, component=None, weight=None):
@@ -25,7 +31,7 @@ class ProperOrthogonalDecomposition(object, metaclass=ABCMeta):
 
     # Perform POD on the snapshots previously computed, and store the first
     # POD modes in the basis functions matrix.
-    # Input arguments are: Nmax, tol
+    # Input arguments are: Nmax, tol (which also drives the size of the sketch of the randomized method)
     # Output arguments are: POD eigenvalues, POD modes, number of POD modes
     @abstractmethod
     def apply(self, Nmax, tol):
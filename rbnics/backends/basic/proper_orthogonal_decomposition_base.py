@@ -5,7 +5,10 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from math import sqrt
-from numpy import abs, cumsum as compute_retained_energy, isclose, sum as compute_total_energy
+from numpy import (abs, asarray, count_nonzero, cumsum as compute_retained_energy, diag, isclose,
+                   sum as compute_total_energy, zeros)
+from numpy.linalg import eigh, qr
+from numpy.random import default_rng
 from rbnics.utils.io import ExportableList
 
 
@@ -26,47 +29,99 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
             # Declare a list to store eigenvalues
             self.eigenvalues = ExportableList("text")
             self.retained_energy = ExportableList("text")
+            # Parameters of the algorithm used to compute the POD modes
+            self.parameters = {
+                "method": "exact",
+                "oversampling": 10,
+                "power_iterations": 2,
+                "seed": None,
+                "rank": None
+            }
+            # Energies of the compressed snapshots, and energy discarded by truncation (incremental method only)
+            self._compressed_energies = list()
+            self._discarded_energy = 0.
+
+        def set_parameters(self, parameters):
+            for (key, value) in parameters.items():
+                assert key in self.parameters, "Invalid parameter " + key + " in ProperOrthogonalDecomposition"
+                if key == "method":
+                    assert value in ("exact", "incremental", "randomized")
+                self.parameters[key] = value
 
         def clear(self):
             self.snapshots_matrix.clear()
             self.eigenvalues = ExportableList("text")
             self.retained_energy = ExportableList("text")
+            self._compressed_energies = list()
+            self._discarded_energy = 0.
 
         # No implementation is provided for store_snapshot, because
         # it has different interface for the standard POD and
         # the tensor one.
 
-        def apply(self, Nmax, tol):
+        def _compress_snapshots_matrix(self):
+            # Incremental method: as soon as the number of stored snapshots exceeds the prescribed rank, the
+            # snapshots matrix is replaced by its leading POD modes, scaled by the square root of the corresponding
+            # eigenvalues. Only the inner products between the latest snapshots and the stored ones are required
+            # to update the correlation matrix, since the correlation of the compressed snapshots is diagonal.
+            if self.parameters["method"] != "incremental":
+                return
+            rank = self.parameters["rank"]
+            assert rank is not None, "Please provide the rank to be retained by the incremental POD"
             inner_product = self.inner_product
             snapshots_matrix = self.snapshots_matrix
             transpose = backend.transpose
+            Nsnapshots = len(snapshots_matrix)
+            if Nsnapshots <= rank:
+                return
 
+            compressed_size = len(self._compressed_energies)
+            latest_snapshots = snapshots_matrix[compressed_size:]
             if inner_product is not None:
-                correlation = transpose(snapshots_matrix) * inner_product * snapshots_matrix
+                correlation_with_latest = asarray(transpose(snapshots_matrix) * inner_product * latest_snapshots)
             else:
-                correlation = transpose(snapshots_matrix) * snapshots_matrix
+                correlation_with_latest = asarray(transpose(snapshots_matrix) * latest_snapshots)
+            correlation = zeros((Nsnapshots, Nsnapshots))
+            correlation[:compressed_size, :compressed_size] = diag(self._compressed_energies)
+            correlation[:, compressed_size:] = correlation_with_latest
+            correlation[compressed_size:, :compressed_size] = correlation_with_latest[:compressed_size].T
 
-            basis_functions = BasisContainerType(self.space, *self.args)
+            (eigs, eigv) = eigh(correlation)
+            idx = eigs.argsort()[::-1]  # sort by decreasing value
+            eigs = eigs[idx]
+            eigv = eigv[:, idx]
+            Ncompressed = min(rank, count_nonzero(eigs > 0.))
+            compressed_snapshots = [snapshots_matrix * tuple(eigv[:, i]) for i in range(Ncompressed)]
+            snapshots_matrix.clear()
+            snapshots_matrix.enrich(compressed_snapshots, copy=False)
+            self._compressed_energies = [float(e) for e in eigs[:Ncompressed]]
+            self._discarded_energy += float(compute_total_energy(abs(eigs[Ncompressed:])))
 
-            eigensolver = online_backend.OnlineEigenSolver(basis_functions, correlation)
-            parameters = {
-                "problem_type": "hermitian",
-                "spectrum": "largest real"
-            }
-            eigensolver.set_parameters(parameters)
-            eigensolver.solve()
+        def apply(self, Nmax, tol):
+            inner_product = self.inner_product
+            transpose = backend.transpose
+
+            basis_functions = BasisContainerType(self.space, *self.args)
 
             Neigs = len(self.snapshots_matrix)
             Nmax = min(Nmax, Neigs)
-            assert len(self.eigenvalues) == 0
+            if self.parameters["method"] == "randomized" and Nmax + self.parameters["oversampling"] < Neigs:
+                (eigensolver, eigenvector_postprocessor, total_energy) = self._solve_randomized_eigenproblem(
+                    Nmax, tol)
+                Neigs = eigensolver.size
+            else:
+                (eigensolver, eigenvector_postprocessor, total_energy) = self._solve_eigenproblem(basis_functions)
+
+            self.eigenvalues = ExportableList("text")
             for i in range(Neigs):
                 (eig_i_real, eig_i_complex) = eigensolver.get_eigenvalue(i)
                 assert isclose(eig_i_complex, 0.)
                 self.eigenvalues.append(eig_i_real)
 
-            total_energy = compute_total_energy([abs(e) for e in self.eigenvalues])
+            if total_energy is None:
+                total_energy = compute_total_energy([abs(e) for e in self.eigenvalues]) + self._discarded_energy
             retained_energy = compute_retained_energy([abs(e) for e in self.eigenvalues])
-            assert len(self.retained_energy) == 0
+            self.retained_energy = ExportableList("text")
             if total_energy > 0.:
                 self.retained_energy.extend([retained_energy_i / total_energy
                                              for retained_energy_i in retained_energy])
@@ -76,6 +131,7 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
             eigenvectors = list()
             for N in range(Nmax):
                 (eigvector, _) = eigensolver.get_eigenvector(N)
+                eigvector = eigenvector_postprocessor(eigvector)
                 eigenvectors.append(eigvector)
                 b = self.snapshots_matrix * eigvector
                 if inner_product is not None:
@@ -91,9 +147,96 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
 
             return (self.eigenvalues[:N], eigenvectors, basis_functions, N)
 
+        def _solve_eigenproblem(self, basis_functions):
+            inner_product = self.inner_product
+            snapshots_matrix = self.snapshots_matrix
+            transpose = backend.transpose
+
+            if inner_product is not None:
+                correlation = transpose(snapshots_matrix) * inner_product * snapshots_matrix
+            else:
+                correlation = transpose(snapshots_matrix) * snapshots_matrix
+
+            eigensolver = online_backend.OnlineEigenSolver(basis_functions, correlation)
+            parameters = {
+                "problem_type": "hermitian",
+                "spectrum": "largest real"
+            }
+            eigensolver.set_parameters(parameters)
+            eigensolver.solve()
+
+            def eigenvector_postprocessor(eigenvector):
+                return eigenvector
+
+            return (eigensolver, eigenvector_postprocessor, None)
+
+        def _solve_randomized_eigenproblem(self, Nmax, tol):
+            # The dominant eigenspace of the correlation matrix is approximated by a randomized range finder,
+            # which only requires the action of the correlation matrix on a sketch of a few vectors, rather than
+            # the assembly of the full correlation matrix. Eigenpairs are then extracted by a Rayleigh-Ritz procedure.
+            inner_product = self.inner_product
+            snapshots_matrix = self.snapshots_matrix
+            transpose = backend.transpose
+            Neigs = len(snapshots_matrix)
+            oversampling = self.parameters["oversampling"]
+
+            def correlation_times(Q):
+                snapshots_matrix_times_Q = BasisContainerType(self.space, *self.args)
+                for j in range(Q.shape[1]):
+                    snapshots_matrix_times_Q.enrich(snapshots_matrix * tuple(Q[:, j]))
+                if inner_product is not None:
+                    return asarray(transpose(snapshots_matrix) * inner_product * snapshots_matrix_times_Q)
+                else:
+                    return asarray(transpose(snapshots_matrix) * snapshots_matrix_times_Q)
+
+            def sketch(sketch_size):
+                random_generator = default_rng(self.parameters["seed"])
+                (Q, _) = qr(correlation_times(random_generator.standard_normal((Neigs, sketch_size))))
+                for _ in range(self.parameters["power_iterations"]):
+                    (Q, _) = qr(correlation_times(Q))
+                projected_correlation = Q.T.dot(correlation_times(Q))
+                projected_correlation = 0.5 * (projected_correlation + projected_correlation.T)
+                return (Q, _RayleighRitzEigenSolver(projected_correlation))
+
+            # The trace of the correlation matrix provides the total energy, so that the retained energy
+            # is computed as in the exact case
+            total_energy = 0.
+            for snapshot in snapshots_matrix:
+                if inner_product is not None:
+                    total_energy += transpose(snapshot) * inner_product * snapshot
+                else:
+                    total_energy += transpose(snapshot) * snapshot
+
+            # If a tolerance is provided, the size of the sketch is chosen adaptively: starting from a small sketch,
+            # its size is doubled until the modes retaining the required energy are available, together with
+            # oversampling further modes. Otherwise, the sketch is sized according to the maximum number of modes.
+            max_sketch_size = Nmax + oversampling
+            if tol > 0.:
+                sketch_size = min(2 * oversampling + 1, max_sketch_size)
+            else:
+                sketch_size = max_sketch_size
+            (Q, eigensolver) = sketch(sketch_size)
+            while sketch_size < max_sketch_size:
+                if total_energy > 0.:
+                    retained_energy = compute_retained_energy(abs(eigensolver.eigs)) / total_energy
+                    N = count_nonzero(retained_energy <= 1. - tol) + 1
+                else:
+                    N = 1  # trivial case, all snapshots are zero
+                if N + oversampling <= sketch_size:
+                    break
+                sketch_size = min(2 * sketch_size, max_sketch_size)
+                (Q, eigensolver) = sketch(sketch_size)
+
+            def eigenvector_postprocessor(eigenvector):
+                eigenvector_on_snapshots = online_backend.OnlineFunction(Neigs)
+                eigenvector_on_snapshots.vector()[:] = Q.dot(eigenvector)
+                return eigenvector_on_snapshots
+
+            return (eigensolver, eigenvector_postprocessor, total_energy)
+
         def print_eigenvalues(self, N=None):
             if N is None:
-                N = len(self.snapshots_matrix)
+                N = len(self.eigenvalues)
             for i in range(N):
                 print("lambda_" + str(i) + " = " + str(self.eigenvalues[i]))
 
@@ -103,4 +246,18 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
         def save_retained_energy_file(self, output_directory, retained_energy_file):
             self.retained_energy.save(output_directory, retained_energy_file)
 
+    class _RayleighRitzEigenSolver(object):
+        def __init__(self, projected_correlation):
+            (eigs, eigv) = eigh(projected_correlation)
+            idx = eigs.argsort()[::-1]  # sort by decreasing value
+            self.eigs = eigs[idx]
+            self.eigv = eigv[:, idx]
+            self.size = len(eigs)
+
+        def get_eigenvalue(self, i):
+            return float(self.eigs[i]), 0.
+
+        def get_eigenvector(self, i):
+            return self.eigv[:, i], None
+
     return _ProperOrthogonalDecompositionBase
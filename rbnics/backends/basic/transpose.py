@@ -5,7 +5,9 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from logging import DEBUG, getLogger
+from weakref import ref
 from rbnics.backends.basic.wrapping import DelayedTranspose
+from rbnics.utils.cache import ProjectionsCache
 from rbnics.utils.decorators import overload
 
 logger = getLogger("rbnics/backends/basic/transpose.py")
@@ -268,8 +270,7 @@ def FunctionsList_Transpose(backend, wrapping, online_backend, online_wrapping,
         def __mul__(self, vector):
             logger.log(DEBUG, "Begin S^T w")
             output = online_backend.OnlineVector(len(self.functions_list))
-            for (i, fun_i) in enumerate(self.functions_list):
-                output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), vector)
+            _project_vector(wrapping, self.functions_list, list(self.functions_list), vector, output)
             logger.log(DEBUG, "End S^T w")
             return output
 
@@ -305,10 +306,8 @@ def FunctionsList_Transpose__times__Matrix(backend, wrapping, online_backend, on
         def __mul__(self, other_functions_list):
             logger.log(DEBUG, "Begin S^T*A*S")
             output = online_backend.OnlineMatrix(len(self.functions_list), len(other_functions_list))
-            for (j, fun_j) in enumerate(other_functions_list):
-                matrix_times_fun_j = wrapping.matrix_mul_vector(self.matrix, wrapping.function_to_vector(fun_j))
-                for (i, fun_i) in enumerate(self.functions_list):
-                    output[i, j] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), matrix_times_fun_j)
+            _project_matrix(wrapping, self.functions_list, list(self.functions_list), self.matrix,
+                            other_functions_list, list(other_functions_list), output)
             logger.log(DEBUG, "End S^T*A*S")
             return output
 
@@ -387,11 +386,8 @@ def BasisFunctionsMatrix_Transpose(backend, wrapping, online_backend, online_wra
         def __mul__(self, vector):
             logger.log(DEBUG, "Begin Z^T w")
             output = online_backend.OnlineVector(self.basis_functions_matrix._component_name_to_basis_component_length)
-            i = 0
-            for component_name in self.basis_functions_matrix._components_name:
-                for fun_i in self.basis_functions_matrix._components[component_name]:
-                    output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), vector)
-                    i += 1
+            _project_vector(wrapping, self.basis_functions_matrix,
+                            _basis_functions_matrix_to_list(self.basis_functions_matrix), vector, output)
             logger.log(DEBUG, "End Z^T w")
             # Assert consistency of private attributes storing the order of components and their basis length.
             assert output._component_name_to_basis_component_index == self._component_name_to_basis_component_index
@@ -444,18 +440,10 @@ def BasisFunctionsMatrix_Transpose__times__Matrix(backend, wrapping, online_back
             output = online_backend.OnlineMatrix(
                 self.basis_functions_matrix._component_name_to_basis_component_length,
                 other_basis_functions_matrix._component_name_to_basis_component_length)
-            j = 0
-            for other_component_name in other_basis_functions_matrix._components_name:
-                for fun_j in other_basis_functions_matrix._components[other_component_name]:
-                    matrix_times_fun_j = wrapping.matrix_mul_vector(
-                        self.matrix, wrapping.function_to_vector(fun_j))
-                    i = 0
-                    for self_component_name in self.basis_functions_matrix._components_name:
-                        for fun_i in self.basis_functions_matrix._components[self_component_name]:
-                            output[i, j] = wrapping.vector_mul_vector(
-                                wrapping.function_to_vector(fun_i), matrix_times_fun_j)
-                            i += 1
-                    j += 1
+            _project_matrix(wrapping, self.basis_functions_matrix,
+                            _basis_functions_matrix_to_list(self.basis_functions_matrix), self.matrix,
+                            other_basis_functions_matrix, _basis_functions_matrix_to_list(other_basis_functions_matrix),
+                            output)
             logger.log(DEBUG, "End Z^T*A*Z")
             # Assert consistency of private attributes storing the order of components and their basis length.
             assert output._component_name_to_basis_component_index == (
@@ -515,6 +503,129 @@ def BasisFunctionsMatrix_Transpose__times__Matrix(backend, wrapping, online_back
     return _BasisFunctionsMatrix_Transpose__times__Matrix
 
 
+# Auxiliary: projections of matrices (or vectors) onto FunctionsList or BasisFunctionsMatrix. When a ProjectionsCache
+# is in use (e.g. while reduced operators are built in the offline phase of a reduced basis method), previous
+# projections are stored in it and extended by bordering when functions are added to the lists: entries related to
+# pairs of functions which were already available are reused, so that only entries related to new functions are
+# computed. New columns are computed from the product of the matrix with the new (right) functions, while new rows
+# are computed from the product of the transpose of the matrix with the new (left) functions, so that only reduced
+# entries need to be stored. In all cases, products are computed block-wise, i.e. as a single product of the matrix
+# with all required functions, followed by products between blocks of vectors.
+class _PreviousProjection(object):
+    def __init__(self, functions_list, matrix_or_vector, other_functions_list, functions, other_functions, output):
+        self._functions_list_ref = ref(functions_list)
+        self._matrix_or_vector_ref = ref(matrix_or_vector)
+        self._other_functions_list_ref = (
+            ref(other_functions_list) if other_functions_list is not None else None)
+        # Functions are identified by their id, and weak references are used to check that they are still alive
+        self.functions_index = {id(fun_i): i for (i, fun_i) in enumerate(functions)}
+        self.functions_refs = [ref(fun_i) for fun_i in functions]
+        self.other_functions_index = {id(fun_j): j for (j, fun_j) in enumerate(other_functions)}
+        self.other_functions_refs = [ref(fun_j) for fun_j in other_functions]
+        self.output = output
+
+    def is_alive(self):
+        return (self._functions_list_ref() is not None
+                and self._matrix_or_vector_ref() is not None
+                and (self._other_functions_list_ref is None or self._other_functions_list_ref() is not None))
+
+
+def _get_previous_projection(functions_list, matrix_or_vector, other_functions_list=None):
+    projections_cache = ProjectionsCache.current()
+    if projections_cache is None:
+        return None
+    previous_projection = projections_cache.get((id(functions_list), id(matrix_or_vector), id(other_functions_list)))
+    if previous_projection is not None and previous_projection.is_alive():
+        return previous_projection
+    else:
+        return None
+
+
+def _store_projection(functions_list, matrix_or_vector, other_functions_list, functions, other_functions, output):
+    projections_cache = ProjectionsCache.current()
+    if projections_cache is None:
+        return
+    try:
+        projection = _PreviousProjection(
+            functions_list, matrix_or_vector, other_functions_list, functions, other_functions, output)
+    except TypeError:  # some of the arguments do not support weak references
+        return
+    for (dead_key, _) in [(key_, projection_) for (key_, projection_) in projections_cache.items()
+                          if not projection_.is_alive()]:
+        del projections_cache[dead_key]
+    projections_cache[id(functions_list), id(matrix_or_vector), id(other_functions_list)] = projection
+
+
+def _project_matrix(wrapping, functions_list, functions, matrix, other_functions_list, other_functions, output):
+    previous_projection = _get_previous_projection(functions_list, matrix, other_functions_list)
+    # Split functions into the ones which were already available in the previous projection and the new ones
+    if previous_projection is not None:
+        (i_old, i_previous, i_new) = _split_functions(
+            functions, previous_projection.functions_index, previous_projection.functions_refs)
+        (j_old, j_previous, j_new) = _split_functions(
+            other_functions, previous_projection.other_functions_index, previous_projection.other_functions_refs)
+    else:
+        (i_old, i_previous, i_new) = (list(), list(), list(range(len(functions))))
+        (j_old, j_previous, j_new) = (list(), list(), list(range(len(other_functions))))
+    vectors = [wrapping.function_to_vector(fun_i) for fun_i in functions]
+    other_vectors = [wrapping.function_to_vector(fun_j) for fun_j in other_functions]
+    # Reuse the entries related to pairs of previous functions
+    for (i, i_p) in zip(i_old, i_previous):
+        for (j, j_p) in zip(j_old, j_previous):
+            output[i, j] = previous_projection.output[i_p][j_p]
+    # Compute the entries related to new columns (for all rows)
+    new_columns = wrapping.vectors_transpose_mul_vectors(
+        vectors, wrapping.matrix_mul_vectors(matrix, [other_vectors[j] for j in j_new]))
+    for (i, _) in enumerate(functions):
+        for (j_block, j) in enumerate(j_new):
+            output[i, j] = new_columns[i, j_block]
+    # Compute the entries related to new rows (for previous columns)
+    if len(i_new) > 0 and len(j_old) > 0:
+        new_rows = wrapping.vectors_transpose_mul_vectors(
+            wrapping.matrix_transpose_mul_vectors(matrix, [vectors[i] for i in i_new]),
+            [other_vectors[j] for j in j_old])
+        for (i_block, i) in enumerate(i_new):
+            for (j_block, j) in enumerate(j_old):
+                output[i, j] = new_rows[i_block, j_block]
+    _store_projection(functions_list, matrix, other_functions_list, functions, other_functions,
+                      [[output[i, j] for j in range(len(other_functions))] for i in range(len(functions))])
+
+
+def _project_vector(wrapping, functions_list, functions, vector, output):
+    previous_projection = _get_previous_projection(functions_list, vector)
+    if previous_projection is not None:
+        (i_old, i_previous, i_new) = _split_functions(
+            functions, previous_projection.functions_index, previous_projection.functions_refs)
+    else:
+        (i_old, i_previous, i_new) = (list(), list(), list(range(len(functions))))
+    for (i, i_p) in zip(i_old, i_previous):
+        output[i] = previous_projection.output[i_p]
+    new_rows = wrapping.vectors_transpose_mul_vectors(
+        [wrapping.function_to_vector(functions[i]) for i in i_new], [vector])
+    for (i_block, i) in enumerate(i_new):
+        output[i] = new_rows[i_block, 0]
+    _store_projection(functions_list, vector, None, functions, list(), [output[i] for i in range(len(functions))])
+
+
+def _split_functions(functions, previous_functions_index, previous_functions_refs):
+    # Return the indices of functions which were available in the previous projection, their index in the
+    # previous projection, and the indices of new functions
+    (old, previous, new) = (list(), list(), list())
+    for (i, fun_i) in enumerate(functions):
+        i_previous = previous_functions_index.get(id(fun_i))
+        if i_previous is not None and previous_functions_refs[i_previous]() is fun_i:
+            old.append(i)
+            previous.append(i_previous)
+        else:
+            new.append(i)
+    return (old, previous, new)
+
+
+def _basis_functions_matrix_to_list(basis_functions_matrix):
+    return [fun_i for component_name in basis_functions_matrix._components_name
+            for fun_i in basis_functions_matrix._components[component_name]]
+
+
 # Auxiliary: transpose of a vectorized matrix (i.e. vector obtained by stacking its columns)
 def VectorizedMatrix_Transpose(backend, wrapping, online_backend, online_wrapping,
                                AdditionalIsMatrix, ConvertAdditionalMatrixTypes):
@@ -7,6 +7,7 @@
 from rbnics.backends.common.abs import abs
 from rbnics.backends.common.affine_expansion_storage import AffineExpansionStorage
 from rbnics.backends.common.assign import assign
+from rbnics.backends.common.batched_linear_program_solver import BatchedLinearProgramSolver
 from rbnics.backends.common.copy import copy
 from rbnics.backends.common.export import export
 from rbnics.backends.common.import_ import import_
@@ -25,6 +26,7 @@ __all__ = [
     "abs",
     "AffineExpansionStorage",
     "assign",
+    "BatchedLinearProgramSolver",
     "copy",
     "export",
     "import_",
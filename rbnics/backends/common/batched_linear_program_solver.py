@@ -0,0 +1,70 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numbers import Number
+from numpy import concatenate, matrix as numpy_matrix, ndarray as numpy_vector
+from scipy.optimize import linprog
+from scipy.sparse import block_diag
+from rbnics.backends.abstract import BatchedLinearProgramSolver as AbstractBatchedLinearProgramSolver
+from rbnics.backends.common.linear_program_solver import Error, LinearProgramSolver, process_parameters
+from rbnics.utils.decorators import BackendFor, list_of, tuple_of
+
+
+@BackendFor("common", inputs=(list_of(numpy_vector), list_of(numpy_matrix), list_of(numpy_vector),
+                              list_of(list_of(tuple_of(Number)))))
+class BatchedLinearProgramSolver(AbstractBatchedLinearProgramSolver):
+    def __init__(self, costs, inequality_constraints_matrices, inequality_constraints_vectors, bounds):
+        assert len(inequality_constraints_matrices) == len(costs)
+        assert len(inequality_constraints_vectors) == len(costs)
+        assert len(bounds) == len(costs)
+        # Rely on the single linear program solver to preprocess the input parameters
+        self.linear_programs = [
+            LinearProgramSolver(cost_k, inequality_constraints_matrix_k, inequality_constraints_vector_k, bounds_k)
+            for (cost_k, inequality_constraints_matrix_k, inequality_constraints_vector_k, bounds_k) in zip(
+                costs, inequality_constraints_matrices, inequality_constraints_vectors, bounds)]
+        # Set default parameters
+        self.parameters = process_parameters(dict())
+
+    def set_parameters(self, parameters):
+        self.parameters = process_parameters(parameters)
+        for linear_program in self.linear_programs:
+            linear_program.set_parameters(parameters)
+
+    def solve(self):
+        optimal_costs = list()
+        batch_size = self.parameters["batch_size"]
+        for offset in range(0, len(self.linear_programs), batch_size):
+            optimal_costs.extend(self._solve_batch(self.linear_programs[offset:offset + batch_size]))
+        return optimal_costs
+
+    def _solve_batch(self, linear_programs):
+        if self.parameters["solver"] == "highs" and len(linear_programs) > 1:
+            # Linear programs are independent, and thus they can be solved at once as a single linear program
+            # with block diagonal constraints matrix. The cost of each of them is then recovered from the solution.
+            # Batches have a fixed size, so that the cost of each solve does not grow with the number of programs.
+            result = linprog(
+                concatenate([linear_program.cost for linear_program in linear_programs]),
+                A_ub=- block_diag([linear_program.inequality_constraints_matrix
+                                   for linear_program in linear_programs], format="csr"),
+                b_ub=- concatenate([linear_program.inequality_constraints_vector
+                                    for linear_program in linear_programs]),
+                bounds=[bounds_q for linear_program in linear_programs for bounds_q in linear_program.bounds],
+                method="highs")
+            if result.status == 0:
+                optimal_costs = list()
+                offset = 0
+                for linear_program in linear_programs:
+                    optimal_costs.append(linear_program.cost.dot(result.x[offset:offset + linear_program.Q]))
+                    offset += linear_program.Q
+                return optimal_costs
+            # otherwise, solve them one at a time to find out which ones could not be solved
+        optimal_costs = list()
+        for linear_program in linear_programs:
+            try:
+                optimal_costs.append(linear_program.solve())
+            except Error:
+                optimal_costs.append(None)
+        return optimal_costs
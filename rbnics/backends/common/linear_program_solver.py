@@ -6,7 +6,8 @@
 
 import cvxopt
 from numbers import Number
-from numpy import eye, hstack, matrix as numpy_matrix, ndarray as numpy_vector, vstack, zeros
+from numpy import asarray, eye, hstack, matrix as numpy_matrix, ndarray as numpy_vector, vstack, zeros
+from scipy.optimize import linprog
 from rbnics.backends.abstract import LinearProgramSolver as AbstractLinearProgramSolver
 from rbnics.utils.decorators import BackendFor, list_of, tuple_of
 
@@ -30,25 +31,59 @@ class LinearProgramSolver(AbstractLinearProgramSolver):
     def __init__(self, cost, inequality_constraints_matrix, inequality_constraints_vector, bounds):
         self.Q = len(cost)
         # Store cost
-        self.cost = cvxopt.matrix(cost)
-        # Store inequality constraints matrix, also including a 2*Q x 2*Q submatrix for bound constraints
-        self.inequality_constraints_matrix = cvxopt.matrix(vstack((- inequality_constraints_matrix, - eye(self.Q),
-                                                                   eye(self.Q))))
-        # Store inequality constraints vector, also including 2*Q rows for bound constraints
+        self.cost = asarray(cost, dtype=float).reshape(self.Q)
+        # Store inequality constraints matrix and vector
+        self.inequality_constraints_matrix = asarray(inequality_constraints_matrix, dtype=float)
+        self.inequality_constraints_vector = asarray(inequality_constraints_vector, dtype=float).reshape(
+            self.inequality_constraints_matrix.shape[0])
+        # Store bounds
         assert len(bounds) == self.Q
-        bounds_lower = zeros(self.Q)
-        bounds_upper = zeros(self.Q)
-        for (q, bounds_q) in enumerate(bounds):
+        self.bounds = bounds
+        for bounds_q in bounds:
             assert bounds_q[0] <= bounds_q[1]
-            bounds_lower[q] = bounds_q[0]
-            bounds_upper[q] = bounds_q[1]
-        self.inequality_constraints_vector = cvxopt.matrix(hstack((- inequality_constraints_vector,
-                                                                   bounds_lower, bounds_upper)))
+        # Set default parameters
+        self.parameters = process_parameters(dict())
+
+    def set_parameters(self, parameters):
+        self.parameters = process_parameters(parameters)
 
     def solve(self):
-        result = cvxopt.solvers.lp(self.cost, self.inequality_constraints_matrix, self.inequality_constraints_vector,
-                                   solver="glpk", options={"glpk": {"msg_lev": "GLP_MSG_OFF"}})
-        if result["status"] != "optimal":
-            raise Error("Linear program solver reports convergence failure with reason", result["status"])
+        if self.parameters["solver"] == "glpk":
+            # Inequality constraints also include a 2*Q x 2*Q submatrix for bound constraints
+            bounds_lower = [bounds_q[0] for bounds_q in self.bounds]
+            bounds_upper = [bounds_q[1] for bounds_q in self.bounds]
+            result = cvxopt.solvers.lp(
+                cvxopt.matrix(self.cost),
+                cvxopt.matrix(vstack((- self.inequality_constraints_matrix, - eye(self.Q), eye(self.Q)))),
+                cvxopt.matrix(hstack((- self.inequality_constraints_vector, bounds_lower, bounds_upper))),
+                solver="glpk", options={"glpk": {"msg_lev": "GLP_MSG_OFF"}})
+            if result["status"] != "optimal":
+                raise Error("Linear program solver reports convergence failure with reason", result["status"])
+            else:
+                return result["primal objective"]
+        elif self.parameters["solver"] == "highs":
+            result = linprog(self.cost, A_ub=- self.inequality_constraints_matrix,
+                             b_ub=- self.inequality_constraints_vector, bounds=self.bounds, method="highs")
+            if result.status != 0:
+                raise Error("Linear program solver reports convergence failure with reason", result.message)
+            else:
+                return result.fun
+        else:
+            raise ValueError("Invalid linear program solver")
+
+
+def process_parameters(parameters):
+    processed_parameters = dict()
+    for (key, value) in parameters.items():
+        if key == "solver":
+            assert value in ("glpk", "highs")
+            processed_parameters[key] = value
+        elif key == "batch_size":
+            # only used when solving several linear programs, see BatchedLinearProgramSolver
+            assert isinstance(value, int) and value > 0
+            processed_parameters[key] = value
         else:
-            return result["primal objective"]
+            raise ValueError("Invalid paramater passed to linear program solver object.")
+    processed_parameters.setdefault("solver", "glpk")
+    processed_parameters.setdefault("batch_size", 16)
+    return processed_parameters
@@ -9,6 +9,7 @@ from rbnics.backends.dolfin.abs import abs
 from rbnics.backends.dolfin.affine_expansion_storage import AffineExpansionStorage
 from rbnics.backends.dolfin.assign import assign
 from rbnics.backends.dolfin.basis_functions_matrix import BasisFunctionsMatrix
+from rbnics.backends.dolfin.batched_linear_solver import BatchedLinearSolver
 from rbnics.backends.dolfin.copy import copy
 from rbnics.backends.dolfin.eigen_solver import EigenSolver
 from rbnics.backends.dolfin.evaluate import evaluate
@@ -54,6 +55,7 @@ __all__ = [
     "AffineExpansionStorage",
     "assign",
     "BasisFunctionsMatrix",
+    "BatchedLinearSolver",
     "copy",
     "EigenSolver",
     "evaluate",
@@ -0,0 +1,80 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from petsc4py import PETSc
+from ufl import Form
+from dolfin import DirichletBC
+from rbnics.backends.abstract import BatchedLinearSolver as AbstractBatchedLinearSolver
+from rbnics.backends.dolfin.function import Function
+from rbnics.backends.dolfin.linear_solver import factorized_solver, LinearSolver, process_parameters
+from rbnics.backends.dolfin.matrix import Matrix
+from rbnics.backends.dolfin.parametrized_tensor_factory import ParametrizedTensorFactory
+from rbnics.backends.dolfin.vector import Vector
+from rbnics.backends.dolfin.wrapping.dirichlet_bc import ProductOutputDirichletBC
+from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
+from rbnics.utils.decorators import BackendFor, dict_of, list_of
+
+
+@BackendFor("dolfin", inputs=(list_of((Form, Matrix.Type(), ParametrizedTensorFactory)),
+                              list_of(Function.Type()),
+                              list_of((Form, ParametrizedTensorFactory, Vector.Type())),
+                              (list_of((list_of(DirichletBC), ProductOutputDirichletBC,
+                                        dict_of(str, list_of(DirichletBC)), dict_of(str, ProductOutputDirichletBC))),
+                               None)))
+class BatchedLinearSolver(AbstractBatchedLinearSolver):
+    def __init__(self, lhs, solutions, rhs, bcs=None):
+        assert len(lhs) == len(solutions)
+        assert len(rhs) == len(solutions)
+        if bcs is None:
+            bcs = [None] * len(solutions)
+        else:
+            assert len(bcs) == len(solutions)
+        self.solutions = solutions
+        self.parameters = process_parameters(dict())
+        # Systems sharing the same left-hand side and boundary conditions are grouped together, so that they
+        # are solved as a block (with a single factorization) and the left-hand side is processed only once.
+        # Rely on the single system solver to assemble operators and to apply boundary conditions.
+        self._groups = dict()  # from ids of (lhs, bcs) to (solver, list of indices of systems, list of rhs)
+        for (i, (lhs_i, solution_i, rhs_i, bcs_i)) in enumerate(zip(lhs, solutions, rhs, bcs)):
+            key = (id(lhs_i), id(bcs_i))
+            if key not in self._groups:
+                solver_i = LinearSolver(lhs_i, solution_i, rhs_i, bcs_i)
+                self._groups[key] = (solver_i, list(), list())
+            else:
+                solver_i = self._groups[key][0]
+                solver_i._init_rhs(rhs_i, bcs_i)
+                solver_i._apply_bcs(bcs_i)
+            self._groups[key][1].append(i)
+            self._groups[key][2].append(solver_i.rhs)
+
+    def set_parameters(self, parameters):
+        self.parameters = process_parameters(parameters)
+
+    def solve(self):
+        for (solver, indices, rhs) in self._groups.values():
+            lu_solver = factorized_solver(
+                solver.lhs, self.parameters["linear_solver"], self.parameters["reuse_factorization"])
+            ksp = lu_solver.ksp()
+            if len(indices) > 1 and hasattr(ksp, "matSolve"):
+                first_rhs = to_petsc4py(rhs[0])
+                rhs_as_dense_matrix = PETSc.Mat().createDense(
+                    (first_rhs.getSizes(), (PETSc.DECIDE, len(rhs))), comm=first_rhs.getComm())
+                rhs_as_dense_matrix.setUp()
+                rhs_as_dense_array = rhs_as_dense_matrix.getDenseArray()
+                for (j, rhs_j) in enumerate(rhs):
+                    rhs_as_dense_array[:, j] = to_petsc4py(rhs_j).getArray(readonly=True)
+                rhs_as_dense_matrix.assemble()
+                solutions_as_dense_matrix = rhs_as_dense_matrix.duplicate()
+                ksp.matSolve(rhs_as_dense_matrix, solutions_as_dense_matrix)
+                solutions_as_dense_array = solutions_as_dense_matrix.getDenseArray()
+                for (j, i) in enumerate(indices):
+                    self.solutions[i].vector().set_local(solutions_as_dense_array[:, j])
+                    self.solutions[i].vector().apply("insert")
+                rhs_as_dense_matrix.destroy()
+                solutions_as_dense_matrix.destroy()
+            else:  # older PETSc versions do not provide a block solve
+                for (i, rhs_i) in zip(indices, rhs):
+                    lu_solver.solve(self.solutions[i].vector(), rhs_i)
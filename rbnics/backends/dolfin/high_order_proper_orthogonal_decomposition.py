@@ -11,7 +11,7 @@ from rbnics.backends.basic import ProperOrthogonalDecompositionBase as BasicHigh
 from rbnics.backends.dolfin.tensor_snapshots_list import TensorSnapshotsList
 from rbnics.backends.dolfin.tensor_basis_list import TensorBasisList
 from rbnics.backends.dolfin.wrapping import get_mpi_comm
-from rbnics.backends.online import OnlineEigenSolver
+from rbnics.backends.online import OnlineEigenSolver, OnlineFunction
 from rbnics.utils.decorators import BackendFor, ModuleWrapper
 
 
@@ -23,7 +23,7 @@ def transpose(arg):
 
 backend = ModuleWrapper(transpose)
 wrapping = ModuleWrapper(get_mpi_comm)
-online_backend = ModuleWrapper(OnlineEigenSolver=OnlineEigenSolver)
+online_backend = ModuleWrapper(OnlineEigenSolver=OnlineEigenSolver, OnlineFunction=OnlineFunction)
 online_wrapping = ModuleWrapper()
 HighOrderProperOrthogonalDecomposition_Base = BasicHighOrderProperOrthogonalDecomposition(
     backend, wrapping, online_backend, online_wrapping, AbstractHighOrderProperOrthogonalDecomposition,
@@ -4,8 +4,10 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from hashlib import sha1
+from pylru import lrucache
 from ufl import Form
-from dolfin import assemble, DirichletBC, PETScLUSolver
+from dolfin import as_backend_type, assemble, DirichletBC, PETScLUSolver
 from rbnics.backends.abstract import LinearSolver as AbstractLinearSolver, LinearProblemWrapper
 from rbnics.backends.dolfin.evaluate import evaluate
 from rbnics.backends.dolfin.function import Function
@@ -13,9 +15,50 @@ from rbnics.backends.dolfin.matrix import Matrix
 from rbnics.backends.dolfin.parametrized_tensor_factory import ParametrizedTensorFactory
 from rbnics.backends.dolfin.vector import Vector
 from rbnics.backends.dolfin.wrapping.dirichlet_bc import ProductOutputDirichletBC
+from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
 from rbnics.utils.decorators import BackendFor, dict_of, list_of, overload
 
 
+def process_parameters(parameters):
+    """
+    Validate parameters of the dolfin linear solvers. The only supported parameters are:
+    - linear_solver: the LU solver to be used by PETSc (e.g. "mumps"), default "default";
+    - reuse_factorization: if True, the factorization of the left-hand side is stored and reused by any later
+      solve with the same left-hand side (e.g. in case of parameter independent matrices), default False.
+    """
+    for key in parameters:
+        assert key in ("linear_solver", "reuse_factorization"), (
+            "dolfin linear solver does not accept parameter " + str(key))
+    return {
+        "linear_solver": parameters.get("linear_solver", "default"),
+        "reuse_factorization": parameters.get("reuse_factorization", False)
+    }
+
+
+def factorized_solver(lhs, linear_solver, reuse_factorization):
+    """
+    Return a LU solver for lhs. If reuse_factorization is True, the solver (and thus the factorization of lhs) is
+    computed only the first time that such lhs is provided. Solvers are looked up by the content of the lhs
+    on all processes, so that the decision whether to factorize (which is a collective operation) is consistent.
+    """
+    if reuse_factorization:
+        (indptr, indices, data) = to_petsc4py(lhs).getValuesCSR()
+        local_digest = sha1(indptr.tobytes() + indices.tobytes() + data.tobytes()).hexdigest()
+        key = (linear_solver, tuple(lhs.mpi_comm().allgather(local_digest)))
+        try:
+            return _factorized_solvers[key]
+        except KeyError:
+            solver = PETScLUSolver(lhs.mpi_comm(), as_backend_type(lhs), linear_solver)
+            _factorized_solvers[key] = solver
+            return solver
+    else:
+        return PETScLUSolver(lhs.mpi_comm(), as_backend_type(lhs), linear_solver)
+
+
+# Storage of the most recently used solvers, from (linear solver, hash of the content) to solvers
+_factorized_solvers = lrucache(4)
+
+
 @BackendFor("dolfin", inputs=((Form, Matrix.Type(), ParametrizedTensorFactory, LinearProblemWrapper),
                               Function.Type(), (Form, ParametrizedTensorFactory, Vector.Type(), None),
                               (list_of(DirichletBC), ProductOutputDirichletBC, dict_of(str, list_of(DirichletBC)),
@@ -30,7 +73,7 @@ class LinearSolver(AbstractLinearSolver):
         self._init_lhs(lhs, bcs)
         self._init_rhs(rhs, bcs)
         self._apply_bcs(bcs)
-        self._linear_solver = "default"
+        self.parameters = process_parameters(dict())
         self.monitor = None
 
     @overload(LinearProblemWrapper, Function.Type())
@@ -98,13 +141,10 @@ class LinearSolver(AbstractLinearSolver):
                 bc.apply(self.lhs, self.rhs)
 
     def set_parameters(self, parameters):
-        assert len(parameters) in (0, 1)
-        if len(parameters) == 1:
-            assert "linear_solver" in parameters
-        self._linear_solver = parameters.get("linear_solver", "default")
+        self.parameters = process_parameters(parameters)
 
     def solve(self):
-        solver = PETScLUSolver(self._linear_solver)
-        solver.solve(self.lhs, self.solution.vector(), self.rhs)
+        solver = factorized_solver(self.lhs, self.parameters["linear_solver"], self.parameters["reuse_factorization"])
+        solver.solve(self.solution.vector(), self.rhs)
         if self.monitor is not None:
             self.monitor(self.solution)
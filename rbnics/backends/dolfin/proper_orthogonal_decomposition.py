@@ -12,7 +12,7 @@ from rbnics.backends.dolfin.functions_list import FunctionsList
 from rbnics.backends.dolfin.matrix import Matrix
 from rbnics.backends.dolfin.snapshots_matrix import SnapshotsMatrix
 from rbnics.backends.dolfin.wrapping import get_mpi_comm
-from rbnics.backends.online import OnlineEigenSolver
+from rbnics.backends.online import OnlineEigenSolver, OnlineFunction
 from rbnics.utils.decorators import BackendFor, ModuleWrapper
 
 
@@ -24,7 +24,7 @@ def transpose(arg):
 
 backend = ModuleWrapper(transpose)
 wrapping = ModuleWrapper(get_mpi_comm)
-online_backend = ModuleWrapper(OnlineEigenSolver=OnlineEigenSolver)
+online_backend = ModuleWrapper(OnlineEigenSolver=OnlineEigenSolver, OnlineFunction=OnlineFunction)
 online_wrapping = ModuleWrapper()
 ProperOrthogonalDecomposition_Base = BasicProperOrthogonalDecomposition(
     backend, wrapping, online_backend, online_wrapping, AbstractProperOrthogonalDecomposition,
@@ -38,3 +38,4 @@ class ProperOrthogonalDecomposition(ProperOrthogonalDecomposition_Base):
 
     def store_snapshot(self, snapshot, component=None, weight=None):
         self.snapshots_matrix.enrich(snapshot, component, weight)
+        self._compress_snapshots_matrix()
@@ -128,6 +128,17 @@ def BasicReducedMesh(backend, wrapping):
             # Cell functions to mark cells (on the full mesh)
             self.reduced_mesh_markers = dict()  # from N to MeshFunction
             # ... which again is not initialized here for performance reasons
+            # ... and, after load, location of the markers of reduced meshes which have not been materialized yet
+            self._reduced_mesh_markers_location = None
+
+            # Reduced meshes (and related data structures) are materialized from markers only when requested
+            # for a specific N: copies created by __getitem__ materialize them through the original reduced mesh
+            self._materialize_from = None
+            if copy_from is not None:
+                if copy_from._materialize_from is not None:
+                    self._materialize_from = copy_from._materialize_from
+                else:
+                    self._materialize_from = copy_from
 
             # DOFs list (of the full mesh) that need to be added at each N
             self.reduced_mesh_dofs_list = list()  # list (of size N) of tuple (of size len(V)) of dofs
@@ -140,22 +151,22 @@ def BasicReducedMesh(backend, wrapping):
 
             # Reduced meshes, for all N
             self.reduced_mesh = dict()  # from N to Mesh
-            if copy_from is not None:
+            if copy_from is not None and key_as_int in copy_from.reduced_mesh:
                 self.reduced_mesh[key_as_int] = copy_from.reduced_mesh[key_as_int]
 
             # Reduced subdomain data, for all N
             self.reduced_subdomain_data = dict()  # from N to dict from mesh MeshFunction to reduced_mesh MeshFunction
-            if copy_from is not None:
+            if copy_from is not None and key_as_int in copy_from.reduced_subdomain_data:
                 self.reduced_subdomain_data[key_as_int] = copy_from.reduced_subdomain_data[key_as_int]
 
             # Reduced function spaces, for all N
             self.reduced_function_spaces = dict()  # from N to tuple (of size len(V)) of FunctionSpace
-            if copy_from is not None:
+            if copy_from is not None and key_as_int in copy_from.reduced_function_spaces:
                 self.reduced_function_spaces[key_as_int] = copy_from.reduced_function_spaces[key_as_int]
 
             # DOFs list (of the reduced mesh) that need to be added at each N
             self.reduced_mesh_reduced_dofs_list = dict()  # from N to list of tuple (of size len(V)) of dofs
-            if copy_from is not None:
+            if copy_from is not None and key_as_int in copy_from.reduced_mesh_reduced_dofs_list:
                 self.reduced_mesh_reduced_dofs_list[key_as_int] = copy_from.reduced_mesh_reduced_dofs_list[key_as_int]
             # Prepare storage for helper mapping needed for I/O
             self.reduced_mesh_reduced_dofs_list__dof_map_writer_mapping = dict()  # from N to tuple (of size len(V))
@@ -216,9 +227,9 @@ def BasicReducedMesh(backend, wrapping):
             # Consistency checks
             assert isinstance(global_dofs, tuple)
             assert len(global_dofs) == len(self.V)
+            N = self._get_next_index()
             self.reduced_mesh_dofs_list.append(global_dofs)
             # Mark all cells
-            N = self._get_next_index()
             reduced_mesh_markers = self.reduced_mesh_markers[N]
             for (component, global_dof) in enumerate(global_dofs):
                 global_dof_found = 0
@@ -228,11 +239,30 @@ def BasicReducedMesh(backend, wrapping):
                         reduced_mesh_markers[cell] = True
                 global_dof_found = self.mpi_comm.allreduce(global_dof_found, op=MAX)
                 assert global_dof_found == 1
-            # Actually update to data structures using updated cells marker
-            self._update()
-
-        def _update(self):
-            N = self._get_next_index()
+            # Data structures are not updated using updated cells marker here, since there is no need to
+            # create a submesh for each intermediate N: they will be materialized when actually required
+
+        def _materialize(self, N):
+            if N not in self.reduced_mesh:
+                assert N < len(self.reduced_mesh_dofs_list)
+                if self._materialize_from is not None:
+                    self._materialize_from._materialize(N)
+                    self.reduced_mesh[N] = self._materialize_from.reduced_mesh[N]
+                    self.reduced_subdomain_data[N] = self._materialize_from.reduced_subdomain_data[N]
+                    self.reduced_function_spaces[N] = self._materialize_from.reduced_function_spaces[N]
+                    self.reduced_mesh_reduced_dofs_list[N] = self._materialize_from.reduced_mesh_reduced_dofs_list[N]
+                else:
+                    self._update(N)
+
+        def _update(self, N):
+            # Get cells marker, reading it from file if it was not computed by append()
+            if N not in self.reduced_mesh_markers:
+                assert self._reduced_mesh_markers_location is not None
+                (directory, filename) = self._reduced_mesh_markers_location
+                marker_filename = os.path.join(str(directory), filename, "reduced_mesh_" + str(N) + "_markers")
+                with MeshFunctionFile(self.mesh.mpi_comm(), self.mesh.geometry().dim(),
+                                      marker_filename, "r") as input_file:
+                    self.reduced_mesh_markers[N] = input_file.read("bool", self.mesh, self.mesh.geometry().dim())
             # Create submesh
             reduced_mesh = wrapping.create_submesh(self.mesh, self.reduced_mesh_markers[N])
             self.reduced_mesh[N] = reduced_mesh
@@ -262,7 +292,7 @@ def BasicReducedMesh(backend, wrapping):
             self.reduced_function_spaces[N] = tuple(reduced_function_spaces)
             # ... and fill in reduced_mesh_reduced_dofs_list ...
             reduced_mesh_reduced_dofs_list = list()
-            for dofs in self.reduced_mesh_dofs_list:
+            for dofs in self.reduced_mesh_dofs_list[:(N + 1)]:
                 reduced_dofs = list()
                 for (component, dof) in enumerate(dofs):
                     dof_processor = -1
@@ -276,10 +306,10 @@ def BasicReducedMesh(backend, wrapping):
                 assert len(reduced_dofs) in (1, 2)
                 reduced_mesh_reduced_dofs_list.append(tuple(reduced_dofs))
             logger.log(DEBUG, "Reduced DOFs list " + str(reduced_mesh_reduced_dofs_list))
-            logger.log(DEBUG, "corresponding to DOFs list " + str(self.reduced_mesh_dofs_list))
+            logger.log(DEBUG, "corresponding to DOFs list " + str(self.reduced_mesh_dofs_list[:(N + 1)]))
             self.reduced_mesh_reduced_dofs_list[N] = reduced_mesh_reduced_dofs_list
             # Finally, update terms related to auxiliary problems
-            self._update_auxiliary()
+            self._update_auxiliary(N)
 
         def _init_for_append_if_needed(self):
             # Initialize dof to cells map only the first time
@@ -305,15 +335,15 @@ def BasicReducedMesh(backend, wrapping):
             assert N not in self.reduced_mesh_markers
             self.reduced_mesh_markers[N] = reduced_mesh_markers
 
-        def _update_auxiliary(self):
+        def _update_auxiliary(self, N):
             if self.auxiliary_problems_and_components is not None:
                 for key in self.auxiliary_problems_and_components:
                     (auxiliary_problem, component) = key
-                    self._update_auxiliary_reduced_function_space(auxiliary_problem, component)
-                    self._update_auxiliary_function_interpolator(auxiliary_problem, component)
+                    self._update_auxiliary_reduced_function_space(auxiliary_problem, component, N)
+                    self._update_auxiliary_function_interpolator(auxiliary_problem, component, N)
                     if not isinstance(auxiliary_problem, wrapping.AuxiliaryProblemForNonParametrizedFunction):
                         if is_training_finished(auxiliary_problem):
-                            self._update_auxiliary_basis_functions_matrix(auxiliary_problem, component)
+                            self._update_auxiliary_basis_functions_matrix(auxiliary_problem, component, N)
                         else:
                             pass  # will be computed when training is finished (see _save_auxiliary)
 
@@ -384,11 +414,17 @@ def BasicReducedMesh(backend, wrapping):
 
         def save(self, directory, filename):
             self._assert_dict_lengths()
+            # Materialize the reduced mesh for the largest N, which is the one typically used online.
+            # Reduced meshes for smaller N are saved only if they have been already materialized, and
+            # are otherwise materialized from the saved markers when requested after load
+            if len(self.reduced_mesh_dofs_list) > 0:
+                self._materialize(len(self.reduced_mesh_dofs_list) - 1)
             # Get full directory name
             full_directory = Folders.Folder(os.path.join(str(directory), filename))
             full_directory.create()
             # Nmax
             self._save_Nmax(directory, filename)
+            self._save_materialized_indices(directory, filename)
             # reduced_mesh
             for (index, reduced_mesh) in self.reduced_mesh.items():
                 mesh_filename = os.path.join(str(directory), filename, "reduced_mesh_" + str(index))
@@ -438,9 +474,15 @@ def BasicReducedMesh(backend, wrapping):
         def _save_Nmax(self, directory, filename):
             def save_Nmax_task():
                 with open(os.path.join(str(directory), filename, "reduced_mesh.length"), "w") as length:
-                    length.write(str(len(self.reduced_mesh)))
+                    length.write(str(len(self.reduced_mesh_dofs_list)))
             parallel_io(save_Nmax_task, self.mpi_comm)
 
+        def _save_materialized_indices(self, directory, filename):
+            def save_materialized_indices_task():
+                with open(os.path.join(str(directory), filename, "reduced_mesh.materialized"), "w") as materialized:
+                    materialized.write(" ".join([str(index) for index in sorted(self.reduced_mesh.keys())]))
+            parallel_io(save_materialized_indices_task, self.mpi_comm)
+
         def _init_for_save_if_needed(self):
             # Initialize dof map mappings for output
             if len(self.reduced_mesh_dofs_list__dof_map_writer_mapping) == 0:
@@ -452,19 +494,20 @@ def BasicReducedMesh(backend, wrapping):
                     reduced_mesh_dofs_list__dof_map_writer_mapping)
 
             # Initialize reduced dof mapping for output
-            assert len(self.reduced_mesh_reduced_dofs_list__dof_map_writer_mapping) == len(self.reduced_mesh) - 1
-            reduced_mesh_reduced_dofs_list__dof_map_writer_mapping = list()
-            for reduced_V__component in self.reduced_function_spaces[len(self.reduced_mesh) - 1]:
-                reduced_mesh_reduced_dofs_list__dof_map_writer_mapping.append(
-                    wrapping.build_dof_map_writer_mapping(reduced_V__component))
-            self.reduced_mesh_reduced_dofs_list__dof_map_writer_mapping[len(self.reduced_mesh) - 1] = tuple(
-                reduced_mesh_reduced_dofs_list__dof_map_writer_mapping)
+            for index in self.reduced_mesh.keys():
+                if index not in self.reduced_mesh_reduced_dofs_list__dof_map_writer_mapping:
+                    reduced_mesh_reduced_dofs_list__dof_map_writer_mapping = list()
+                    for reduced_V__component in self.reduced_function_spaces[index]:
+                        reduced_mesh_reduced_dofs_list__dof_map_writer_mapping.append(
+                            wrapping.build_dof_map_writer_mapping(reduced_V__component))
+                    self.reduced_mesh_reduced_dofs_list__dof_map_writer_mapping[index] = tuple(
+                        reduced_mesh_reduced_dofs_list__dof_map_writer_mapping)
 
         def _save_auxiliary(self, directory, filename):
             if self.auxiliary_problems_and_components is not None:
                 for key in self.auxiliary_problems_and_components:
                     (auxiliary_problem, component) = key
-                    for index in range(len(self.reduced_mesh)):
+                    for index in sorted(self.reduced_mesh.keys()):
                         self._save_auxiliary_reduced_function_space(
                             directory, filename, auxiliary_problem, component, index)
                         if not isinstance(auxiliary_problem, wrapping.AuxiliaryProblemForNonParametrizedFunction):
@@ -541,7 +584,7 @@ def BasicReducedMesh(backend, wrapping):
             key = (auxiliary_problem, component)
             if not self._auxiliary_basis_functions_matrix_save_patched[key]:
                 def update_and_save_auxiliary_basis_functions_matrix():
-                    for index in range(len(self.reduced_mesh)):
+                    for index in sorted(self.reduced_mesh.keys()):
                         self._update_auxiliary_basis_functions_matrix(auxiliary_problem, component, index)
                         self._save_auxiliary_basis_functions_matrix(
                             directory, filename, auxiliary_problem, component, index)
@@ -574,7 +617,7 @@ def BasicReducedMesh(backend, wrapping):
                 self._auxiliary_basis_functions_matrix_save_patched[key] = True
 
         def load(self, directory, filename):
-            if len(self.reduced_mesh) > 0:  # avoid loading multiple times
+            if len(self.reduced_mesh_dofs_list) > 0:  # avoid loading multiple times
                 self._assert_dict_lengths()
                 return False
             else:
@@ -583,8 +626,9 @@ def BasicReducedMesh(backend, wrapping):
                 full_directory = os.path.join(str(directory), filename)
                 # Nmax
                 Nmax = self._load_Nmax(directory, filename)
+                materialized_indices = self._load_materialized_indices(directory, filename, Nmax)
                 # reduced_mesh
-                for index in range(Nmax):
+                for index in materialized_indices:
                     mesh_filename = os.path.join(str(directory), filename, "reduced_mesh_" + str(index))
                     with MeshFile(self.mesh.mpi_comm(), self.mesh.geometry().dim(), mesh_filename, "r") as input_file:
                         reduced_mesh = input_file.read()
@@ -597,7 +641,7 @@ def BasicReducedMesh(backend, wrapping):
                         reduced_function_spaces.append(reduced_function_space_component)
                     self.reduced_function_spaces[index] = tuple(reduced_function_spaces)
                 # reduced_subdomain_data
-                for index in range(Nmax):
+                for index in materialized_indices:
                     if self.subdomain_data is not None:
                         reduced_subdomain_data = dict()
                         for (subdomain_index, subdomain) in enumerate(self.subdomain_data):
@@ -612,9 +656,11 @@ def BasicReducedMesh(backend, wrapping):
                         self.reduced_subdomain_data[index] = reduced_subdomain_data
                     else:
                         self.reduced_subdomain_data[index] = None
-                # do not load reduced_mesh_markers, as they are not needed online
+                # do not load reduced_mesh_markers, as they are needed online only to materialize reduced meshes
+                # for which only markers were saved: store their location to read them only in that case
+                self._reduced_mesh_markers_location = (directory, filename)
                 # Init
-                self._init_for_load_if_needed(Nmax)
+                self._init_for_load_if_needed(materialized_indices)
                 # reduced_mesh_dofs_list
                 importable_reduced_mesh_dofs_list = ExportableList("pickle")
                 importable_reduced_mesh_dofs_list.load(full_directory, "dofs")
@@ -632,10 +678,10 @@ def BasicReducedMesh(backend, wrapping):
                         importable_reduced_mesh_dofs_list__iterator += 1
                     self.reduced_mesh_dofs_list.append(tuple(reduced_mesh_dof))
                 # reduced_mesh_reduced_dofs_list
-                for index in range(Nmax):
+                for index in materialized_indices:
                     importable_reduced_mesh_reduced_dofs_list = ExportableList("pickle")
                     importable_reduced_mesh_reduced_dofs_list.load(full_directory, "reduced_dofs_" + str(index))
-                    assert len(self.reduced_mesh_reduced_dofs_list) == index
+                    assert index not in self.reduced_mesh_reduced_dofs_list
                     self.reduced_mesh_reduced_dofs_list[index] = list()
                     importable_reduced_mesh_reduced_dofs_list__iterator = 0
                     importable_reduced_mesh_reduced_dofs_list_tuple_length = len(self.V)
@@ -667,7 +713,17 @@ def BasicReducedMesh(backend, wrapping):
                     return int(length.readline())
             return parallel_io(load_Nmax_task, self.mpi_comm)
 
-        def _init_for_load_if_needed(self, Nmax):
+        def _load_materialized_indices(self, directory, filename, Nmax):
+            def load_materialized_indices_task():
+                materialized_filename = os.path.join(str(directory), filename, "reduced_mesh.materialized")
+                if os.path.exists(materialized_filename):
+                    with open(materialized_filename, "r") as materialized:
+                        return [int(index) for index in materialized.readline().split()]
+                else:  # reduced meshes were saved for all N
+                    return list(range(Nmax))
+            return parallel_io(load_materialized_indices_task, self.mpi_comm)
+
+        def _init_for_load_if_needed(self, materialized_indices):
             # Initialize dof map mappings for input
             if len(self.reduced_mesh_dofs_list__dof_map_reader_mapping) == 0:
                 reduced_mesh_dofs_list__dof_map_reader_mapping = list()
@@ -678,7 +734,9 @@ def BasicReducedMesh(backend, wrapping):
                     reduced_mesh_dofs_list__dof_map_reader_mapping)
 
             # Initialize reduced dof map mappings for input
-            for index in range(len(self.reduced_mesh_reduced_dofs_list__dof_map_reader_mapping), Nmax):
+            for index in materialized_indices:
+                if index in self.reduced_mesh_reduced_dofs_list__dof_map_reader_mapping:
+                    continue
                 reduced_mesh_reduced_dofs_list__dof_map_reader_mapping = list()
                 for reduced_V__component in self.reduced_function_spaces[index]:
                     reduced_mesh_reduced_dofs_list__dof_map_reader_mapping.append(
@@ -690,7 +748,7 @@ def BasicReducedMesh(backend, wrapping):
             if self.auxiliary_problems_and_components is not None:
                 for key in self.auxiliary_problems_and_components:
                     (auxiliary_problem, component) = key
-                    for index in range(len(self.reduced_mesh)):
+                    for index in sorted(self.reduced_mesh.keys()):
                         self._load_auxiliary_reduced_function_space(
                             directory, filename, auxiliary_problem, component, index)
                         if not isinstance(auxiliary_problem, wrapping.AuxiliaryProblemForNonParametrizedFunction):
@@ -782,7 +840,7 @@ def BasicReducedMesh(backend, wrapping):
             key = (auxiliary_problem, component)
             if not self._auxiliary_basis_functions_matrix_load_patched[key]:
                 def load_auxiliary_basis_functions_matrix():
-                    for index in range(len(self.reduced_mesh)):
+                    for index in sorted(self.reduced_mesh.keys()):
                         if index not in self._auxiliary_basis_functions_matrix[key]:
                             self._load_auxiliary_basis_functions_matrix(
                                 directory, filename, auxiliary_problem, component, index)
@@ -818,13 +876,12 @@ def BasicReducedMesh(backend, wrapping):
             return os.path.join(*folder_path)
 
         def _assert_dict_lengths(self):
-            assert len(self.reduced_mesh) == len(self.reduced_function_spaces)
-            assert len(self.reduced_mesh) == len(self.reduced_subdomain_data)
-            if len(self.reduced_mesh) == 0:
-                assert len(self.reduced_mesh_dofs_list) == 0
-            else:
-                assert max(self.reduced_mesh.keys()) == len(self.reduced_mesh_dofs_list) - 1
-            assert len(self.reduced_mesh) == len(self.reduced_mesh_reduced_dofs_list)
+            # Only a subset of the reduced meshes may have been materialized
+            assert self.reduced_mesh.keys() == self.reduced_function_spaces.keys()
+            assert self.reduced_mesh.keys() == self.reduced_subdomain_data.keys()
+            assert self.reduced_mesh.keys() == self.reduced_mesh_reduced_dofs_list.keys()
+            if len(self.reduced_mesh) > 0:
+                assert max(self.reduced_mesh.keys()) < len(self.reduced_mesh_dofs_list)
 
         def __getitem__(self, key):
             assert isinstance(key, slice)
@@ -840,14 +897,17 @@ def BasicReducedMesh(backend, wrapping):
 
         def get_reduced_mesh(self, index=None):
             index = self._get_dict_index(index)
+            self._materialize(index)
             return self.reduced_mesh[index]
 
         def get_reduced_function_spaces(self, index=None):
             index = self._get_dict_index(index)
+            self._materialize(index)
             return self.reduced_function_spaces[index]
 
         def get_reduced_subdomain_data(self, index=None):
             index = self._get_dict_index(index)
+            self._materialize(index)
             return self.reduced_subdomain_data[index]
 
         def get_dofs_list(self, index=None):
@@ -856,33 +916,33 @@ def BasicReducedMesh(backend, wrapping):
 
         def get_reduced_dofs_list(self, index=None):
             index = self._get_dict_index(index)
+            self._materialize(index)
             return self.reduced_mesh_reduced_dofs_list[index]
 
         def get_auxiliary_reduced_function_space(self, auxiliary_problem, component, index=None):
             index = self._get_dict_index(index)
+            self._materialize(index)
             return self._auxiliary_reduced_function_space[auxiliary_problem, component][index]
 
         def get_auxiliary_function_interpolator(self, auxiliary_problem, component, index=None):
             index = self._get_dict_index(index)
+            self._materialize(index)
             return self._auxiliary_function_interpolator[auxiliary_problem, component][index]
 
         def get_auxiliary_basis_functions_matrix(self, auxiliary_problem, component, index=None):
             index = self._get_dict_index(index)
+            self._materialize(index)
             return self._auxiliary_basis_functions_matrix[auxiliary_problem, component][index]
 
         def _get_dict_index(self, index):
             self._assert_dict_lengths()
             if index is None:
-                return max(self.reduced_mesh.keys())
+                return len(self.reduced_mesh_dofs_list) - 1
             else:
                 return index
 
         def _get_next_index(self):
-            N = len(self.reduced_mesh)
-            if N > 0:
-                assert min(self.reduced_mesh.keys()) == 0
-                assert max(self.reduced_mesh.keys()) == N - 1
-            return N
+            return len(self.reduced_mesh_dofs_list)
 
     return _BasicReducedMesh
 
@@ -4,9 +4,13 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from mpi4py.MPI import IN_PLACE, MAX, SUM
+from numpy import abs as numpy_abs, asarray, empty, zeros
+from scipy.linalg import solve, solve_triangular
 from dolfin import FunctionSpace
 from rbnics.backends.basic import SnapshotsMatrix as BasicSnapshotsMatrix
 from rbnics.backends.dolfin.functions_list import FunctionsList
+from rbnics.backends.dolfin.wrapping import to_petsc4py
 from rbnics.utils.decorators import BackendFor
 
 SnapshotsMatrix_Base = BasicSnapshotsMatrix(FunctionsList)
@@ -14,4 +18,89 @@ SnapshotsMatrix_Base = BasicSnapshotsMatrix(FunctionsList)
 
 @BackendFor("dolfin", inputs=(FunctionSpace, (str, None)))
 class SnapshotsMatrix(SnapshotsMatrix_Base):
-    pass
+    def __init__(self, space, component=None):
+        SnapshotsMatrix_Base.__init__(self, space, component)
+        self._array = None  # dense storage of the local dofs of all snapshots, with one row per snapshot
+        self._basis_array = None  # dense storage of the local dofs of basis functions, with one row per function
+        self._basis_functions = list()  # basis functions currently stored in the rows of _basis_array
+
+    def enrich(self, functions, component=None, weights=None, copy=True):
+        SnapshotsMatrix_Base.enrich(self, functions, component, weights, copy)
+        self._array = None
+
+    def clear(self):
+        SnapshotsMatrix_Base.clear(self)
+        self._array = None
+
+    def __setitem__(self, key, item):
+        SnapshotsMatrix_Base.__setitem__(self, key, item)
+        self._array = None
+
+    # Compute the maximum absolute value of the interpolation error of each snapshot (for EIM), given the
+    # first N basis functions, interpolation locations and the N x N block of the interpolation matrix
+    def compute_maximum_interpolation_errors(self, basis_functions, interpolation_locations=None,
+                                             interpolation_matrix=None, lower_triangular=False):
+        snapshots = self._get_array()
+        N = len(basis_functions)
+        if N > 0:
+            assert interpolation_locations is not None
+            assert interpolation_matrix is not None
+            basis = self._get_basis_array(basis_functions)
+            # Evaluate all snapshots at the interpolation locations, which are owned by one process each
+            (row_start, row_end) = to_petsc4py(self._list[0].vector()).getOwnershipRange()
+            rhs = zeros((N, len(self._list)))
+            for (n, dofs) in enumerate(interpolation_locations.get_dofs_list()):
+                assert len(dofs) == 1
+                if dofs[0] >= row_start and dofs[0] < row_end:
+                    rhs[n, :] = snapshots[:, dofs[0] - row_start]
+            self.mpi_comm.Allreduce(IN_PLACE, rhs, op=SUM)
+            # Solve the interpolation problems of all snapshots at once
+            lhs = asarray(interpolation_matrix)
+            if lower_triangular:
+                coefficients = solve_triangular(lhs, rhs, lower=True)
+            else:
+                coefficients = solve(lhs, rhs)
+            errors = snapshots - coefficients.T.dot(basis)
+        else:
+            errors = snapshots
+        if errors.shape[1] > 0:
+            maximum_errors = numpy_abs(errors).max(axis=1)
+        else:  # no dofs are owned by the current process
+            maximum_errors = zeros(errors.shape[0])
+        self.mpi_comm.Allreduce(IN_PLACE, maximum_errors, op=MAX)
+        return maximum_errors.tolist()
+
+    def _get_array(self):
+        if self._array is None:
+            self._array = _to_array(self._list)
+        return self._array
+
+    def _get_basis_array(self, basis_functions):
+        # Basis functions are only enriched by the greedy algorithm, and never changed in place: keep the rows of
+        # basis functions already stored, and only append rows for the new ones
+        basis_functions = list(basis_functions)
+        N = len(basis_functions)
+        n = 0
+        while n < min(len(self._basis_functions), N) and self._basis_functions[n] is basis_functions[n]:
+            n += 1
+        del self._basis_functions[n:]
+        if N > n:
+            if self._basis_array is None or self._basis_array.shape[0] < N:
+                # Allocate room for further basis functions, to avoid copying the stored rows at every enrichment
+                basis_array = empty((2 * N, to_petsc4py(basis_functions[0].vector()).getLocalSize()))
+                if n > 0:
+                    basis_array[:n, :] = self._basis_array[:n, :]
+                self._basis_array = basis_array
+            self._basis_array[n:N, :] = _to_array(basis_functions[n:])
+            self._basis_functions.extend(basis_functions[n:])
+        return self._basis_array[:N, :]
+
+
+def _to_array(functions):
+    functions = list(functions)
+    assert len(functions) > 0
+    first_vector = to_petsc4py(functions[0].vector())
+    array = empty((len(functions), first_vector.getLocalSize()))
+    for (n, function) in enumerate(functions):
+        array[n, :] = to_petsc4py(function.vector()).getArray(readonly=True)
+    return array
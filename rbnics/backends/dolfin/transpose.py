@@ -16,7 +16,8 @@ from rbnics.backends.dolfin.parametrized_tensor_factory import ParametrizedTenso
 from rbnics.backends.dolfin.tensors_list import TensorsList
 from rbnics.backends.dolfin.vector import Vector
 from rbnics.backends.dolfin.wrapping import (function_from_ufl_operators, function_to_vector, matrix_mul_vector,
-                                             vector_mul_vector, vectorized_matrix_inner_vectorized_matrix)
+                                             matrix_mul_vectors, matrix_transpose_mul_vectors, vector_mul_vector,
+                                             vectors_transpose_mul_vectors, vectorized_matrix_inner_vectorized_matrix)
 from rbnics.backends.online import OnlineMatrix, OnlineVector
 from rbnics.utils.decorators import backend_for, ModuleWrapper
 
@@ -32,8 +33,8 @@ def ConvertAdditionalFunctionTypes(arg):
 
 backend = ModuleWrapper(BasisFunctionsMatrix, evaluate, Function, FunctionsList, Matrix, NonAffineExpansionStorage,
                         ParametrizedTensorFactory, TensorsList, Vector)
-wrapping = ModuleWrapper(function_to_vector, matrix_mul_vector, vector_mul_vector,
-                         vectorized_matrix_inner_vectorized_matrix)
+wrapping = ModuleWrapper(function_to_vector, matrix_mul_vector, matrix_mul_vectors, matrix_transpose_mul_vectors,
+                         vector_mul_vector, vectors_transpose_mul_vectors, vectorized_matrix_inner_vectorized_matrix)
 online_backend = ModuleWrapper(OnlineMatrix=OnlineMatrix, OnlineVector=OnlineVector)
 online_wrapping = ModuleWrapper()
 transpose_base = basic_transpose(backend, wrapping, online_backend, online_wrapping,
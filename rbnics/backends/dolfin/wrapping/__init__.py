@@ -72,7 +72,8 @@ from rbnics.backends.dolfin.wrapping.is_problem_solution import is_problem_solut
 from rbnics.backends.dolfin.wrapping.is_problem_solution_dot import is_problem_solution_dot
 from rbnics.backends.dolfin.wrapping.is_problem_solution_type import is_problem_solution_type
 from rbnics.backends.dolfin.wrapping.is_time_dependent import is_time_dependent
-from rbnics.backends.dolfin.wrapping.matrix_mul import matrix_mul_vector, vectorized_matrix_inner_vectorized_matrix
+from rbnics.backends.dolfin.wrapping.matrix_mul import (
+    matrix_mul_vector, matrix_mul_vectors, matrix_transpose_mul_vectors, vectorized_matrix_inner_vectorized_matrix)
 from rbnics.backends.dolfin.wrapping.parametrized_constant import (
     is_parametrized_constant, ParametrizedConstant, parametrized_constant_to_float)
 from rbnics.backends.dolfin.wrapping.parametrized_expression import ParametrizedExpression
@@ -87,7 +88,7 @@ from rbnics.backends.dolfin.wrapping.solution_identify_component import solution
 from rbnics.backends.dolfin.wrapping.solution_iterator import solution_iterator
 from rbnics.backends.dolfin.wrapping.tensor_copy import tensor_copy
 from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
-from rbnics.backends.dolfin.wrapping.vector_mul import vector_mul_vector
+from rbnics.backends.dolfin.wrapping.vector_mul import vector_mul_vector, vectors_transpose_mul_vectors
 
 __all__ = [
     "assemble",
@@ -157,6 +158,8 @@ __all__ = [
     "is_time_dependent",
     "map_functionspaces_between_mesh_and_submesh",
     "matrix_mul_vector",
+    "matrix_mul_vectors",
+    "matrix_transpose_mul_vectors",
     "ParametrizedConstant",
     "parametrized_constant_to_float",
     "ParametrizedExpression",
@@ -171,6 +174,7 @@ __all__ = [
     "tensor_copy",
     "to_petsc4py",
     "vector_mul_vector",
+    "vectors_transpose_mul_vectors",
     "vectorized_matrix_inner_vectorized_matrix"
 ]
 
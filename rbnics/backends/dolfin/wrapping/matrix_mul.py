@@ -4,13 +4,133 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from dolfin import compile_cpp_code
+from weakref import ref
+from numpy import empty
+from petsc4py import PETSc
+from pylru import lrucache
+from dolfin import compile_cpp_code, PETScVector
+from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
+from rbnics.utils.cache import ProjectionsCache
 
 
 def matrix_mul_vector(matrix, vector):
     return matrix * vector
 
 
+def matrix_mul_vectors(matrix, vectors):
+    """
+    Compute the product of a matrix with several vectors at once, storing the vectors as columns of a dense matrix
+    so that PETSc can carry out a (sparse times dense) matrix-matrix product rather than several matrix-vector ones.
+    """
+    if len(vectors) == 0:
+        return list()
+    elif len(vectors) == 1:
+        return [matrix_mul_vector(matrix, vectors[0])]
+    matrix = to_petsc4py(matrix)
+    vectors_as_dense_matrix = _get_dense_vectors(vectors)
+    matrix_times_vectors = matrix.matMult(vectors_as_dense_matrix)
+    (_, left_vector) = matrix.createVecs()  # with the same layout as the rows of the matrix
+    output = _dense_matrix_to_vectors(matrix_times_vectors, left_vector)
+    vectors_as_dense_matrix.destroy()
+    matrix_times_vectors.destroy()
+    return output
+
+
+def matrix_transpose_mul_vectors(matrix, vectors):
+    """
+    Compute the product of the transpose of a matrix with several vectors at once, storing the vectors as columns
+    of a dense matrix so that PETSc can carry out a single (transpose sparse times dense) matrix-matrix product.
+    """
+    if len(vectors) == 0:
+        return list()
+    matrix = to_petsc4py(matrix)
+    if len(vectors) == 1:
+        (output, _) = matrix.createVecs()  # right vector, i.e. with the same layout as the columns of the matrix
+        matrix.multTranspose(to_petsc4py(vectors[0]), output)
+        return [PETScVector(output)]
+    vectors_as_dense_matrix = _get_dense_vectors(vectors)
+    matrix_transpose_times_vectors = matrix.transposeMatMult(vectors_as_dense_matrix)
+    (right_vector, _) = matrix.createVecs()  # with the same layout as the columns of the matrix
+    output = _dense_matrix_to_vectors(matrix_transpose_times_vectors, right_vector)
+    vectors_as_dense_matrix.destroy()
+    matrix_transpose_times_vectors.destroy()
+    return output
+
+
+def _dense_matrix_to_vectors(dense_matrix, template_vector):
+    dense_array = dense_matrix.getDenseArray()
+    output = list()
+    for j in range(dense_array.shape[1]):
+        output_j = template_vector.duplicate()
+        output_j.setArray(dense_array[:, j])
+        output.append(PETScVector(output_j))
+    return output
+
+
+class _DenseVectors(object):
+    """
+    Local parts of a list of vectors, stored as the columns of a column major array with room for further vectors.
+    Lists are usually extended by appending new vectors (e.g. basis functions during the offline phase), and in
+    such case only the new vectors are copied, as in SnapshotsMatrix._get_basis_array.
+    """
+
+    def __init__(self, projections_cache):
+        self._projections_cache_ref = ref(projections_cache)
+        self._vectors = list()
+        self._array = None
+
+    def is_valid(self):
+        return self._projections_cache_ref() is ProjectionsCache.current()
+
+    def get_array(self, vectors):
+        N = len(vectors)
+        n = 0
+        while n < min(len(self._vectors), N) and self._vectors[n] is vectors[n]:
+            n += 1
+        del self._vectors[n:]
+        if N > n:
+            if self._array is None or self._array.shape[1] < N:
+                # Allocate room for further vectors, to avoid copying the stored columns at every extension
+                array = empty((to_petsc4py(vectors[0]).getLocalSize(), 2 * N), order="F")
+                if n > 0:
+                    array[:, :n] = self._array[:, :n]
+                self._array = array
+            _copy_local_arrays(vectors[n:], self._array[:, n:N])
+            self._vectors.extend(vectors[n:])
+        return self._array[:, :N]  # contiguous, since the array is column major
+
+
+def _copy_local_arrays(vectors, array):
+    for (j, vector) in enumerate(vectors):
+        array[:, j] = to_petsc4py(vector).getArray(readonly=True)
+
+
+def _get_dense_vectors(vectors):
+    """
+    Return a dense matrix with vectors as columns. Vectors must not be modified in place while a projections
+    cache is in use: in such case, their local parts are stored and later dense matrices are built on top of
+    them, copying only the vectors which were not stored yet.
+    """
+    first_vector = to_petsc4py(vectors[0])
+    projections_cache = ProjectionsCache.current()
+    if projections_cache is not None:
+        dense_vectors = _dense_vectors.get(id(vectors[0]))
+        if dense_vectors is None or not dense_vectors.is_valid():
+            dense_vectors = _DenseVectors(projections_cache)
+            _dense_vectors[id(vectors[0])] = dense_vectors
+        array = dense_vectors.get_array(vectors)
+    else:
+        array = empty((first_vector.getLocalSize(), len(vectors)), order="F")
+        _copy_local_arrays(vectors, array)
+    # The dense matrix shares the storage of the array
+    return PETSc.Mat().createDense(
+        (first_vector.getSizes(), (PETSc.DECIDE, len(vectors))), array=array, comm=first_vector.getComm())
+
+
+# Storage of the local parts of the most recently used lists of vectors, from the id of their first vector
+_dense_vectors = lrucache(4)
+
+
 cpp_code = """
     #include <pybind11/pybind11.h>
     #include <dolfin/la/LinearAlgebraObject.h>
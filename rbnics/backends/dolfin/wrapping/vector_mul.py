@@ -4,6 +4,37 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from mpi4py.MPI import SUM
+from numpy import column_stack, zeros
+from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
+
 
 def vector_mul_vector(vector1, vector2):
     return vector1.inner(vector2)
+
+
+def vectors_transpose_mul_vectors(vectors1, vectors2):
+    """
+    Compute all inner products between two lists of vectors at once, followed by a single reduction among processors.
+    Only the local part of the shorter list is copied into a dense matrix, while the local part of each vector of
+    the longer list (e.g. the basis functions, when a projection is extended with a few new functions) is accessed
+    without copies and multiplied by such dense matrix.
+    """
+    output = zeros((len(vectors1), len(vectors2)))
+    if len(vectors1) == 0 or len(vectors2) == 0:
+        return output
+    output_local = zeros(output.shape)
+    if len(vectors1) >= len(vectors2):
+        vectors2_local = column_stack([_get_local_array(vector) for vector in vectors2])
+        for (i, vector1) in enumerate(vectors1):
+            output_local[i, :] = _get_local_array(vector1).dot(vectors2_local)
+    else:
+        vectors1_local = column_stack([_get_local_array(vector) for vector in vectors1])
+        for (j, vector2) in enumerate(vectors2):
+            output_local[:, j] = vectors1_local.T.dot(_get_local_array(vector2))
+    vectors1[0].mpi_comm().Allreduce(output_local, output, op=SUM)
+    return output
+
+
+def _get_local_array(vector):
+    return to_petsc4py(vector).getArray(readonly=True)
@@ -8,6 +8,8 @@ from rbnics.backends.online.numpy.abs import abs
 from rbnics.backends.online.numpy.affine_expansion_storage import AffineExpansionStorage
 from rbnics.backends.online.numpy.assign import assign
 from rbnics.backends.online.numpy.basis_functions_matrix import BasisFunctionsMatrix
+from rbnics.backends.online.numpy.batched_linear_solver import BatchedLinearSolver
+from rbnics.backends.online.numpy.batched_product import batched_product
 from rbnics.backends.online.numpy.copy import copy
 from rbnics.backends.online.numpy.eigen_solver import EigenSolver
 from rbnics.backends.online.numpy.evaluate import evaluate
@@ -40,6 +42,8 @@ __all__ = [
     "AffineExpansionStorage",
     "assign",
     "BasisFunctionsMatrix",
+    "BatchedLinearSolver",
+    "batched_product",
     "copy",
     "EigenSolver",
     "evaluate",
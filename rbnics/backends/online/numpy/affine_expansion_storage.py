@@ -4,13 +4,18 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from copy import copy
+from numbers import Number
+from numpy import memmap, nditer as AffineExpansionStorageContent_Iterator, stack
 from rbnics.backends.online.basic import AffineExpansionStorage as BasicAffineExpansionStorage
+from rbnics.backends.online.basic.wrapping import slice_to_array
 from rbnics.backends.online.numpy.copy import function_copy, tensor_copy
 from rbnics.backends.online.numpy.function import Function
 from rbnics.backends.online.numpy.matrix import Matrix
 from rbnics.backends.online.numpy.vector import Vector
 from rbnics.backends.online.numpy.wrapping import function_load, function_save, tensor_load, tensor_save
-from rbnics.utils.decorators import BackendFor, ModuleWrapper, tuple_of
+from rbnics.utils.decorators import BackendFor, ModuleWrapper, overload, tuple_of
+from rbnics.utils.io import Folders, NumpyIO as ContentIO
 
 backend = ModuleWrapper(Function, Matrix, Vector)
 wrapping = ModuleWrapper(function_load, function_save, tensor_load, tensor_save, function_copy=function_copy,
@@ -21,4 +26,111 @@ AffineExpansionStorage_Base = BasicAffineExpansionStorage(backend, wrapping)
 @BackendFor("numpy", inputs=((int, tuple_of(Matrix.Type()), tuple_of(Vector.Type())), (int, None)))
 class AffineExpansionStorage(AffineExpansionStorage_Base):
     def __init__(self, arg1, arg2=None):
+        # Contiguous copy of the content, stored as a (Q, M, N), (Q, N) or (Q, ) array (or (Q0, Q1, ...)
+        # for storage of order 2). It is computed on demand by product(), and reset when content changes.
+        self._content_as_array = None
         AffineExpansionStorage_Base.__init__(self, arg1, arg2)
+
+    @overload(Matrix.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
+    def _save_content(self, item, it, full_directory):
+        self._save_content_as_array(full_directory)
+
+    @overload(Vector.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
+    def _save_content(self, item, it, full_directory):
+        self._save_content_as_array(full_directory)
+
+    def _save_content_as_array(self, full_directory):
+        # Store all matrices (or vectors) in a single file, so that it can be memory mapped when loading
+        ContentIO.save_file(self._get_content_as_array(), full_directory, "content")
+
+    def load(self, directory, filename):
+        loaded = AffineExpansionStorage_Base.load(self, directory, filename)
+        if loaded and not isinstance(self._content_as_array, memmap):
+            self._content_as_array = None
+        return loaded
+
+    @overload(Matrix.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
+    def _load_content(self, item, it, full_directory):
+        if ContentIO.exists_file(full_directory, "content"):
+            self._load_content_as_array(item, it, full_directory)
+        else:
+            AffineExpansionStorage_Base._load_content(self, item, it, full_directory)
+
+    @overload(Vector.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
+    def _load_content(self, item, it, full_directory):
+        if ContentIO.exists_file(full_directory, "content"):
+            self._load_content_as_array(item, it, full_directory)
+        else:
+            AffineExpansionStorage_Base._load_content(self, item, it, full_directory)
+
+    def _load_content_as_array(self, item, it, full_directory):
+        # Memory map the file in read only mode, so that loading is almost instantaneous and pages are
+        # shared among all processes loading the same reduced operators. Each matrix (or vector) is a view.
+        content_as_array = ContentIO.load_file(full_directory, "content", mmap_mode="r")
+        assert content_as_array.shape == self._content.shape + item.content.shape
+        while not it.finished:
+            self._content[it.multi_index] = copy(item)
+            self._content[it.multi_index].content = content_as_array[it.multi_index]
+            it.iternext()
+        self._content_as_array = content_as_array
+
+    @overload((slice, tuple_of(slice)), )
+    def __getitem__(self, key):
+        if isinstance(self._content_as_array, memmap):
+            # Slice the memory mapped content without copying it, if the slice is contiguous
+            it = AffineExpansionStorageContent_Iterator(
+                self._content, flags=["multi_index", "refs_ok"], op_flags=["readonly"])
+            item = self._content[it.multi_index]
+            slices = slice_to_array(item, key, self._component_name_to_basis_component_length,
+                                    self._component_name_to_basis_component_index)
+            if slices not in self._precomputed_slices:
+                if isinstance(item, Vector.Type()):
+                    contiguous_slices = _contiguous_slices((slices, ))
+                else:
+                    contiguous_slices = _contiguous_slices(slices)
+                if contiguous_slices is not None:
+                    sliced_item = item[key]  # only used to get sizes and attributes related to basis functions
+                    output = AffineExpansionStorage.__new__(type(self), *self._content.shape)
+                    output.__init__(*self._content.shape)
+                    while not it.finished:
+                        output[it.multi_index] = copy(sliced_item)
+                        output[it.multi_index].content = self._content_as_array[it.multi_index + contiguous_slices]
+                        it.iternext()
+                    output._content_as_array = self._content_as_array[
+                        (slice(None), ) * self.order() + contiguous_slices]
+                    self._precomputed_slices[slices] = output
+        return AffineExpansionStorage_Base.__getitem__(self, key)
+
+    def __setitem__(self, key, item):
+        AffineExpansionStorage_Base.__setitem__(self, key, item)
+        self._content_as_array = None
+
+    def _get_content_as_array(self):
+        """
+        Return the content as a single contiguous array, with the affine expansion indices as leading dimensions.
+        None is returned if the content cannot be stacked (e.g. in case of functions or basis functions matrices).
+        """
+        if self._content_as_array is None:
+            if self._content.size == 0:
+                return None
+            first_item = self._content[self._smallest_key]
+            if isinstance(first_item, (Matrix.Type(), Vector.Type())):
+                content_as_array = stack([item.content for item in self._content.flat])
+                self._content_as_array = content_as_array.reshape(self._content.shape + first_item.content.shape)
+            elif isinstance(first_item, Number):
+                self._content_as_array = self._content.astype(float)
+            else:
+                return None
+        return self._content_as_array
+
+
+def _contiguous_slices(slices):
+    contiguous_slices = list()
+    for indices in slices:
+        if len(indices) == 0:
+            contiguous_slices.append(slice(0, 0))
+        elif tuple(indices) == tuple(range(indices[0], indices[0] + len(indices))):
+            contiguous_slices.append(slice(indices[0], indices[0] + len(indices)))
+        else:
+            return None
+    return tuple(contiguous_slices)
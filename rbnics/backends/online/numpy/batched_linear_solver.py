@@ -0,0 +1,69 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import newaxis, stack
+from numpy.linalg import solve
+from rbnics.backends.abstract import BatchedLinearSolver as AbstractBatchedLinearSolver
+from rbnics.backends.online.basic.wrapping import preserve_solution_attributes
+from rbnics.backends.online.numpy.function import Function
+from rbnics.backends.online.numpy.linear_solver import factorized_solve, LinearSolver, process_parameters
+from rbnics.backends.online.numpy.matrix import Matrix
+from rbnics.backends.online.numpy.transpose import DelayedTransposeWithArithmetic
+from rbnics.backends.online.numpy.vector import Vector
+from rbnics.utils.decorators import BackendFor, DictOfThetaType, list_of, ThetaType
+
+
+@BackendFor("numpy", inputs=(list_of((Matrix.Type(), DelayedTransposeWithArithmetic)),
+                             list_of(Function.Type()),
+                             list_of((Vector.Type(), DelayedTransposeWithArithmetic)),
+                             (list_of(ThetaType + DictOfThetaType), None)))
+class BatchedLinearSolver(AbstractBatchedLinearSolver):
+    parameters = process_parameters(dict())
+
+    def __init__(self, lhs, solutions, rhs, bcs=None):
+        assert len(lhs) == len(solutions)
+        assert len(rhs) == len(solutions)
+        if bcs is None:
+            bcs = [None] * len(solutions)
+        else:
+            assert len(bcs) == len(solutions)
+        self.solutions = solutions
+        # Stack operators directly, relying on the single system solver only to apply boundary conditions
+        self._all_lhs = list()
+        all_rhs = list()
+        for (lhs_i, solution_i, rhs_i, bcs_i) in zip(lhs, solutions, rhs, bcs):
+            if bcs_i is not None:
+                solver_i = LinearSolver(lhs_i, solution_i, rhs_i, bcs_i)
+                (lhs_i, rhs_i) = (solver_i.lhs, solver_i.rhs)
+            else:
+                if isinstance(lhs_i, DelayedTransposeWithArithmetic):
+                    lhs_i = lhs_i.evaluate()
+                if isinstance(rhs_i, DelayedTransposeWithArithmetic):
+                    rhs_i = rhs_i.evaluate()
+                preserve_solution_attributes(lhs_i, solution_i, rhs_i)
+            self._all_lhs.append(lhs_i)
+            all_rhs.append(rhs_i.content)
+        if len(solutions) > 0:
+            self.lhs = stack([lhs_i.content for lhs_i in self._all_lhs])
+            self.rhs = stack(all_rhs)
+        else:
+            self.lhs = None
+            self.rhs = None
+
+    def set_parameters(self, parameters):
+        self.parameters = process_parameters(parameters)
+
+    def solve(self):
+        if len(self.solutions) == 0:
+            return
+        if self.parameters["reuse_factorization"] or self.parameters["factorization"] == "lower triangular":
+            all_solutions = [factorized_solve(lhs_i, rhs_i, self.parameters["factorization"])
+                             for (lhs_i, rhs_i) in zip(self._all_lhs, self.rhs)]
+        else:
+            # Trailing axis makes sure that rhs is interpreted as a stack of vectors rather than of matrices
+            all_solutions = solve(self.lhs, self.rhs[..., newaxis])[..., 0]
+        for (solution, solution_content) in zip(self.solutions, all_solutions):
+            solution.vector()[:] = solution_content
@@ -0,0 +1,88 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numbers import Number
+from numpy import asarray, einsum, stack, tensordot
+from rbnics.backends.online.numpy.affine_expansion_storage import AffineExpansionStorage
+from rbnics.backends.online.numpy.function import Function
+from rbnics.backends.online.numpy.matrix import Matrix
+from rbnics.backends.online.numpy.product import product
+from rbnics.backends.online.numpy.sum import sum
+from rbnics.backends.online.numpy.vector import Vector
+from rbnics.utils.decorators import backend_for, list_of, ThetaType
+
+
+# batched_product function to evaluate affine expansions for several parameters at once. For affine expansions
+# of order 1 the result is returned as a list, with one matrix (or vector) for each set of thetas, while for
+# affine expansions of order 2 the result is returned as a vector, with one entry for each set of thetas.
+@backend_for("numpy", inputs=(list_of(ThetaType), AffineExpansionStorage, (list_of(ThetaType), None),
+                              (list_of(Function.Type()), None), (list_of(Function.Type()), None)))
+def batched_product(thetas, operators, thetas2=None, functions=None, functions2=None):
+    if operators.order() == 1:
+        assert thetas2 is None
+        assert functions is None
+        assert functions2 is None
+        return _batched_product_order_1(thetas, operators)
+    assert operators.order() == 2
+    assert thetas2 is not None
+    assert len(thetas) == len(thetas2)
+    if len(thetas) == 0:
+        return Vector(0)
+    content_as_array = operators._get_content_as_array()
+    assert content_as_array is not None
+    thetas = asarray(thetas, dtype=float)
+    thetas2 = asarray(thetas2, dtype=float)
+    content_as_array = content_as_array[:thetas.shape[1], :thetas2.shape[1]]
+    if content_as_array.ndim == 2:  # storage of numbers, e.g. (f, f) error estimation operator
+        assert functions is None
+        assert functions2 is None
+        output_content = einsum("ki,ij,kj->k", thetas, content_as_array, thetas2, optimize=True)
+    elif content_as_array.ndim == 3:  # storage of vectors, e.g. (a, f) error estimation operator
+        assert functions is not None
+        assert functions2 is None
+        assert len(functions) == thetas.shape[0]
+        functions = stack([function.vector().content for function in functions])
+        output_content = einsum("ki,ijn,kj,kn->k", thetas, content_as_array, thetas2, functions, optimize=True)
+    elif content_as_array.ndim == 4:  # storage of matrices, e.g. (a, a) error estimation operator
+        assert functions is not None
+        assert functions2 is not None
+        assert len(functions) == thetas.shape[0]
+        assert len(functions2) == thetas.shape[0]
+        functions = stack([function.vector().content for function in functions])
+        functions2 = stack([function2.vector().content for function2 in functions2])
+        output_content = einsum("ki,ijmn,kj,km,kn->k", thetas, content_as_array, thetas2, functions, functions2,
+                                optimize=True)
+    else:
+        raise ValueError("batched_product(): invalid operands.")
+    return Vector.Type()(len(output_content), output_content)
+
+
+def _batched_product_order_1(thetas, operators):
+    if len(thetas) == 0:
+        return list()
+    content_as_array = operators._get_content_as_array()
+    if content_as_array is None:
+        return [sum(product(thetas_k, operators)) for thetas_k in thetas]
+    # Contract the first dimension of the (Q, M, N), (Q, N) or (Q, ) array with the (K, Q) array of thetas
+    # in a single call
+    thetas = asarray(thetas, dtype=float)
+    assert thetas.shape[1] == len(operators)
+    output_content = tensordot(thetas, content_as_array, axes=1)
+    # Wrap each output in the same type of the stored operators
+    first_operator = operators[0]
+    output = list()
+    for output_content_k in output_content:
+        if isinstance(first_operator, Matrix.Type()):
+            output_k = Matrix.Type()(first_operator.M, first_operator.N, output_content_k)
+            first_operator._arithmetic_operations_preserve_attributes(output_k, other_order=0)
+        elif isinstance(first_operator, Vector.Type()):
+            output_k = Vector.Type()(first_operator.N, output_content_k)
+            first_operator._arithmetic_operations_preserve_attributes(output_k, other_order=0)
+        else:
+            assert isinstance(first_operator, Number)
+            output_k = float(output_content_k)
+        output.append(output_k)
+    return output
@@ -9,6 +9,7 @@ from rbnics.backends.abstract import (
     HighOrderProperOrthogonalDecomposition as AbstractHighOrderProperOrthogonalDecomposition)
 from rbnics.backends.basic import ProperOrthogonalDecompositionBase as BasicHighOrderProperOrthogonalDecomposition
 from rbnics.backends.online.numpy.eigen_solver import EigenSolver
+from rbnics.backends.online.numpy.function import Function
 from rbnics.backends.online.numpy.tensor_snapshots_list import TensorSnapshotsList
 from rbnics.backends.online.numpy.tensor_basis_list import TensorBasisList
 from rbnics.backends.online.numpy.transpose import transpose
@@ -17,7 +18,7 @@ from rbnics.utils.decorators import BackendFor, ModuleWrapper
 
 backend = ModuleWrapper(transpose)
 wrapping = ModuleWrapper(get_mpi_comm)
-online_backend = ModuleWrapper(OnlineEigenSolver=EigenSolver)
+online_backend = ModuleWrapper(OnlineEigenSolver=EigenSolver, OnlineFunction=Function)
 online_wrapping = ModuleWrapper()
 HighOrderProperOrthogonalDecomposition_Base = BasicHighOrderProperOrthogonalDecomposition(
     backend, wrapping, online_backend, online_wrapping, AbstractHighOrderProperOrthogonalDecomposition,
@@ -5,6 +5,8 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from numpy.linalg import solve
+from pylru import lrucache
+from scipy.linalg import cho_factor, cho_solve, LinAlgError, lu_factor, lu_solve, solve_triangular
 from rbnics.backends.abstract import LinearProblemWrapper
 from rbnics.backends.online.basic import LinearSolver as BasicLinearSolver
 from rbnics.backends.online.numpy.function import Function
@@ -18,16 +20,81 @@ wrapping = ModuleWrapper(DelayedTransposeWithArithmetic=DelayedTransposeWithArit
 LinearSolver_Base = BasicLinearSolver(backend, wrapping)
 
 
+def process_parameters(parameters):
+    """
+    Validate parameters of the numpy linear solvers. The only supported parameters are:
+    - reuse_factorization: if True, the factorization of the left-hand side is stored and reused by any later
+      solve with the same left-hand side (e.g. in case of parameter independent matrices), default False;
+    - factorization: either "lu" (default), "cholesky" (only for symmetric positive definite matrices) or
+      "lower triangular" (only for lower triangular matrices, which are solved by forward substitution without
+      any factorization).
+    """
+    for key in parameters:
+        assert key in ("factorization", "reuse_factorization"), (
+            "NumPy linear solver does not accept parameter " + str(key))
+    factorization = parameters.get("factorization", "lu")
+    assert factorization in ("cholesky", "lower triangular", "lu"), (
+        "NumPy linear solver only supports lu, cholesky or lower triangular factorizations")
+    return {
+        "factorization": factorization,
+        "reuse_factorization": parameters.get("reuse_factorization", False)
+    }
+
+
+def factorized_solve(lhs, rhs, factorization):
+    """
+    Solve the linear system with a factorization of the matrix lhs, which is computed only the first time that
+    such lhs is provided. If lhs was sliced from another matrix (e.g. a parameter independent reduced operator,
+    restricted to the current reduced space dimension), factorizations are stored in that matrix and looked up
+    by the slice and by the entries set after slicing (e.g. by boundary conditions). Otherwise, they are stored
+    in lhs itself. Matrices discard their factorizations when changed in place.
+    """
+    if factorization == "lower triangular":  # nothing to be factorized
+        return solve_triangular(lhs.content, rhs, lower=True)
+    if lhs._factorization_source is not None:
+        (storage, key) = lhs._factorization_source
+    else:
+        (storage, key) = (lhs, ())
+    if storage._factorizations is None:
+        storage._factorizations = lrucache(_max_factorizations_per_matrix)
+    key = (factorization, key)
+    try:
+        (factorization, factors) = storage._factorizations[key]
+    except KeyError:
+        if factorization == "cholesky":
+            try:
+                factors = cho_factor(lhs.content)
+            except LinAlgError:  # matrix is not positive definite, fall back to LU
+                factorization = "lu"
+                factors = lu_factor(lhs.content)
+        else:
+            factors = lu_factor(lhs.content)
+        storage._factorizations[key] = (factorization, factors)
+    if factorization == "cholesky":
+        return cho_solve(factors, rhs)
+    else:
+        return lu_solve(factors, rhs)
+
+
+# Maximum number of factorizations stored in each matrix, e.g. for different reduced space dimensions
+_max_factorizations_per_matrix = 8
+
+
 @BackendFor("numpy", inputs=((Matrix.Type(), DelayedTransposeWithArithmetic, LinearProblemWrapper),
                              Function.Type(),
                              (Vector.Type(), DelayedTransposeWithArithmetic, None),
                              ThetaType + DictOfThetaType + (None,)))
 class LinearSolver(LinearSolver_Base):
+    parameters = process_parameters(dict())
+
     def set_parameters(self, parameters):
-        assert len(parameters) == 0, "NumPy linear solver does not accept parameters yet"
+        self.parameters = process_parameters(parameters)
 
     def solve(self):
-        solution = solve(self.lhs, self.rhs)
+        if self.parameters["reuse_factorization"] or self.parameters["factorization"] == "lower triangular":
+            solution = factorized_solve(self.lhs, self.rhs.content, self.parameters["factorization"])
+        else:
+            solution = solve(self.lhs, self.rhs)
         self.solution.vector()[:] = solution
         if self.monitor is not None:
             self.monitor(self.solution)
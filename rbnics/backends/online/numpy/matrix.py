@@ -4,6 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numbers import Number
 from numpy import zeros
 from rbnics.backends.online.basic import Matrix as BasicMatrix
 from rbnics.backends.online.numpy.function import Function
@@ -22,11 +23,47 @@ _Matrix_Type_Base = BasicMatrix(backend, wrapping, MatrixBaseType)
 
 
 class _Matrix_Type(_Matrix_Type_Base):
+    # Factorizations of this matrix, or of matrices sliced from it, stored by the linear solver
+    _factorizations = None
+    # Matrix this one was sliced from, and a key identifying the slice and any later change of its entries
+    _factorization_source = None
+
     def __getitem__(self, key):
         if all([isinstance(key_i, int) for key_i in key]):
             return float(_Matrix_Type_Base.__getitem__(self, key))  # convert from numpy numbers wrappers
         else:
-            return _Matrix_Type_Base.__getitem__(self, key)
+            output = _Matrix_Type_Base.__getitem__(self, key)
+            output._factorization_source = (self, _hashable_key(key))
+            return output
+
+    def __setitem__(self, key, value):
+        _Matrix_Type_Base.__setitem__(self, key, value)
+        # Setting entries to a number (e.g. when applying boundary conditions) is recorded in the key of the slice,
+        # while any other change prevents this matrix from sharing the factorizations of the one it was sliced from
+        if self._factorizations is not None:
+            self._factorizations = None
+        if self._factorization_source is not None:
+            if isinstance(value, Number):
+                (source, source_key) = self._factorization_source
+                self._factorization_source = (source, source_key + ((_hashable_key(key), value), ))
+            else:
+                self._factorization_source = None
+
+    def _discard_factorizations(self):
+        self._factorizations = None
+        self._factorization_source = None
+
+    def __iadd__(self, other):
+        self._discard_factorizations()
+        return _Matrix_Type_Base.__iadd__(self, other)
+
+    def __isub__(self, other):
+        self._discard_factorizations()
+        return _Matrix_Type_Base.__isub__(self, other)
+
+    def __itruediv__(self, other):
+        self._discard_factorizations()
+        return _Matrix_Type_Base.__itruediv__(self, other)
 
     def __mul__(self, other):
         if isinstance(other, Vector.Type()):
@@ -41,6 +78,7 @@ class _Matrix_Type(_Matrix_Type_Base):
             return _Matrix_Type_Base.__mul__(self, other)
 
     def __imul__(self, other):
+        self._discard_factorizations()
         if isinstance(other, Vector.Type()):
             # copied from BasicMatrix because ndarray uses __matul__ instead of __mul__ for matrix-vector product
             self._arithmetic_operations_assert_attributes(other, other_order=1)
@@ -53,6 +91,19 @@ class _Matrix_Type(_Matrix_Type_Base):
         return self.content.__array__(dtype)
 
 
+def _hashable_key(key):
+    if isinstance(key, tuple):
+        return tuple(_hashable_key(key_i) for key_i in key)
+    elif isinstance(key, slice):
+        return (_hashable_key(key.start), _hashable_key(key.stop), _hashable_key(key.step))
+    elif isinstance(key, dict):
+        return tuple(key.items())
+    elif isinstance(key, list):
+        return tuple(key)
+    else:
+        return key
+
+
 @backend_for("numpy", inputs=(OnlineSizeType, OnlineSizeType))
 def Matrix(M, N):
     return _Matrix_Type(M, N)
@@ -4,6 +4,8 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numbers import Number
+from numpy import asarray, einsum, tensordot
 from rbnics.backends.online.basic import product as basic_product
 from rbnics.backends.online.numpy.affine_expansion_storage import AffineExpansionStorage
 from rbnics.backends.online.numpy.function import Function
@@ -11,7 +13,7 @@ from rbnics.backends.online.numpy.matrix import Matrix
 from rbnics.backends.online.numpy.non_affine_expansion_storage import NonAffineExpansionStorage
 from rbnics.backends.online.numpy.transpose import DelayedTransposeWithArithmetic
 from rbnics.backends.online.numpy.vector import Vector
-from rbnics.utils.decorators import backend_for, ModuleWrapper, ThetaType
+from rbnics.utils.decorators import backend_for, ModuleWrapper, overload, ThetaType
 
 backend = ModuleWrapper(AffineExpansionStorage, Function, Matrix, NonAffineExpansionStorage, Vector)
 wrapping = ModuleWrapper(DelayedTransposeWithArithmetic=DelayedTransposeWithArithmetic)
@@ -22,4 +24,46 @@ wrapping = ModuleWrapper(DelayedTransposeWithArithmetic=DelayedTransposeWithArit
 # even though this one actually carries out both the sum and the product!
 @backend_for("numpy", inputs=(ThetaType, (AffineExpansionStorage, NonAffineExpansionStorage), ThetaType + (None,)))
 def product(thetas, operators, thetas2=None):
+    return _product(thetas, operators, thetas2)
+
+
+@overload
+def _product(thetas: ThetaType, operators: AffineExpansionStorage, thetas2: ThetaType + (None, )):
+    content_as_array = operators._get_content_as_array()
+    if content_as_array is None:
+        return product_base(thetas, operators, thetas2)
+    order = operators.order()
+    assert order in (1, 2)
+    if order == 1:
+        # vector storage of affine expansion online data structures (e.g. reduced matrix/vector expansions):
+        # contract the first dimension of the (Q, M, N), (Q, N) or (Q, ) array in a single call
+        assert thetas2 is None
+        assert len(thetas) == len(operators)
+        output_content = tensordot(asarray(thetas, dtype=float), content_as_array, axes=1)
+        first_operator = operators[0]
+    elif order == 2:
+        # matrix storage of affine expansion online data structures (e.g. error estimation ff/af/aa products):
+        # contract the first two dimensions of the (Q0, Q1, ...) array in a single call
+        assert thetas2 is not None
+        output_content = einsum("i,ij...,j->...", asarray(thetas, dtype=float),
+                                content_as_array[:len(thetas), :len(thetas2)], asarray(thetas2, dtype=float))
+        first_operator = operators[0, 0]
+    else:
+        raise ValueError("product(): invalid operands.")
+    # Wrap the output in the same type of the stored operators
+    if isinstance(first_operator, Matrix.Type()):
+        output = Matrix.Type()(first_operator.M, first_operator.N, output_content)
+        first_operator._arithmetic_operations_preserve_attributes(output, other_order=0)
+    elif isinstance(first_operator, Vector.Type()):
+        output = Vector.Type()(first_operator.N, output_content)
+        first_operator._arithmetic_operations_preserve_attributes(output, other_order=0)
+    else:
+        assert isinstance(first_operator, Number)
+        output = float(output_content)
+    # Return
+    return ProductOutput(output)
+
+
+@overload
+def _product(thetas: ThetaType, operators: NonAffineExpansionStorage, thetas2: ThetaType + (None, )):
     return product_base(thetas, operators, thetas2)
@@ -8,6 +8,7 @@ from rbnics.backends.abstract import FunctionsList as AbstractFunctionsList
 from rbnics.backends.abstract import ProperOrthogonalDecomposition as AbstractProperOrthogonalDecomposition
 from rbnics.backends.basic import ProperOrthogonalDecompositionBase as BasicProperOrthogonalDecomposition
 from rbnics.backends.online.numpy.eigen_solver import EigenSolver
+from rbnics.backends.online.numpy.function import Function
 from rbnics.backends.online.numpy.functions_list import FunctionsList
 from rbnics.backends.online.numpy.matrix import Matrix
 from rbnics.backends.online.numpy.snapshots_matrix import SnapshotsMatrix
@@ -17,7 +18,7 @@ from rbnics.utils.decorators import BackendFor, ModuleWrapper
 
 backend = ModuleWrapper(transpose)
 wrapping = ModuleWrapper(get_mpi_comm)
-online_backend = ModuleWrapper(OnlineEigenSolver=EigenSolver)
+online_backend = ModuleWrapper(OnlineEigenSolver=EigenSolver, OnlineFunction=Function)
 online_wrapping = ModuleWrapper()
 ProperOrthogonalDecomposition_Base = BasicProperOrthogonalDecomposition(
     backend, wrapping, online_backend, online_wrapping, AbstractProperOrthogonalDecomposition, SnapshotsMatrix,
@@ -31,3 +32,4 @@ class ProperOrthogonalDecomposition(ProperOrthogonalDecomposition_Base):
 
     def store_snapshot(self, snapshot, component=None, weight=None):
         self.snapshots_matrix.enrich(snapshot, component, weight)
+        self._compress_snapshots_matrix()
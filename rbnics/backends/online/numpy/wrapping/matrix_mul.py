@@ -9,5 +9,13 @@ def matrix_mul_vector(matrix, vector):
     return matrix * vector
 
 
+def matrix_mul_vectors(matrix, vectors):
+    return [matrix_mul_vector(matrix, vector) for vector in vectors]
+
+
+def matrix_transpose_mul_vectors(matrix, vectors):
+    return [type(vector)(matrix.N, matrix.content.T.dot(vector.content)) for vector in vectors]
+
+
 def vectorized_matrix_inner_vectorized_matrix(matrix, other_matrix):
     return (matrix * other_matrix).sum()
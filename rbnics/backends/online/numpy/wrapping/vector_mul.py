@@ -4,8 +4,16 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from numpy import dot
+from numpy import dot, zeros
 
 
 def vector_mul_vector(vector1, vector2):
     return dot(vector1, vector2)
+
+
+def vectors_transpose_mul_vectors(vectors1, vectors2):
+    output = zeros((len(vectors1), len(vectors2)))
+    for (i, vector1) in enumerate(vectors1):
+        for (j, vector2) in enumerate(vectors2):
+            output[i, j] = vector_mul_vector(vector1, vector2)
+    return output
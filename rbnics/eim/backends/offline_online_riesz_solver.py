@@ -5,11 +5,11 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from numbers import Number
-from rbnics.backends import LinearSolver
+from rbnics.backends import BatchedLinearSolver, Function, LinearSolver
 from rbnics.backends.basic.wrapping import DelayedLinearSolver, DelayedProduct
 from rbnics.eim.backends.offline_online_switch import OfflineOnlineSwitch
 from rbnics.utils.cache import cache
-from rbnics.utils.decorators import overload
+from rbnics.utils.decorators import list_of, overload
 
 
 @cache
@@ -41,6 +41,9 @@ def OfflineOnlineRieszSolver(problem_name):
             def __init__(self, problem, delay):
                 self.problem = problem
                 self.delay = delay
+                # The factorization of the inner product matrix is reused for the whole offline stage
+                self.parameters = dict(problem._linear_solver_parameters)
+                self.parameters["reuse_factorization"] = True
 
             @overload
             def solve(self, rhs: object):
@@ -49,7 +52,7 @@ def OfflineOnlineRieszSolver(problem_name):
                         problem._riesz_solve_homogeneous_dirichlet_bc)
                 if not self.delay:
                     solver = LinearSolver(*args)
-                    solver.set_parameters(problem._linear_solver_parameters)
+                    solver.set_parameters(self.parameters)
                     solver.solve()
                     return problem._riesz_solve_storage
                 else:
@@ -67,4 +70,32 @@ def OfflineOnlineRieszSolver(problem_name):
                     rhs *= basis_function
                 return self.solve(rhs)
 
+            @overload
+            def solve_batch(self, rhs: list_of(object)):
+                problem = self.problem
+                if len(rhs) == 0:
+                    return list()
+                elif not self.delay:
+                    solutions = [Function(problem.truth_problem.V) for _ in rhs]
+                    if problem._riesz_solve_homogeneous_dirichlet_bc is not None:
+                        bcs = [problem._riesz_solve_homogeneous_dirichlet_bc] * len(rhs)
+                    else:
+                        bcs = None
+                    solver = BatchedLinearSolver(
+                        [problem._riesz_solve_inner_product] * len(rhs), solutions, rhs, bcs)
+                    solver.set_parameters(self.parameters)
+                    solver.solve()
+                    return solutions
+                else:
+                    return [self.solve(rhs_i) for rhs_i in rhs]
+
+            @overload
+            def solve_batch(self, coef: Number, matrices: list_of(object), basis_functions: list_of(object)):
+                if not self.delay:
+                    return self.solve_batch([coef * matrix * basis_function
+                                             for (matrix, basis_function) in zip(matrices, basis_functions)])
+                else:
+                    return [self.solve(coef, matrix, basis_function)
+                            for (matrix, basis_function) in zip(matrices, basis_functions)]
+
     return _OfflineOnlineRieszSolver
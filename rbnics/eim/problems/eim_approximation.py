@@ -38,6 +38,9 @@ class EIMApproximation(ParametrizedProblem):
         self.interpolation_locations = parametrized_expression.create_interpolation_locations_container()
         # Interpolation matrix
         self.interpolation_matrix = OnlineAffineExpansionStorage(1)
+        # Leading blocks of the interpolation matrix, from N to a tuple (block, whether block is lower triangular).
+        # They are computed only once, and discarded when the interpolation matrix is initialized or updated.
+        self._interpolation_matrix_blocks = dict()
         # Solution
         self._interpolation_coefficients = None  # OnlineFunction
 
@@ -73,7 +76,8 @@ class EIMApproximation(ParametrizedProblem):
             key_generator=_snapshot_cache_key_generator,
             import_=_snapshot_cache_import,
             export=_snapshot_cache_export,
-            filename_generator=_snapshot_cache_filename_generator
+            filename_generator=_snapshot_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
     # Initialize data structures required for the online phase
@@ -85,9 +89,9 @@ class EIMApproximation(ParametrizedProblem):
             self.interpolation_matrix.load(self.folder["reduced_operators"], "interpolation_matrix")
             self.basis_functions.load(self.folder["basis"], "basis")
             self.N = len(self.basis_functions)
+            self.reset_interpolation_matrix_blocks()
         elif current_stage == "offline":
-            # Nothing to be done
-            pass
+            self.reset_interpolation_matrix_blocks()
         else:
             raise ValueError("Invalid stage in init().")
 
@@ -129,14 +133,33 @@ class EIMApproximation(ParametrizedProblem):
                 pass
             else:
                 # Extract the interpolation matrix
-                lhs = self.interpolation_matrix[0][:N, :N]
+                (lhs, lhs_is_lower_triangular) = self._get_interpolation_matrix_block(N)
 
                 # Solve the interpolation problem
                 solver = OnlineLinearSolver(lhs, self._interpolation_coefficients, rhs)
+                if lhs_is_lower_triangular:
+                    # This is always the case for a greedy basis generation, since each basis function
+                    # vanishes at all previously selected interpolation locations
+                    solver.set_parameters({"factorization": "lower triangular"})
                 solver.solve()
         else:
             self._interpolation_coefficients = None  # OnlineFunction
 
+    # Discard leading blocks of the interpolation matrix computed so far, e.g. because it has been updated
+    def reset_interpolation_matrix_blocks(self):
+        self._interpolation_matrix_blocks.clear()
+
+    def _get_interpolation_matrix_block(self, N):
+        if N not in self._interpolation_matrix_blocks:
+            block = self.interpolation_matrix[0][:N, :N]
+            # The interpolation matrix is lower triangular by construction for a greedy basis generation, since each
+            # basis function vanishes at all previously selected interpolation locations. Entries above the diagonal
+            # are thus round-off errors of the greedy construction, whose size depends on the size of the snapshots
+            # rather than on the one of the diagonal entries: they are never compared to a tolerance
+            is_lower_triangular = (self.basis_generation == "Greedy")
+            self._interpolation_matrix_blocks[N] = (block, is_lower_triangular)
+        return self._interpolation_matrix_blocks[N]
+
     # Call online_solve and then convert the result of online solve from OnlineVector to a tuple
     def compute_interpolated_theta(self, N=None):
         interpolated_theta = self.solve(N)
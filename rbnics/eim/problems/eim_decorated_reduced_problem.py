@@ -146,6 +146,10 @@ def EIMDecoratedReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCla
             self._update_N_EIM(**kwargs)
             ParametrizedReducedDifferentialProblem_DerivedClass._solve(self, N, **kwargs)
 
+        def _solve_batch(self, mus, N=None, **kwargs):
+            self._update_N_EIM(**kwargs)
+            return ParametrizedReducedDifferentialProblem_DerivedClass._solve_batch(self, mus, N, **kwargs)
+
         def _update_N_EIM(self, **kwargs):
             self.truth_problem._update_N_EIM(**kwargs)
 
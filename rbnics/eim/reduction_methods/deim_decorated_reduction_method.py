@@ -10,7 +10,7 @@ from rbnics.eim.problems.eim_approximation import EIMApproximation as DEIMApprox
 from rbnics.eim.problems.time_dependent_eim_approximation import (
     TimeDependentEIMApproximation as TimeDependentDEIMApproximation)
 from rbnics.eim.reduction_methods.eim_approximation_reduction_method import (
-    EIMApproximationReductionMethod as DEIMApproximationReductionMethod)
+    concurrent_offline, EIMApproximationReductionMethod as DEIMApproximationReductionMethod)
 from rbnics.eim.reduction_methods.time_dependent_eim_approximation_reduction_method import (
     TimeDependentEIMApproximationReductionMethod as TimeDependentDEIMApproximationReductionMethod)
 from rbnics.utils.decorators import (is_training_finished, PreserveClassName, ReductionMethodDecoratorFor,
@@ -127,9 +127,8 @@ def DEIMDecoratedReductionMethod(DifferentialProblemReductionMethod_DerivedClass
                 assert "offline" in self.truth_problem._apply_exact_evaluation_at_stages, (
                     "Please use @ExactParametrizedFunctions(\"offline\")")
             lifting_mu = self.truth_problem.mu
-            for (term, DEIM_reductions_term) in self.DEIM_reductions.items():
-                for (_, DEIM_reduction_term_q) in DEIM_reductions_term.items():
-                    DEIM_reduction_term_q.offline()
+            concurrent_offline([DEIM_reduction_term_q for DEIM_reductions_term in self.DEIM_reductions.values()
+                                for DEIM_reduction_term_q in DEIM_reductions_term.values()])
             self.truth_problem.set_mu(lifting_mu)
             return DifferentialProblemReductionMethod_DerivedClass.offline(self)
 
@@ -6,10 +6,11 @@
 
 import os
 from rbnics.reduction_methods.base import ReductionMethod
-from rbnics.backends import abs, evaluate, max
+from rbnics.backends import abs, copy, evaluate, max
 from rbnics.utils.decorators import snapshot_links_to_cache
 from rbnics.utils.io import (ErrorAnalysisTable, Folders, GreedySelectedParametersList, GreedyErrorEstimatorsList,
                              SpeedupAnalysisTable, TextBox, TextLine, Timer)
+from rbnics.utils.mpi import parallel_groups, parallel_io_communicator
 from rbnics.utils.test import PatchInstanceMethod
 
 
@@ -92,19 +93,46 @@ class EIMApproximationReductionMethod(ReductionMethod):
                       + "\n".join(description), fill="="))
         print("")
 
-        for (mu_index, mu) in enumerate(self.training_set):
-            print(TextLine(interpolation_method_name + " " + str(mu_index), fill=":"))
+        # If each group of processes owns a copy of the mesh, groups evaluate disjoint subsets of the training set
+        (group, groups) = parallel_groups(self.snapshots_container.mpi_comm, self.training_set.mpi_comm)
+        if groups == 1:
+            for (mu_index, mu) in enumerate(self.training_set):
+                self._evaluate_snapshot(mu_index, mu)
 
-            self.EIM_approximation.set_mu(mu)
+                print("add to snapshots")
+                self.add_to_snapshots(self.EIM_approximation.snapshot)
 
-            print("evaluate parametrized expression at mu =", mu)
-            self.EIM_approximation.evaluate_parametrized_expression()
-            self.EIM_approximation.export_solution(self.folder["snapshots"], "truth_" + str(mu_index))
-
-            print("add to snapshots")
-            self.add_to_snapshots(self.EIM_approximation.snapshot)
+                print("")
+        else:
+            # Snapshots evaluated by other groups are read back from the cache of the EIM approximation: require
+            # the cache to be stored on disk and never evicted, so that no snapshot is lost before being read
+            from rbnics.utils.config import config  # cannot import at global scope
+            cache_options = config.get("EIM", "cache")
+            assert "packed" in cache_options or (
+                "disk" in cache_options and config.get("EIM", "disk cache limit") == "unlimited"), (
+                "Evaluating the training set by groups of processes requires an unlimited disk (or packed) cache")
+            with parallel_io_communicator(self.snapshots_container.mpi_comm):
+                snapshots = dict()
+                for (mu_index, mu) in enumerate(self.training_set):
+                    if mu_index % groups == group:
+                        self._evaluate_snapshot(mu_index, mu)
+                        snapshots[mu_index] = copy(self.EIM_approximation.snapshot)
+
+                        print("")
+
+                # Wait for all groups to store their snapshots, and then get the ones evaluated by other groups,
+                # which are read from the disk (or packed) cache
+                self.training_set.mpi_comm.barrier()
+                print("add to snapshots")
+                for (mu_index, mu) in enumerate(self.training_set):
+                    if mu_index in snapshots:
+                        self.add_to_snapshots(snapshots.pop(mu_index))
+                    else:
+                        self.EIM_approximation.set_mu(mu)
+                        self.EIM_approximation.evaluate_parametrized_expression()
+                        self.add_to_snapshots(self.EIM_approximation.snapshot)
 
-            print("")
+                print("")
 
         # If basis generation is POD, compute the first POD modes of the snapshots
         if self.EIM_approximation.basis_generation == "POD":
@@ -174,10 +202,25 @@ class EIMApproximationReductionMethod(ReductionMethod):
 
                 print("")
 
+        # Interpolation locations are saved only once, at the end of the offline phase, so that reduced meshes
+        # are not materialized for every intermediate number of interpolation locations
+        self.save_interpolation_locations()
+
         print(TextBox(interpolation_method_name + " offline phase ends for" + "\n"
                       + "\n".join(description), fill="="))
         print("")
 
+    # Evaluate and export the snapshot corresponding to the mu_index-th parameter of the training set
+    def _evaluate_snapshot(self, mu_index, mu):
+        interpolation_method_name = self.EIM_approximation.parametrized_expression.interpolation_method_name()
+        print(TextLine(interpolation_method_name + " " + str(mu_index), fill=":"))
+
+        self.EIM_approximation.set_mu(mu)
+
+        print("evaluate parametrized expression at mu =", mu)
+        self.EIM_approximation.evaluate_parametrized_expression()
+        self.EIM_approximation.export_solution(self.folder["snapshots"], "truth_" + str(mu_index))
+
     # Finalize data structures required after the offline phase
     def _finalize_offline(self):
         self.EIM_approximation.init("online")
@@ -215,6 +258,8 @@ class EIMApproximationReductionMethod(ReductionMethod):
 
     def update_interpolation_locations(self, maximum_location):
         self.EIM_approximation.interpolation_locations.append(maximum_location)
+
+    def save_interpolation_locations(self):
         self.EIM_approximation.interpolation_locations.save(
             self.EIM_approximation.folder["reduced_operators"], "interpolation_locations")
 
@@ -223,6 +268,7 @@ class EIMApproximationReductionMethod(ReductionMethod):
         self.EIM_approximation.interpolation_matrix[0] = evaluate(
             self.EIM_approximation.basis_functions[:self.EIM_approximation.N],
             self.EIM_approximation.interpolation_locations)
+        self.EIM_approximation.reset_interpolation_matrix_blocks()
         self.EIM_approximation.interpolation_matrix.save(
             self.EIM_approximation.folder["reduced_operators"], "interpolation_matrix")
 
@@ -234,6 +280,20 @@ class EIMApproximationReductionMethod(ReductionMethod):
         assert mu == self.training_set[mu_index]
         return self.snapshots_container[mu_index]
 
+    # Compute the maximum interpolation error of all snapshots at once, rather than solving
+    # the interpolation problem of one snapshot at a time
+    def compute_maximum_interpolation_errors(self):
+        N = self.EIM_approximation.N
+        if N > 0:
+            (interpolation_matrix, is_lower_triangular) = self.EIM_approximation._get_interpolation_matrix_block(N)
+            maximum_errors = self.snapshots_container.compute_maximum_interpolation_errors(
+                self.EIM_approximation.basis_functions[:N], self.EIM_approximation.interpolation_locations[:N],
+                interpolation_matrix, is_lower_triangular)
+        else:
+            maximum_errors = self.snapshots_container.compute_maximum_interpolation_errors(
+                self.EIM_approximation.basis_functions[:0])
+        return [abs(maximum_error) for maximum_error in maximum_errors]
+
     # Choose the next parameter in the offline stage in a greedy fashion
     def greedy(self):
         assert self.EIM_approximation.basis_generation == "Greedy"
@@ -260,11 +320,20 @@ class EIMApproximationReductionMethod(ReductionMethod):
             (_, maximum_error, _) = self.EIM_approximation.compute_maximum_interpolation_error()
             return abs(maximum_error)
 
+        def solve_and_computer_errors(mus):
+            # The training set is serialized, and snapshots are stored in the same order as its parameters
+            assert len(mus) == len(self.snapshots_container)
+            return self.compute_maximum_interpolation_errors()
+
         if self.EIM_approximation.N == 0:
             print("find initial mu")
         else:
             print("find next mu")
-        (error_max, error_argmax) = self.training_set.max(solve_and_computer_error)
+        # Only some backends (e.g. dolfin for function snapshots) are able to compute all errors at once
+        if hasattr(self.snapshots_container, "compute_maximum_interpolation_errors"):
+            (error_max, error_argmax) = self.training_set.max_batch(solve_and_computer_errors)
+        else:
+            (error_max, error_argmax) = self.training_set.max(solve_and_computer_error)
         self.EIM_approximation.set_mu(self.training_set[error_argmax])
         self.greedy_selected_parameters.append(self.training_set[error_argmax])
         self.greedy_selected_parameters.save(self.folder["post_processing"], "mu_greedy")
@@ -438,3 +507,38 @@ class EIMApproximationReductionMethod(ReductionMethod):
         self.disable_export_solution.unpatch()
         del self.disable_import_solution
         del self.disable_export_solution
+
+
+# Perform the offline phase of several independent empirical interpolation approximations
+def concurrent_offline(EIM_reductions):
+    """
+    If each group of processes owns a copy of the mesh, groups carry out the offline phase of disjoint subsets
+    of the approximations, and then read the offline data of the approximations trained by other groups.
+    Otherwise, approximations are trained one after the other.
+    """
+    EIM_reductions = list(EIM_reductions)
+    if len(EIM_reductions) > 1:
+        group_mpi_comm = EIM_reductions[0].snapshots_container.mpi_comm
+        mpi_comm = EIM_reductions[0].training_set.mpi_comm
+        (group, groups) = parallel_groups(group_mpi_comm, mpi_comm)
+    else:
+        groups = 1
+    if groups == 1:
+        for EIM_reduction in EIM_reductions:
+            EIM_reduction.offline()
+    else:
+        with parallel_io_communicator(group_mpi_comm):
+            for (index, EIM_reduction) in enumerate(EIM_reductions):
+                if index % groups == group:
+                    # Preprocessing should only involve the processes of the current group
+                    training_set_mpi_comm = EIM_reduction.training_set.mpi_comm
+                    EIM_reduction.training_set.mpi_comm = group_mpi_comm
+                    try:
+                        EIM_reduction.offline()
+                    finally:
+                        EIM_reduction.training_set.mpi_comm = training_set_mpi_comm
+        # Wait for all groups to export their offline data, and then read the ones computed by other groups
+        mpi_comm.barrier()
+        for (index, EIM_reduction) in enumerate(EIM_reductions):
+            if index % groups != group:
+                EIM_reduction.offline()
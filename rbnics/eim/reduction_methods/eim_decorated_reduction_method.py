@@ -8,7 +8,8 @@ from numbers import Number
 from rbnics.eim.problems import EIM
 from rbnics.eim.problems.eim_approximation import EIMApproximation
 from rbnics.eim.problems.time_dependent_eim_approximation import TimeDependentEIMApproximation
-from rbnics.eim.reduction_methods.eim_approximation_reduction_method import EIMApproximationReductionMethod
+from rbnics.eim.reduction_methods.eim_approximation_reduction_method import (
+    concurrent_offline, EIMApproximationReductionMethod)
 from rbnics.eim.reduction_methods.time_dependent_eim_approximation_reduction_method import (
     TimeDependentEIMApproximationReductionMethod)
 from rbnics.utils.decorators import (is_training_finished, PreserveClassName, ReductionMethodDecoratorFor,
@@ -125,8 +126,7 @@ def EIMDecoratedReductionMethod(DifferentialProblemReductionMethod_DerivedClass)
                 assert "offline" in self.truth_problem._apply_exact_evaluation_at_stages, (
                     "Please use @ExactParametrizedFunctions(\"offline\")")
             lifting_mu = self.truth_problem.mu
-            for (coeff, EIM_reduction_coeff) in self.EIM_reductions.items():
-                EIM_reduction_coeff.offline()
+            concurrent_offline(self.EIM_reductions.values())
             self.truth_problem.set_mu(lifting_mu)
             return DifferentialProblemReductionMethod_DerivedClass.offline(self)
 
@@ -4,7 +4,8 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from rbnics.backends import LinearProblemWrapper, LinearSolver
+from rbnics.backends import assign, LinearProblemWrapper, LinearSolver
+from rbnics.backends.online import OnlineBatchedLinearSolver, OnlineFunction
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators
 
 
@@ -29,5 +30,73 @@ def LinearReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                 solver.set_parameters(problem._linear_solver_parameters)
                 solver.solve()
 
+            def eval_batch(self, mus):
+                """
+                Return the left-hand and right-hand sides of the reduced systems for each parameter in mus,
+                or None if they cannot be assembled for all parameters at once (e.g. in case of operators
+                which are not affine expansions).
+                """
+                return None
+
+            def _eval_batch_is_customized_as_eval(self):
+                # A (decorated) class may customize matrix_eval() or vector_eval() without providing the
+                # corresponding batched version: in such case, systems must be assembled one parameter at a time
+                for cls in type(self).__mro__:
+                    if "eval_batch" in cls.__dict__:
+                        return True
+                    elif "matrix_eval" in cls.__dict__ or "vector_eval" in cls.__dict__:
+                        return False
+                return False
+
+        # Perform an online solve for several parameters (internal): assemble all reduced systems first,
+        # possibly for all parameters at once, and then solve them at once
+        def _solve_batch(self, mus, N=None, **kwargs):
+            N, kwargs = self._online_size_from_kwargs(N, **kwargs)
+            N += self.N_bc
+            solutions = [OnlineFunction(N) for _ in mus]
+            if N == 0:  # trivial case
+                return solutions
+            assert not hasattr(self, "_is_solving")
+            self._is_solving = True
+            problem_solver = self.ProblemSolver(self, N, **kwargs)
+            mus_to_solve = list()
+            solutions_to_solve = list()
+            bcs = list()
+            for (mu, solution) in zip(mus, solutions):
+                self.set_mu(mu)
+                try:
+                    assign(solution, self._solution_cache[self.mu, N, kwargs])
+                    # **kwargs is not supported by __getitem__
+                except KeyError:
+                    mus_to_solve.append(mu)
+                    solutions_to_solve.append(solution)
+                    bcs.append(problem_solver.bc_eval())
+            if len(solutions_to_solve) > 0:
+                if problem_solver._eval_batch_is_customized_as_eval():
+                    lhs_and_rhs = problem_solver.eval_batch(mus_to_solve)
+                else:
+                    lhs_and_rhs = None
+                if lhs_and_rhs is not None:
+                    (lhs, rhs) = lhs_and_rhs
+                else:
+                    lhs = list()
+                    rhs = list()
+                    for mu in mus_to_solve:
+                        self.set_mu(mu)
+                        lhs.append(problem_solver.matrix_eval())
+                        rhs.append(problem_solver.vector_eval())
+                # Presence of boundary conditions does not depend on the parameter
+                if bcs[0] is None:
+                    assert all([bcs_i is None for bcs_i in bcs])
+                    bcs = None
+                solver = OnlineBatchedLinearSolver(lhs, solutions_to_solve, rhs, bcs)
+                solver.set_parameters(self._linear_solver_parameters)
+                solver.solve()
+                for (mu, solution) in zip(mus_to_solve, solutions_to_solve):
+                    self.set_mu(mu)
+                    problem_solver.monitor(solution)
+            delattr(self, "_is_solving")
+            return solutions
+
     # return value (a class) for the decorator
     return LinearReducedProblem_Class
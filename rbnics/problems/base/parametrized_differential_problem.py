@@ -89,7 +89,8 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
             key_generator=_solution_cache_key_generator,
             import_=_solution_cache_import,
             export=_solution_cache_export,
-            filename_generator=_solution_cache_filename_generator
+            filename_generator=_solution_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
         def _output_cache_key_generator(*args, **kwargs):
@@ -116,7 +117,8 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
             key_generator=_output_cache_key_generator,
             import_=_output_cache_import,
             export=_output_cache_export,
-            filename_generator=_output_cache_filename_generator
+            filename_generator=_output_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
     def name(self):
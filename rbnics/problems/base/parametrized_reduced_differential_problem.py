@@ -341,6 +341,47 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
             delattr(self, "_is_solving")
         return self._solution
 
+    def solve_batch(self, mus, N=None, **kwargs):
+        """
+        Perform an online solve for each parameter in mus. self.N will be used as matrix dimension if the default
+        value is provided for N. The current value of the parameter is restored at the end.
+
+        :param mus: parameters for which the online solve is required
+        :type mus: iterable of tuples of real numbers
+        :param N : Dimension of the reduced problem
+        :type N : integer
+        :return: list of reduced solutions, one for each parameter in mus
+        """
+        mus = list(mus)
+        mu = self.mu
+        if self._solve_batch_is_customized_as_solve():
+            solutions = self._solve_batch(mus, N, **kwargs)
+        else:
+            solutions = self._solve_batch_sequentially(mus, N, **kwargs)
+        self.set_mu(mu)
+        return solutions
+
+    # Perform an online solve for several parameters (internal)
+    def _solve_batch(self, mus, N=None, **kwargs):
+        return self._solve_batch_sequentially(mus, N, **kwargs)
+
+    def _solve_batch_is_customized_as_solve(self):
+        # A (decorated) class may customize solve() without providing the corresponding batched version:
+        # in such case, the batched solve must fall back to solving for one parameter at a time
+        for cls in type(self).__mro__:
+            if "_solve_batch" in cls.__dict__:
+                return True
+            elif "solve" in cls.__dict__ or "_solve" in cls.__dict__:
+                return False
+        return False
+
+    def _solve_batch_sequentially(self, mus, N=None, **kwargs):
+        solutions = list()
+        for mu in mus:
+            self.set_mu(mu)
+            solutions.append(copy(self.solve(N, **kwargs)))
+        return solutions
+
     class ProblemSolver(object, metaclass=ABCMeta):
         def __init__(self, problem, N, **kwargs):
             self.problem = problem
@@ -390,15 +431,19 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         # Define storage for projected solution
         projected_snapshot_N = OnlineFunction(N)
 
-        # Project on reduced basis
+        # Project on reduced basis. Since the inner product matrix does not depend on the parameter,
+        # its factorization is computed once and reused by later projections
+        linear_solver_parameters = dict(self._linear_solver_parameters)
+        linear_solver_parameters.setdefault("reuse_factorization", True)
         if on_dirichlet_bc:
+            linear_solver_parameters.setdefault("factorization", "cholesky")
             solver = OnlineLinearSolver(inner_product_N, projected_snapshot_N,
                                         transpose(basis_functions) * inner_product * snapshot)
         else:
             solver = OnlineLinearSolver(inner_product_N, projected_snapshot_N,
                                         transpose(basis_functions) * inner_product * snapshot,
                                         self._combined_and_homogenized_dirichlet_bc)
-        solver.set_parameters(self._linear_solver_parameters)
+        solver.set_parameters(linear_solver_parameters)
         solver.solve()
         return projected_snapshot_N
 
@@ -675,6 +720,22 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         """
         return self.truth_problem.compute_theta(term)
 
+    def _compute_theta_batch(self, mus, terms):
+        """
+        Return theta multiplicative terms of the affine expansion of the problem for each parameter in mus,
+        as a tuple containing the list of computed thetas of each term.
+
+        :param mus: parameters for which thetas are required.
+        :param terms: the forms of the class of the problem.
+        :return: computed thetas.
+        """
+        thetas = tuple(list() for _ in terms)
+        for mu in mus:
+            self.set_mu(mu)
+            for (term, thetas_term) in zip(terms, thetas):
+                thetas_term.append(self.compute_theta(term))
+        return thetas
+
     # Assemble the reduced order affine expansion
     def assemble_operator(self, term, current_stage="online"):
         """
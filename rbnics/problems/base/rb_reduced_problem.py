@@ -7,9 +7,12 @@
 import os
 from abc import ABCMeta, abstractmethod
 from numbers import Number
-from rbnics.backends import BasisFunctionsMatrix, Function, FunctionsList, LinearSolver, transpose
-from rbnics.backends.online import OnlineAffineExpansionStorage
-from rbnics.utils.decorators import overload, PreserveClassName, RequiredBaseDecorators
+from rbnics.backends import (assign, BasisFunctionsMatrix, BatchedLinearSolver, Function, FunctionsList, LinearSolver,
+                             transpose)
+from rbnics.backends.abstract import BasisFunctionsMatrix as AbstractBasisFunctionsMatrix
+from rbnics.backends.abstract import FunctionsList as AbstractFunctionsList
+from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineMatrix
+from rbnics.utils.decorators import list_of, overload, PreserveClassName, RequiredBaseDecorators
 
 
 @RequiredBaseDecorators(None)
@@ -43,6 +46,7 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             self._riesz_solve_inner_product = None  # setup by init()
             self._riesz_solve_homogeneous_dirichlet_bc = None  # setup by init()
             self._error_estimation_inner_product = None  # setup by init()
+            self._error_estimation_inner_product_times_riesz = dict()  # from (string, int) to dict
             # I/O
             self.folder["error_estimation"] = os.path.join(self.folder_prefix, "error_estimation")
 
@@ -127,6 +131,28 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             raise NotImplementedError("The method estimate_relative_error() is problem-specific"
                                       + " and needs to be overridden.")
 
+        def solve_and_estimate_error_batch(self, mus, N=None, **kwargs):
+            """
+            Perform an online solve for each parameter in mus, and return the corresponding error bounds.
+
+            :param mus: list of parameters.
+            :param N: dimension of the reduced problem.
+            :return: list of error bounds.
+            """
+            mu = self.mu
+            solutions = self.solve_batch(mus, N, **kwargs)
+            error_estimators = self._estimate_error_batch(mus, solutions)
+            self.set_mu(mu)
+            return error_estimators
+
+        def _estimate_error_batch(self, mus, solutions):
+            error_estimators = list()
+            for (mu, solution) in zip(mus, solutions):
+                self.set_mu(mu)
+                assign(self._solution, solution)
+                error_estimators.append(self.estimate_error())
+            return error_estimators
+
         def estimate_error_output(self):
             """
             It returns an error bound for the current output.
@@ -176,41 +202,58 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             :param term: the forms of the truth problem.
             """
             solver = self.RieszSolver(self)
-            # Compute the Riesz representor
+            # Compute the Riesz representor, solving at once for all affine terms and all new basis functions
             assert self.terms_order[term] in (1, 2)
             if self.terms_order[term] == 1:
+                riesz_term = solver.solve_batch([self.truth_problem.operator[term][q] for q in range(self.Q[term])])
                 for q in range(self.Q[term]):
-                    self.riesz[term][q].enrich(
-                        solver.solve(self.truth_problem.operator[term][q])
-                    )
+                    self.riesz[term][q].enrich(riesz_term[q])
                 self.riesz[term].save(self.folder["error_estimation"], "riesz_" + term)
             elif self.terms_order[term] == 2:
+                riesz_storages = list()
+                operators = list()
+                basis_functions = list()
                 for q in range(self.Q[term]):
                     if len(self.components) > 1:
                         for component in self.components:
                             for n in range(len(self.riesz[term][q][component]),
                                            self.N[component] + self.N_bc[component]):
-                                self.riesz[term][q][component].enrich(
-                                    solver.solve(-1., self.truth_problem.operator[term][q],
-                                                 self.basis_functions[component][n]))
+                                riesz_storages.append(self.riesz[term][q][component])
+                                operators.append(self.truth_problem.operator[term][q])
+                                basis_functions.append(self.basis_functions[component][n])
                     else:
                         for n in range(len(self.riesz[term][q]), self.N + self.N_bc):
-                            self.riesz[term][q].enrich(
-                                solver.solve(-1., self.truth_problem.operator[term][q], self.basis_functions[n]))
+                            riesz_storages.append(self.riesz[term][q])
+                            operators.append(self.truth_problem.operator[term][q])
+                            basis_functions.append(self.basis_functions[n])
+                riesz_term = solver.solve_batch(-1., operators, basis_functions)
+                for (riesz_storage, riesz_term_q_n) in zip(riesz_storages, riesz_term):
+                    riesz_storage.enrich(riesz_term_q_n)
                 self.riesz[term].save(self.folder["error_estimation"], "riesz_" + term)
             else:
                 raise ValueError("Invalid value for order of term " + term)
+            # Extend the products of the inner product matrix and the Riesz representors with the new ones
+            if any(term == error_estimation_term[1] for error_estimation_term in self.error_estimation_terms):
+                for q in range(self.Q[term]):
+                    self._compute_error_estimation_inner_product_times_riesz(term, q)
 
         class RieszSolver(object):
+            """
+            Solver for the Riesz representation problems. Since the inner product matrix does not depend on the
+            parameter, its factorization is computed once and reused for the whole offline stage.
+            """
+
             def __init__(self, problem):
                 self.problem = problem
+                self.parameters = dict(problem._linear_solver_parameters)
+                self.parameters["reuse_factorization"] = True
 
             @overload
             def solve(self, rhs: object):
                 problem = self.problem
                 solver = LinearSolver(problem._riesz_solve_inner_product, problem._riesz_solve_storage, rhs,
                                       problem._riesz_solve_homogeneous_dirichlet_bc)
-                solver.set_parameters(problem._linear_solver_parameters)
+                solver.set_parameters(self.parameters)
                 solver.solve()
                 return problem._riesz_solve_storage
 
@@ -218,6 +261,26 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             def solve(self, coef: Number, matrix: object, basis_function: object):
                 return self.solve(coef * matrix * basis_function)
 
+            @overload
+            def solve_batch(self, rhs: list_of(object)):
+                problem = self.problem
+                if len(rhs) == 0:
+                    return list()
+                solutions = [Function(problem.truth_problem.V) for _ in rhs]
+                if problem._riesz_solve_homogeneous_dirichlet_bc is not None:
+                    bcs = [problem._riesz_solve_homogeneous_dirichlet_bc] * len(rhs)
+                else:
+                    bcs = None
+                solver = BatchedLinearSolver([problem._riesz_solve_inner_product] * len(rhs), solutions, rhs, bcs)
+                solver.set_parameters(self.parameters)
+                solver.solve()
+                return solutions
+
+            @overload
+            def solve_batch(self, coef: Number, matrices: list_of(object), basis_functions: list_of(object)):
+                return self.solve_batch([coef * matrix * basis_function
+                                         for (matrix, basis_function) in zip(matrices, basis_functions)])
+
         def assemble_error_estimation_operators(self, term, current_stage="online"):
             """
             It assembles operators for error estimation.
@@ -235,27 +298,53 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                 assert self.terms_order[term[0]] >= self.terms_order[term[1]], (
                     "Please swap the order of " + str(term) + " in self.error_estimation_terms")
                 # otherwise for (term1, term2) of orders (1, 2) we would have a row vector, rather than a column one
+                # Blocks are extended by bordering when the basis is enriched: new entries are computed from the
+                # Riesz representors of the new basis functions, while products between the inner product matrix and
+                # Riesz representors are shared among all blocks
                 if self.terms_order[term[0]] == 2 and self.terms_order[term[1]] == 2:
+                    inner_product_times_riesz_term1 = [
+                        self._compute_error_estimation_inner_product_times_riesz(term[1], q1)
+                        for q1 in range(self.Q[term[1]])]
                     for q0 in range(self.Q[term[0]]):
                         for q1 in range(self.Q[term[1]]):
-                            self.error_estimation_operator[term][q0, q1] = (
-                                transpose(self.riesz[term[0]][q0]) * self._error_estimation_inner_product
-                                * self.riesz[term[1]][q1])
+                            if inner_product_times_riesz_term1[q1] is not None:
+                                self.error_estimation_operator[term][q0, q1] = (
+                                    self._assemble_error_estimation_operator_block(
+                                        self.riesz[term[0]][q0], self.riesz[term[1]][q1],
+                                        inner_product_times_riesz_term1[q1]))
+                            else:
+                                self.error_estimation_operator[term][q0, q1] = (
+                                    transpose(self.riesz[term[0]][q0]) * self._error_estimation_inner_product
+                                    * self.riesz[term[1]][q1])
                 elif self.terms_order[term[0]] == 2 and self.terms_order[term[1]] == 1:
+                    inner_product_times_riesz_term1 = [
+                        self._compute_error_estimation_inner_product_times_riesz(term[1], q1)
+                        for q1 in range(self.Q[term[1]])]
                     for q0 in range(self.Q[term[0]]):
                         for q1 in range(self.Q[term[1]]):
                             assert len(self.riesz[term[1]][q1]) == 1
-                            self.error_estimation_operator[term][q0, q1] = (
-                                transpose(self.riesz[term[0]][q0]) * self._error_estimation_inner_product
-                                * self.riesz[term[1]][q1][0])
+                            if inner_product_times_riesz_term1[q1] is not None:
+                                self.error_estimation_operator[term][q0, q1] = (
+                                    transpose(self.riesz[term[0]][q0]) * inner_product_times_riesz_term1[q1][0])
+                            else:
+                                self.error_estimation_operator[term][q0, q1] = (
+                                    transpose(self.riesz[term[0]][q0]) * self._error_estimation_inner_product
+                                    * self.riesz[term[1]][q1][0])
                 elif self.terms_order[term[0]] == 1 and self.terms_order[term[1]] == 1:
+                    inner_product_times_riesz_term1 = [
+                        self._compute_error_estimation_inner_product_times_riesz(term[1], q1)
+                        for q1 in range(self.Q[term[1]])]
                     for q0 in range(self.Q[term[0]]):
                         assert len(self.riesz[term[0]][q0]) == 1
                         for q1 in range(self.Q[term[1]]):
                             assert len(self.riesz[term[1]][q1]) == 1
-                            self.error_estimation_operator[term][q0, q1] = (
-                                transpose(self.riesz[term[0]][q0][0]) * self._error_estimation_inner_product
-                                * self.riesz[term[1]][q1][0])
+                            if inner_product_times_riesz_term1[q1] is not None:
+                                self.error_estimation_operator[term][q0, q1] = (
+                                    transpose(self.riesz[term[0]][q0][0]) * inner_product_times_riesz_term1[q1][0])
+                            else:
+                                self.error_estimation_operator[term][q0, q1] = (
+                                    transpose(self.riesz[term[0]][q0][0]) * self._error_estimation_inner_product
+                                    * self.riesz[term[1]][q1][0])
                 else:
                     raise ValueError("Invalid term order for assemble_error_estimation_operators().")
                 self.error_estimation_operator[term].save(
@@ -264,5 +353,47 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             else:
                 raise ValueError("Invalid stage in assemble_error_estimation_operators().")
 
+        def _compute_error_estimation_inner_product_times_riesz(self, term, q):
+            """
+            It returns the products of the inner product matrix and the Riesz representors of a term, which are
+            shared by all blocks of the operators for error estimation involving such term. Products are stored
+            next to the Riesz representors, and only the ones related to Riesz representors added since the
+            previous call are computed. Returns None if the Riesz representors are not available as functions,
+            e.g. because their computation has been delayed.
+            """
+            riesz_term_q = self.riesz[term][q]
+            if isinstance(riesz_term_q, AbstractFunctionsList):
+                riesz_functions = list(riesz_term_q)
+            elif isinstance(riesz_term_q, AbstractBasisFunctionsMatrix):
+                riesz_functions = [riesz_function for component in self.components
+                                   for riesz_function in riesz_term_q[component]]
+            else:
+                return None
+            cached_products = self._error_estimation_inner_product_times_riesz.get((term, q), dict())
+            products = dict()
+            for riesz_function in riesz_functions:
+                (cached_riesz_function, product) = cached_products.get(id(riesz_function), (None, None))
+                if cached_riesz_function is not riesz_function:
+                    product = self._error_estimation_inner_product * riesz_function
+                products[id(riesz_function)] = (riesz_function, product)
+            self._error_estimation_inner_product_times_riesz[term, q] = products
+            return [products[id(riesz_function)][1] for riesz_function in riesz_functions]
+
+        @staticmethod
+        def _assemble_error_estimation_operator_block(riesz_term0_q0, riesz_term1_q1,
+                                                      inner_product_times_riesz_term1_q1):
+            """
+            It assembles a block of the operators for error estimation between two terms of order 2, column by
+            column, from the products of the inner product matrix and the Riesz representors of the second term.
+            """
+            output = OnlineMatrix(riesz_term0_q0._component_name_to_basis_component_length,
+                                  riesz_term1_q1._component_name_to_basis_component_length)
+            M = sum(riesz_term0_q0._component_name_to_basis_component_length.values())
+            for (j, inner_product_times_riesz_term1_q1_j) in enumerate(inner_product_times_riesz_term1_q1):
+                column = transpose(riesz_term0_q0) * inner_product_times_riesz_term1_q1_j
+                for i in range(M):
+                    output[i, j] = column[i]
+            return output
+
     # return value (a class) for the decorator
     return RBReducedProblem_Class
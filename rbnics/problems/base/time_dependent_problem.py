@@ -69,7 +69,8 @@ def TimeDependentProblem(ParametrizedDifferentialProblem_DerivedClass):
                 key_generator=_solution_cache_key_generator,
                 import_=_solution_cache_import,
                 export=_solution_cache_export,
-                filename_generator=_solution_cache_filename_generator
+                filename_generator=_solution_cache_filename_generator,
+                folder=self.folder["cache"]
             )
 
             def _solution_dot_cache_key_generator(*args, **kwargs):
@@ -95,7 +96,8 @@ def TimeDependentProblem(ParametrizedDifferentialProblem_DerivedClass):
                 key_generator=_solution_dot_cache_key_generator,
                 import_=_solution_dot_cache_import,
                 export=_solution_dot_cache_export,
-                filename_generator=_solution_dot_cache_filename_generator
+                filename_generator=_solution_dot_cache_filename_generator,
+                folder=self.folder["cache"]
             )
             del self._solution_cache
 
@@ -122,7 +124,8 @@ def TimeDependentProblem(ParametrizedDifferentialProblem_DerivedClass):
                 key_generator=_output_cache_key_generator,
                 import_=_output_cache_import,
                 export=_output_cache_export,
-                filename_generator=_output_cache_filename_generator
+                filename_generator=_output_cache_filename_generator,
+                folder=self.folder["cache"]
             )
             del self._output_cache
 
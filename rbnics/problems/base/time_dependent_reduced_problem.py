@@ -264,6 +264,10 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
             assign(self._solution_dot, self._solution_dot_over_time[-1])
             return self._solution_over_time
 
+        def _solve_batch(self, mus, N=None, **kwargs):
+            # Time stepping cannot be carried out on a stack of reduced systems, hence solve one parameter at a time
+            return self._solve_batch_sequentially(mus, N, **kwargs)
+
         class ProblemSolver(
                 ParametrizedReducedDifferentialProblem_DerivedClass.ProblemSolver, TimeDependentProblemWrapper):
             def set_time(self, t):
@@ -307,7 +311,10 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
                     solver = OnlineLinearSolver(
                         inner_product_N, projected_initial_condition,
                         sum(product(all_initial_conditions_thetas, all_initial_conditions)))
-                    solver.set_parameters(problem._linear_solver_parameters)
+                    linear_solver_parameters = dict(problem._linear_solver_parameters)
+                    linear_solver_parameters.setdefault("reuse_factorization", True)
+                    linear_solver_parameters.setdefault("factorization", "cholesky")
+                    solver.set_parameters(linear_solver_parameters)
                     solver.solve()
                     return projected_initial_condition
                 else:
@@ -7,6 +7,7 @@
 from math import sqrt
 from numpy import isclose
 from rbnics.backends import product, sum, transpose
+from rbnics.backends.online import OnlineAffineExpansionStorage, online_batched_product
 from rbnics.problems.base import LinearRBReducedProblem, ParametrizedReducedDifferentialProblem
 from rbnics.problems.elliptic.elliptic_problem import EllipticProblem
 from rbnics.problems.elliptic.elliptic_reduced_problem import EllipticReducedProblem
@@ -39,6 +40,31 @@ class EllipticRBReducedProblem(EllipticRBReducedProblem_Base):
         assert beta >= 0.
         return sqrt(abs(eps2)) / beta
 
+    # Return error bounds for the given solutions, evaluating residual norms for all parameters at once
+    def _estimate_error_batch(self, mus, solutions):
+        if (type(self).estimate_error is not EllipticRBReducedProblem.estimate_error
+                or type(self).get_residual_norm_squared is not EllipticRBReducedProblem.get_residual_norm_squared):
+            # error estimation has been customized, fall back to the evaluation for one parameter at a time
+            return EllipticRBReducedProblem_Base._estimate_error_batch(self, mus, solutions)
+        if not self._has_affine_error_estimation_operators():
+            # error estimation operators depend on the parameter (e.g. they are evaluated exactly),
+            # fall back to the evaluation for one parameter at a time
+            return EllipticRBReducedProblem_Base._estimate_error_batch(self, mus, solutions)
+        eps2_batch = self._get_residual_norm_squared_batch(mus, solutions)
+        error_estimators = list()
+        for (mu, eps2) in zip(mus, eps2_batch):
+            self.set_mu(mu)
+            beta = self.truth_problem.get_stability_factor_lower_bound()
+            assert eps2 >= 0. or isclose(eps2, 0.)
+            assert beta >= 0.
+            error_estimators.append(sqrt(abs(eps2)) / beta)
+        return error_estimators
+
+    # Check if error estimation operators are affine, and can thus be shared by all parameters
+    def _has_affine_error_estimation_operators(self):
+        return all(isinstance(self.error_estimation_operator[term], OnlineAffineExpansionStorage)
+                   for term in self.error_estimation_terms)
+
     # Return a relative error bound for the current solution
     def estimate_relative_error(self):
         return NotImplemented
@@ -62,3 +88,15 @@ class EllipticRBReducedProblem(EllipticRBReducedProblem_Base):
                 + (transpose(self._solution)
                    * sum(product(theta_a, self.error_estimation_operator["a", "a"][:N, :N], theta_a))
                    * self._solution))
+
+    # Return the numerator of the error bound for the given solutions
+    def _get_residual_norm_squared_batch(self, mus, solutions):
+        if len(solutions) == 0:
+            return list()
+        N = solutions[0].N
+        (thetas_a, thetas_f) = self._compute_theta_batch(mus, ("a", "f"))
+        return (online_batched_product(thetas_f, self.error_estimation_operator["f", "f"], thetas_f)
+                + 2.0 * online_batched_product(
+                    thetas_a, self.error_estimation_operator["a", "f"][:N], thetas_f, solutions)
+                + online_batched_product(
+                    thetas_a, self.error_estimation_operator["a", "a"][:N, :N], thetas_a, solutions, solutions))
@@ -6,6 +6,7 @@
 
 from rbnics.problems.base import LinearReducedProblem
 from rbnics.backends import product, sum, transpose
+from rbnics.backends.online import OnlineAffineExpansionStorage, online_batched_product
 
 
 def EllipticReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
@@ -27,6 +28,15 @@ def EllipticReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                 N = self.N
                 return sum(product(problem.compute_theta("f"), problem.operator["f"][:N]))
 
+            def eval_batch(self, mus):
+                problem = self.problem
+                N = self.N
+                if not all(isinstance(problem.operator[term], OnlineAffineExpansionStorage) for term in ("a", "f")):
+                    return None
+                (thetas_a, thetas_f) = problem._compute_theta_batch(mus, ("a", "f"))
+                return (online_batched_product(thetas_a, problem.operator["a"][:N, :N]),
+                        online_batched_product(thetas_f, problem.operator["f"][:N]))
+
         # Perform an online evaluation of the output
         def _compute_output(self, N):
             self._output = transpose(self._solution) * sum(product(self.compute_theta("s"), self.operator["s"][:N]))
@@ -99,7 +99,10 @@ def StokesReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                 assembled_operator_rhs,
                 assembled_dirichlet_bc
             )
-            solver.set_parameters(self._linear_solver_parameters)
+            # The supremizer inner product does not depend on the parameter, hence its factorization can be reused
+            linear_solver_parameters = dict(self._linear_solver_parameters)
+            linear_solver_parameters.setdefault("reuse_factorization", True)
+            solver.set_parameters(linear_solver_parameters)
             solver.solve()
 
         def _supremizer_cache_key_from_N_and_kwargs(self, N, **kwargs):
@@ -5,13 +5,17 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import inspect
+from logging import DEBUG, getLogger
 from rbnics.backends import assign
 from rbnics.reduction_methods.base.reduction_method import ReductionMethod
 from rbnics.utils.io import Folders
 from rbnics.utils.decorators import StoreMapFromProblemToReductionMethod, UpdateMapFromProblemToTrainingStatus
 from rbnics.utils.factories import ReducedProblemFactory
+from rbnics.utils.mpi import parallel_groups, parallel_io_communicator
 from rbnics.utils.test import PatchInstanceMethod
 
+logger = getLogger("rbnics/reduction_methods/base/differential_problem_reduction_method.py")
+
 
 @StoreMapFromProblemToReductionMethod
 @UpdateMapFromProblemToTrainingStatus
@@ -39,6 +43,43 @@ class DifferentialProblemReductionMethod(ReductionMethod):
         return ReductionMethod.initialize_testing_set(
             self, self.truth_problem.mu_range, ntest, enable_import, sampling, **kwargs)
 
+    def _solve_truth_problems_concurrently(self, mus):
+        """
+        If each group of processes owns a copy of the mesh, groups carry out the truth solves for disjoint subsets
+        of mus, and store the solutions in the disk (or packed) cache of the truth problem, from which they are then
+        loaded by all processes when updating the reduced basis. Otherwise, or if the disk cache of problems is
+        disabled, truth solves are left to be carried out one after the other by all processes.
+        This is a collective operation.
+
+        :param mus: the parameters for which truth solves are required.
+        :return: whether truth solves were carried out concurrently.
+        """
+        from rbnics.utils.config import config  # cannot import at global scope
+        mus = list(mus)
+        if len(mus) < 2:
+            logger.log(DEBUG, "Sequential truth solves: only " + str(len(mus)) + " truth solve is required")
+            return False
+        if len({"disk", "packed"}.intersection(config.get("problems", "cache"))) == 0:
+            logger.log(DEBUG, "Sequential truth solves: disk cache of problems is disabled, and solutions could not be"
+                       + " shared among groups of processes")
+            return False
+        group_mpi_comm = self.reduced_problem.basis_functions.mpi_comm
+        mpi_comm = self.training_set.mpi_comm
+        (group, groups) = parallel_groups(group_mpi_comm, mpi_comm)
+        if groups == 1:
+            logger.log(DEBUG, "Sequential truth solves: all processes share the same mesh, and form a single group")
+            return False
+
+        # Split parameters in a round robin fashion, to balance the load among groups
+        # in case the cost of a truth solve depends on the parameter location
+        with parallel_io_communicator(group_mpi_comm):
+            for mu in mus[group::groups]:
+                self.truth_problem.set_mu(mu)
+                self.truth_problem.solve()
+        # Wait for all groups to store their solutions in the disk cache
+        mpi_comm.barrier()
+        return True
+
     # Initialize data structures required for the offline phase
     def _init_offline(self):
         # Initialize the affine expansion in the truth problem
@@ -32,6 +32,8 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             # ProperOrthogonalDecomposition (for problems with one component)
             # or dict of ProperOrthogonalDecomposition (for problem with several components)
             self.POD = None
+            # Parameters of the algorithm used to compute the POD modes
+            self.POD_parameters = dict()
             # I/O
             self.folder["snapshots"] = os.path.join(self.folder_prefix, "snapshots")
             self.folder["post_processing"] = os.path.join(self.folder_prefix, "post_processing")
@@ -84,6 +86,15 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
 
             self.tol = tol
 
+        def set_POD_parameters(self, parameters):
+            """
+            It sets the parameters of the algorithm used to compute the POD modes, e.g. to enable a randomized
+            POD by {"method": "randomized"}.
+
+            :param parameters: a dict of POD parameters.
+            """
+            self.POD_parameters.update(parameters)
+
         def _init_offline(self):
             # Call parent to initialize inner product and reduced problem
             output = DifferentialProblemReductionMethod_DerivedClass._init_offline(self)
@@ -96,11 +107,13 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
                     # the affine expansion storage contains only the inner product matrix
                     inner_product = self.truth_problem.inner_product[component][0]
                     self.POD[component] = ProperOrthogonalDecomposition(self.truth_problem.V, inner_product)
+                    self.POD[component].set_parameters(self.POD_parameters)
             else:
                 assert len(self.truth_problem.inner_product) == 1
                 # the affine expansion storage contains only the inner product matrix
                 inner_product = self.truth_problem.inner_product[0]
                 self.POD = ProperOrthogonalDecomposition(self.truth_problem.V, inner_product)
+                self.POD.set_parameters(self.POD_parameters)
 
             # Return
             return output
@@ -122,6 +135,10 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase begins", fill="="))
             print("")
 
+            if self._solve_truth_problems_concurrently(self.training_set):
+                print(TextLine("concurrent truth solves", fill="#"))
+                print("")
+
             for (mu_index, mu) in enumerate(self.training_set):
                 print(TextLine(str(mu_index), fill="#"))
 
@@ -9,6 +9,7 @@ from math import sqrt
 from logging import DEBUG, getLogger
 from rbnics.backends import GramSchmidt
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators, snapshot_links_to_cache
+from rbnics.utils.cache import ProjectionsCache
 from rbnics.utils.io import (ErrorAnalysisTable, GreedySelectedParametersList, GreedyErrorEstimatorsList,
                              OnlineSizeDict, SpeedupAnalysisTable, TextBox, TextLine, Timer)
 
@@ -43,6 +44,41 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             self.greedy_selected_parameters = GreedySelectedParametersList()
             self.greedy_error_estimators = GreedyErrorEstimatorsList()
             self.label = "RB"
+            # Number of parameters selected at each greedy iteration
+            self.greedy_batch_size = 1
+            self.greedy_batch_min_distance = 0.
+            self._greedy_batch = list()  # further parameters selected by the last greedy iteration
+            # Re-evaluate the error estimator only where it may still attain the maximum
+            self.greedy_lazy = False
+            # Projections of offline operators on the basis functions, to be reused when the basis is enriched
+            self._projections_cache = ProjectionsCache()
+
+        def set_greedy_batch_size(self, batch_size, min_distance=0.):
+            """
+            It sets the number of parameters to be selected at each greedy iteration, corresponding to the largest
+            values of the error estimator. Truth problems for all selected parameters are solved (concurrently,
+            if each group of processes owns a copy of the mesh) and their solutions are added to the basis at once.
+
+            :param batch_size: the number of parameters selected at each greedy iteration.
+            :param min_distance: minimum distance between parameters selected at the same greedy iteration.
+            """
+            assert isinstance(batch_size, int)
+            assert batch_size > 0
+            assert min_distance >= 0.
+            self.greedy_batch_size = batch_size
+            self.greedy_batch_min_distance = min_distance
+
+        def set_lazy_greedy(self, lazy=True):
+            """
+            It enables (or disables) a lazy greedy, which relies on the saturation assumption, i.e. that the error
+            estimator does not increase when the reduced basis is enriched. The error estimator computed at the
+            previous greedy iteration is thus an upper bound of the current one, and is used to re-evaluate the
+            error estimator only for parameters whose upper bound is still larger than the current maximum.
+
+            :param lazy: whether the lazy greedy should be used.
+            """
+            assert isinstance(lazy, bool)
+            self.greedy_lazy = lazy
 
         def _init_offline(self):
             # Call parent to initialize inner product and reduced problem
@@ -60,9 +96,19 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 inner_product = self.truth_problem.inner_product[0]
                 self.GS = GramSchmidt(self.truth_problem.V, inner_product)
 
+            # Make sure that no projections are reused from a previous offline phase
+            self._projections_cache.clear()
+
             # Return
             return output
 
+        def _finalize_offline(self):
+            # Projections are not required anymore after the offline phase
+            self._projections_cache.clear()
+
+            # Call parent
+            DifferentialProblemReductionMethod_DerivedClass._finalize_offline(self)
+
         def offline(self):
             """
             It performs the offline phase of the reduced order model.
@@ -81,8 +127,9 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             print("")
 
             # Initialize first parameter to be used
-            self.reduced_problem.build_reduced_operators()
-            self.reduced_problem.build_error_estimation_operators()
+            with self._projections_cache.use():
+                self.reduced_problem.build_reduced_operators()
+                self.reduced_problem.build_error_estimation_operators()
             (absolute_error_estimator_max, relative_error_estimator_max) = self.greedy()
             print("initial maximum absolute error estimator over training set =", absolute_error_estimator_max)
             print("initial maximum relative error estimator over training set =", relative_error_estimator_max)
@@ -93,23 +140,39 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             while self.reduced_problem.N < self.Nmax and relative_error_estimator_max >= self.tol:
                 print(TextLine("N = " + str(self.reduced_problem.N), fill="#"))
 
-                print("truth solve for mu =", self.truth_problem.mu)
-                snapshot = self.truth_problem.solve()
-                self.truth_problem.export_solution(self.folder["snapshots"], "truth_" + str(iteration), snapshot)
-                snapshot = self.postprocess_snapshot(snapshot, iteration)
+                mus = [self.truth_problem.mu] + self._greedy_batch
+                if self._solve_truth_problems_concurrently(mus):
+                    print("concurrent truth solves")
+
+                for mu in mus:
+                    if self.reduced_problem.N >= self.Nmax:
+                        break
+                    self.truth_problem.set_mu(mu)
+
+                    print("truth solve for mu =", self.truth_problem.mu)
+                    snapshot = self.truth_problem.solve()
+                    self.truth_problem.export_solution(self.folder["snapshots"], "truth_" + str(iteration), snapshot)
+                    snapshot = self.postprocess_snapshot(snapshot, iteration)
+
+                    print("update basis matrix")
+                    self.update_basis_matrix(snapshot)
+                    iteration += 1
 
-                print("update basis matrix")
-                self.update_basis_matrix(snapshot)
-                iteration += 1
+                    # Further parameters of the batch are recorded only once actually added to the basis
+                    if mu is not mus[0]:
+                        self.greedy_selected_parameters.append(mu)
+                        self.greedy_selected_parameters.save(self.folder["post_processing"], "mu_greedy")
 
                 print("build reduced operators")
-                self.reduced_problem.build_reduced_operators()
+                with self._projections_cache.use():
+                    self.reduced_problem.build_reduced_operators()
 
                 print("reduced order solve")
                 self.reduced_problem.solve()
 
                 print("build operators for error estimation")
-                self.reduced_problem.build_error_estimation_operators()
+                with self._projections_cache.use():
+                    self.reduced_problem.build_error_estimation_operators()
 
                 (absolute_error_estimator_max, relative_error_estimator_max) = self.greedy()
                 print("maximum absolute error estimator over training set =", absolute_error_estimator_max)
@@ -169,20 +232,26 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 print("absolute error for current mu =", self.reduced_problem.compute_error())
                 print("absolute error estimator for current mu =", self.reduced_problem.estimate_error())
 
-            # Carry out the actual greedy search
-            def solve_and_estimate_error(mu):
-                self.reduced_problem.set_mu(mu)
-                self.reduced_problem.solve()
-                error_estimator = self.reduced_problem.estimate_error()
-                logger.log(DEBUG, "Error estimator for mu = " + str(mu) + " is " + str(error_estimator))
-                return error_estimator
+            # Carry out the actual greedy search, solving and estimating the error for all parameters at once
+            def solve_and_estimate_error_batch(mus):
+                error_estimators = self.reduced_problem.solve_and_estimate_error_batch(mus)
+                for (mu, error_estimator) in zip(mus, error_estimators):
+                    logger.log(DEBUG, "Error estimator for mu = " + str(mu) + " is " + str(error_estimator))
+                return error_estimators
 
             if self.reduced_problem.N == 0:
                 print("find initial mu")
             else:
                 print("find next mu")
 
-            return self.training_set.max(solve_and_estimate_error)
+            if self.greedy_batch_size > 1:
+                (error_estimators, error_estimator_argmaxes) = self.training_set.max_k_batch(
+                    solve_and_estimate_error_batch, self.greedy_batch_size, min_distance=self.greedy_batch_min_distance,
+                    lazy=self.greedy_lazy)
+                self._greedy_batch = [self.training_set[i] for i in error_estimator_argmaxes[1:]]
+                return (error_estimators[0], error_estimator_argmaxes[0])
+            else:
+                return self.training_set.max_batch(solve_and_estimate_error_batch, lazy=self.greedy_lazy)
 
         def error_analysis(self, N_generator=None, filename=None, **kwargs):
             """
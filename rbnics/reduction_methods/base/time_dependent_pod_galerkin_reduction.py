@@ -93,12 +93,14 @@ def TimeDependentPODGalerkinReduction(DifferentialProblemReductionMethod_Derived
                         inner_product = self.truth_problem.inner_product[component][0]
                         self.POD_time_trajectory[component] = ProperOrthogonalDecomposition(
                             self.truth_problem.V, inner_product)
+                        self.POD_time_trajectory[component].set_parameters(self.POD_parameters)
                 else:
                     assert len(self.truth_problem.inner_product) == 1
                     # the affine expansion storage contains only the inner product matrix
                     inner_product = self.truth_problem.inner_product[0]
                     self.POD_time_trajectory = ProperOrthogonalDecomposition(
                         self.truth_problem.V, inner_product)
+                    self.POD_time_trajectory.set_parameters(self.POD_parameters)
 
             # Return
             return output
@@ -39,6 +39,8 @@ def TimeDependentRBReduction(DifferentialProblemReductionMethod_DerivedClass):
             # POD_basis: ProperOrthogonalDecomposition (for problems with one component)
             # or dict of ProperOrthogonalDecomposition (for problem with several components)
             self.POD_basis = None
+            # Parameters of the algorithm used to compute the POD modes
+            self.POD_parameters = dict()
             # POD-Greedy size
             self.N1 = 0
             self.N2 = 0
@@ -115,6 +117,10 @@ def TimeDependentRBReduction(DifferentialProblemReductionMethod_DerivedClass):
 
             return tol
 
+        # OFFLINE: set parameters of the algorithm used to compute the POD modes (e.g., incremental POD)
+        def set_POD_parameters(self, parameters):
+            self.POD_parameters.update(parameters)
+
         # Initialize data structures required for the offline phase
         def _init_offline(self):
             # Call parent to initialize inner product
@@ -134,16 +140,20 @@ def TimeDependentRBReduction(DifferentialProblemReductionMethod_DerivedClass):
                     inner_product = self.truth_problem.inner_product[component][0]
                     self.POD_time_trajectory[component] = ProperOrthogonalDecomposition(
                         self.truth_problem.V, inner_product)
+                    self.POD_time_trajectory[component].set_parameters(self.POD_parameters)
                     if self.POD_greedy_basis_extension == "POD":
                         self.POD_basis[component] = ProperOrthogonalDecomposition(
                             self.truth_problem.V, inner_product)
+                        self.POD_basis[component].set_parameters(self.POD_parameters)
             else:
                 assert len(self.truth_problem.inner_product) == 1
                 # the affine expansion storage contains only the inner product matrix
                 inner_product = self.truth_problem.inner_product[0]
                 self.POD_time_trajectory = ProperOrthogonalDecomposition(self.truth_problem.V, inner_product)
+                self.POD_time_trajectory.set_parameters(self.POD_parameters)
                 if self.POD_greedy_basis_extension == "POD":
                     self.POD_basis = ProperOrthogonalDecomposition(self.truth_problem.V, inner_product)
+                    self.POD_basis.set_parameters(self.POD_parameters)
 
             # Return
             return output
@@ -287,12 +297,22 @@ def TimeDependentRBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 logger.log(DEBUG, "Error estimator for mu = " + str(mu) + " is " + str(error_estimator))
                 return error_estimator
 
+            def solve_and_estimate_error_batch(mus):
+                return [solve_and_estimate_error(mu) for mu in mus]
+
             if self.reduced_problem.N == 0:
                 print("find initial mu")
             else:
                 print("find next mu")
 
-            return self.training_set.max(solve_and_estimate_error)
+            if self.greedy_batch_size > 1:
+                (error_estimators, error_estimator_argmaxes) = self.training_set.max_k_batch(
+                    solve_and_estimate_error_batch, self.greedy_batch_size, min_distance=self.greedy_batch_min_distance,
+                    lazy=self.greedy_lazy)
+                self._greedy_batch = [self.training_set[i] for i in error_estimator_argmaxes[1:]]
+                return (error_estimators[0], error_estimator_argmaxes[0])
+            else:
+                return self.training_set.max_batch(solve_and_estimate_error_batch, lazy=self.greedy_lazy)
 
         # Compute the error of the reduced order approximation with respect to the full order one
         # over the testing set
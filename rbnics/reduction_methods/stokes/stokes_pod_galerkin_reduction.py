@@ -30,9 +30,11 @@ class StokesPODGalerkinReduction(StokesPODGalerkinReduction_Base):
         for component in ("u", "p"):
             inner_product = self.truth_problem.inner_product[component][0]
             self.POD[component] = ProperOrthogonalDecomposition(self.truth_problem.V, inner_product)
+            self.POD[component].set_parameters(self.POD_parameters)
         for component in ("s", ):
             inner_product = self.truth_problem.inner_product[component][0]
             self.POD[component] = ProperOrthogonalDecomposition(self.truth_problem.V, inner_product, component="s")
+            self.POD[component].set_parameters(self.POD_parameters)
 
         # Return
         return output
@@ -33,10 +33,12 @@ class StokesOptimalControlPODGalerkinReduction(StokesOptimalControlPODGalerkinRe
             inner_product = self.truth_problem.inner_product[component][0]
             self.POD[component] = ProperOrthogonalDecomposition(
                 self.truth_problem.V, inner_product)
+            self.POD[component].set_parameters(self.POD_parameters)
         for component in ("s", "r"):
             inner_product = self.truth_problem.inner_product[component][0]
             self.POD[component] = ProperOrthogonalDecomposition(
                 self.truth_problem.V, inner_product, component=component)
+            self.POD[component].set_parameters(self.POD_parameters)
 
         # Return
         return output
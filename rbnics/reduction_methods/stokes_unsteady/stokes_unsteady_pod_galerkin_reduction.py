@@ -30,10 +30,12 @@ def AbstractCFDUnsteadyPODGalerkinReduction(
                     inner_product = self.truth_problem.inner_product[component][0]
                     self.POD_time_trajectory[component] = ProperOrthogonalDecomposition(
                         self.truth_problem.V, inner_product)
+                    self.POD_time_trajectory[component].set_parameters(self.POD_parameters)
                 for component in ("s", ):
                     inner_product = self.truth_problem.inner_product[component][0]
                     self.POD_time_trajectory[component] = ProperOrthogonalDecomposition(
                         self.truth_problem.V, inner_product, component="s")
+                    self.POD_time_trajectory[component].set_parameters(self.POD_parameters)
 
             # Return
             return output
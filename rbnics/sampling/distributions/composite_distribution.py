@@ -4,6 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import empty
 from rbnics.sampling.distributions.distribution import Distribution
 from rbnics.sampling.distributions.equispaced_distribution import EquispacedDistribution
 
@@ -19,7 +20,7 @@ class CompositeDistribution(Distribution):
                 self.distribution_to_components[distribution] = list()
             self.distribution_to_components[distribution].append(p)
 
-    def sample(self, box, n):
+    def sample_array(self, box, n):
         # Divide box among the different distributions
         distribution_to_sub_box = dict()
         for (distribution, components) in self.distribution_to_components.items():
@@ -30,7 +31,7 @@ class CompositeDistribution(Distribution):
         for (distribution, sub_box) in distribution_to_sub_box.items():
             if isinstance(distribution, EquispacedDistribution):
                 sub_box = distribution_to_sub_box[distribution]
-                sub_set = distribution.sample(sub_box, n)
+                sub_set = distribution.sample_array(sub_box, n)
                 n = len(sub_set)  # may be greater or equal than the one originally provided
                 components = self.distribution_to_components[distribution]
                 components_to_sub_set[tuple(components)] = sub_set
@@ -39,15 +40,11 @@ class CompositeDistribution(Distribution):
         for (distribution, sub_box) in distribution_to_sub_box.items():
             if not isinstance(distribution, EquispacedDistribution):
                 components = self.distribution_to_components[distribution]
-                components_to_sub_set[tuple(components)] = distribution.sample(sub_box, n)
-        # Prepare a list that will store the set [mu_1, ... mu_n] ...
-        set_as_list = [[None] * len(box) for _ in range(n)]
+                components_to_sub_set[tuple(components)] = distribution.sample_array(sub_box, n)
+        # Prepare an array that will store the set [mu_1, ... mu_n] ...
+        set_ = empty((n, len(box)))
+        # ... and fill in the components associated to each distribution
         for (components, sub_set) in components_to_sub_set.items():
-            assert len(sub_set) == n
-            for (index, sub_mu) in enumerate(sub_set):
-                assert len(components) == len(sub_mu)
-                for (p, sub_mu_p) in zip(components, sub_mu):
-                    set_as_list[index][p] = sub_mu_p
-        # ... and convert each mu to a tuple
-        set_ = [tuple(mu) for mu in set_as_list]
+            assert sub_set.shape == (n, len(components))
+            set_[:, components] = sub_set
         return set_
@@ -4,6 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import asarray, rint
 from rbnics.sampling.distributions.distribution import Distribution
 
 
@@ -12,13 +13,8 @@ class DiscreteDistribution(Distribution):
         self.distribution = distribution
         self.box_step_size = box_step_size
 
-    def sample(self, box, n):
+    def sample_array(self, box, n):
         assert len(box) == len(self.box_step_size)
-        set_ = self.distribution.sample(box, n)
-        rounded_set = list()
-        for mu in set_:
-            rounded_mu = list()
-            for (p, step_size) in enumerate(self.box_step_size):
-                rounded_mu.append(round(mu[p] / step_size) * step_size)
-            rounded_set.append(tuple(rounded_mu))
-        return rounded_set
+        set_ = self.distribution.sample_array(box, n)
+        step_size = asarray(self.box_step_size, dtype=float)
+        return rint(set_ / step_size) * step_size
@@ -4,13 +4,21 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from abc import ABCMeta, abstractmethod
+from abc import ABCMeta
+from numpy import asarray
 
 
 class Distribution(object, metaclass=ABCMeta):
-    @abstractmethod
+    # Distributions need to override at least one between sample (returning a list of tuples)
+    # and sample_array (returning a (n, P) array), the other one being deduced from it
     def sample(self, box, n):
-        raise NotImplementedError("The method sample is distribution-specific and needs to be overridden.")
+        return [tuple(mu) for mu in self.sample_array(box, n).tolist()]
+
+    def sample_array(self, box, n):
+        if type(self).sample is Distribution.sample:
+            raise NotImplementedError("The method sample is distribution-specific and needs to be overridden.")
+        set_ = self.sample(box, n)
+        return asarray(set_, dtype=float).reshape(len(set_), len(box))
 
     # Override the following methods to use a Distribution as a dict key
     def __hash__(self):
@@ -4,6 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import asarray
 from rbnics.sampling.distributions.distribution import Distribution
 
 
@@ -13,11 +14,11 @@ class DrawFrom(Distribution):
         self.args = args
         self.kwargs = kwargs
 
-    def sample(self, box, n):
-        set_ = list()  # of tuples
-        for i in range(n):
-            mu = list()  # of numbers
-            for box_p in box:
-                mu.append(box_p[0] + self.generator(*self.args, **self.kwargs) * (box_p[1] - box_p[0]))
-            set_.append(tuple(mu))
-        return set_
+    def sample_array(self, box, n):
+        try:
+            unit_set = self.generator(*self.args, size=(n, len(box)), **self.kwargs)
+        except TypeError:  # generator cannot draw several samples at once
+            unit_set = [[self.generator(*self.args, **self.kwargs) for _ in box] for _ in range(n)]
+        unit_set = asarray(unit_set, dtype=float).reshape(n, len(box))
+        box = asarray(box, dtype=float).reshape(len(box), 2)
+        return box[:, 0] + unit_set * (box[:, 1] - box[:, 0])
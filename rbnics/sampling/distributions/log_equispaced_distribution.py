@@ -4,7 +4,8 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from math import exp, log
+from math import log
+from numpy import exp
 from rbnics.sampling.distributions.distribution import Distribution
 from rbnics.sampling.distributions.equispaced_distribution import EquispacedDistribution
 
@@ -13,7 +14,7 @@ class LogEquispacedDistribution(Distribution):
     def __init__(self):
         self.equispaced_distribution = EquispacedDistribution()
 
-    def sample(self, box, n):
+    def sample_array(self, box, n):
         log_box = [(log(box_p[0]), log(box_p[1])) for box_p in box]
-        log_set = self.equispaced_distribution.sample(log_box, n)
-        return [tuple(exp(log_mu_p) for log_mu_p in log_mu) for log_mu in log_set]
+        log_set = self.equispaced_distribution.sample_array(log_box, n)
+        return exp(log_set)
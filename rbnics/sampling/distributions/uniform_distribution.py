@@ -9,11 +9,6 @@ from rbnics.sampling.distributions.distribution import Distribution
 
 
 class UniformDistribution(Distribution):
-    def sample(self, box, n):
-        set_ = list()  # of tuples
-        for i in range(n):
-            mu = list()  # of numbers
-            for box_p in box:
-                mu.append(random.uniform(box_p[0], box_p[1]))
-            set_.append(tuple(mu))
-        return set_
+    def sample_array(self, box, n):
+        # Draws are carried out row by row, i.e. in the same order as sampling one parameter at a time
+        return random.uniform([box_p[0] for box_p in box], [box_p[1] for box_p in box], size=(n, len(box)))
@@ -4,34 +4,168 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-import operator  # to find closest parameters
+import os
 from math import sqrt
 from mpi4py.MPI import COMM_WORLD
 from numpy import zeros as array
-from numpy import argmax
+from numpy import argmax, argsort, asarray, concatenate, fromiter, full, inf, log, ndarray, partition
+from numpy.linalg import norm
+from scipy.spatial import cKDTree
 from rbnics.sampling.distributions import CompositeDistribution, UniformDistribution
 from rbnics.utils.decorators import overload
 from rbnics.utils.io import ExportableList
-from rbnics.utils.mpi import parallel_io as parallel_generate, parallel_max
+from rbnics.utils.mpi import parallel_io as parallel_generate, parallel_max, parallel_schedule
 
 
 class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
     def __init__(self):
         ExportableList.__init__(self, "text")
+        # Parameters are stored as rows of a (n, P) array, and are converted to tuples only when accessed.
+        # Parameters which are not tuples of floats (e.g. parameters enlarged with time, or provided as integers)
+        # are rather stored in self._list, in which case self._array is None
+        self._array = None
+        # Spatial index for nearest neighbour queries, built on first query and discarded on each change
+        self._tree = None
+        self._distance_metric = None
         self.mpi_comm = COMM_WORLD
         self.distributed_max = True
+        # Last known values (and postprocessed values) in lazy maximum computations
+        self._lazy_list = None
+        self._lazy_values = None
+        self._lazy_values_with_postprocessing = None
 
     @overload
     def __getitem__(self, key: int):
-        return self._list[key]
+        if self._array is not None:
+            return tuple(self._array[key].tolist())
+        else:
+            return self._list[key]
 
     @overload
     def __getitem__(self, key: slice):
+        output = self._new_subset()
+        if self._array is not None:
+            output._array = self._array[key].copy()
+        else:
+            output._list = self._list[key]
+        return output
+
+    def __setitem__(self, key, item):
+        self._tree = None
+        if self._array is not None and _is_parameter(item, self._array.shape[1]):
+            self._array[key] = item
+        else:
+            self._convert_to_list()
+            self._list[key] = item
+
+    def __iter__(self):
+        if self._array is not None:
+            return iter(_to_tuples(self._array))
+        else:
+            return iter(self._list)
+
+    def __len__(self):
+        if self._array is not None:
+            return self._array.shape[0]
+        else:
+            return len(self._list)
+
+    def __str__(self):
+        return str(list(self))
+
+    def append(self, element):
+        self._extend([element])
+
+    def extend(self, other_list):
+        if isinstance(other_list, ParameterSpaceSubset) and other_list._array is not None:
+            self._extend(other_list._array)
+        else:
+            self._extend(list(other_list))
+
+    def clear(self):
+        self._array = None
+        self._tree = None
+        self._list = list()
+
+    def save(self, directory, filename):
+        self._FileIO.save_file(list(self), directory, filename)
+
+    def load(self, directory, filename):
+        if len(self) > 0:  # avoid loading multiple times
+            return False
+        if self._FileIO.exists_file(directory, filename):
+            self._extend(self._load_file(directory, filename))
+            return True
+        else:
+            raise OSError
+
+    def _load_file(self, directory, filename):
+        # Evaluating the content of the file is very slow for large sets: first try to parse it directly,
+        # assuming that it contains a list of tuples of numbers, and fall back to evaluation otherwise
+        if os.path.splitext(filename)[1] == "":
+            filename = filename + ".txt"
+        with open(os.path.join(str(directory), filename), "r") as infile:
+            content = infile.read().strip()
+        if content.startswith("[") and content.endswith("]"):
+            n = content.count("(")
+            tokens = content.translate(_brackets_to_spaces).replace(",", " ").split()
+            try:
+                values = asarray(tokens, dtype=float)
+            except ValueError:
+                pass
+            else:
+                if not all(_is_float_literal(token) for token in tokens):  # e.g. integers, which must be kept as such
+                    return self._FileIO.load_file(directory, filename)
+                if n > 0 and values.size % n == 0:
+                    P = values.size // n
+                    # The number of commas is (n - 1) to separate tuples, plus P - 1 (or 1 if P == 1) in each tuple
+                    if content.count(",") == n - 1 + n * (P - 1 if P != 1 else 1):
+                        return values.reshape(n, P)
+                elif n == 0 and values.size == 0:
+                    return list()
+        return self._FileIO.load_file(directory, filename)
+
+    def _extend(self, parameters):
+        if len(parameters) == 0:
+            return
+        self._tree = None
+        parameters_array = _to_array(parameters)
+        if parameters_array is not None and len(self._list) == 0 and (
+                self._array is None or self._array.shape[1] == parameters_array.shape[1]):
+            if self._array is None:
+                self._array = parameters_array
+            else:
+                self._array = concatenate((self._array, parameters_array))
+        else:
+            self._convert_to_list()
+            if isinstance(parameters, ndarray):
+                parameters = _to_tuples(parameters)
+            self._list.extend(parameters)
+
+    def _convert_to_list(self):
+        if self._array is not None:
+            self._tree = None
+            self._list = _to_tuples(self._array)
+            self._array = None
+
+    def _parameters(self, indices):
+        if self._array is not None:
+            return _to_tuples(self._array[indices])
+        else:
+            return [self._list[i] for i in indices]
+
+    def _new_subset(self):
         output = ParameterSpaceSubset()
         output.distributed_max = self.distributed_max
-        output._list = self._list[key]
+        output._distance_metric = self._distance_metric
         return output
 
+    def _storage(self):
+        if self._array is not None:
+            return self._array
+        else:
+            return self._list
+
     # Method for generation of parameter space subsets
     def generate(self, box, n, sampling=None):
         if len(box) > 0:
@@ -42,32 +176,46 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
                 sampling = CompositeDistribution(sampling)
 
             def run_sampling():
-                return sampling.sample(box, n)
+                return sampling.sample_array(box, n)
 
-            self._list = parallel_generate(run_sampling, self.mpi_comm)
+            self.clear()
+            self._extend(parallel_generate(run_sampling, self.mpi_comm))
         else:
-            for i in range(n):
-                self._list.append(tuple())
+            self._extend([tuple()] * n)
 
     def max(self, generator, postprocessor=None):
+        def batch_generator(mus):
+            return [generator(mu) for mu in mus]
+
+        return self.max_batch(batch_generator, postprocessor)
+
+    def max_batch(self, batch_generator, postprocessor=None, lazy=False):
+        """
+        Same as max(), but batch_generator is called with lists of (local) parameters, rather than with one
+        parameter at a time, and must return the list of the corresponding values.
+        If lazy is True, values computed by the previous call are assumed to be upper bounds of the current ones
+        (e.g., error estimators which do not increase when the reduced basis is enriched), and only parameters
+        whose previous value is larger than the current maximum are evaluated again, in batches of increasing size.
+        """
         if postprocessor is None:
             def postprocessor(value):
                 return value
-        if self.distributed_max:
-            local_list_indices = list(range(self.mpi_comm.rank, len(self._list), self.mpi_comm.size))
-            # start from index rank and take steps of length equal to size
+        if lazy:
+            (local_list_indices, values, values_with_postprocessing) = self._evaluate_batch_lazily(
+                batch_generator, postprocessor, 1)
         else:
-            local_list_indices = list(range(len(self._list)))
-        values = array(len(local_list_indices))
-        values_with_postprocessing = array(len(local_list_indices))
-        for i in range(len(local_list_indices)):
-            values[i] = generator(self._list[local_list_indices[i]])
-            values_with_postprocessing[i] = postprocessor(values[i])
-        if self.distributed_max:
-            local_i_max = argmax(values_with_postprocessing)
-            local_value_max = values[local_i_max]
+            (local_list_indices, values, values_with_postprocessing) = self._evaluate_batch(
+                batch_generator, postprocessor)
+        if self.distributed_max and not lazy:
+            if len(local_list_indices) > 0:
+                # argmax picks the first maximum: make sure that it is the one with the smallest index
+                local_order = argsort(local_list_indices, kind="stable")
+                local_i_max = local_order[argmax(values_with_postprocessing[local_order])]
+                (local_value_max, local_arg_max) = (values[local_i_max], local_list_indices[local_i_max])
+            else:  # all parameters have been evaluated by other processes
+                (local_value_max, local_arg_max) = (None, None)
             (global_value_max, global_i_max) = parallel_max(
-                local_value_max, local_list_indices[local_i_max], postprocessor, self.mpi_comm)
+                local_value_max, (local_arg_max, ), postprocessor, self.mpi_comm)
             assert isinstance(global_i_max, tuple)
             assert len(global_i_max) == 1
             global_i_max = global_i_max[0]
@@ -76,35 +224,270 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
             global_value_max = values[global_i_max]
         return (global_value_max, global_i_max)
 
+    def max_k_batch(self, batch_generator, k, postprocessor=None, min_distance=0., lazy=False):
+        """
+        Same as max_batch(), but returns the lists of the k largest values and of their indices, sorted by
+        decreasing value. If min_distance is positive, parameters closer than min_distance to an already
+        selected parameter are discarded, so that selected parameters are spread apart in the parameter space.
+        Less than k values may be returned if there are not enough parameters satisfying such constraint.
+        If lazy is True, only parameters whose previous value is larger than the current k-th largest value
+        are evaluated again (see max_batch()).
+        """
+        assert k > 0
+        if postprocessor is None:
+            def postprocessor(value):
+                return value
+        if lazy:
+            (local_list_indices, values, values_with_postprocessing) = self._evaluate_batch_lazily(
+                batch_generator, postprocessor, k)
+        else:
+            (local_list_indices, values, values_with_postprocessing) = self._evaluate_batch(
+                batch_generator, postprocessor)
+
+        def candidate_key(candidate):
+            # Sort by decreasing value, breaking ties by increasing index
+            return (- candidate[0], candidate[2])
+
+        candidates = sorted(zip(values_with_postprocessing, values, local_list_indices), key=candidate_key)
+        if self.distributed_max and not lazy:
+            # Gather only the k largest local candidates of each process at a time. Further candidates are gathered
+            # only if some of the gathered ones are discarded because of min_distance, and selection is carried out
+            # only among the gathered candidates which are preceded by all candidates of all processes
+            gathered_candidates = list()
+            offset = 0
+            while True:
+                local_candidates = candidates[offset:offset + k]
+                offset += k
+                local_exhausted = offset >= len(candidates)
+                process_bounds = list()
+                for (process_candidates, process_exhausted) in self.mpi_comm.allgather(
+                        (local_candidates, local_exhausted)):
+                    gathered_candidates.extend(process_candidates)
+                    if not process_exhausted:
+                        process_bounds.append(candidate_key(process_candidates[-1]))
+                gathered_candidates.sort(key=candidate_key)
+                if len(process_bounds) > 0:
+                    bound = min(process_bounds)
+                    complete_candidates = [
+                        candidate for candidate in gathered_candidates if candidate_key(candidate) <= bound]
+                else:
+                    complete_candidates = gathered_candidates
+                (selected_values, selected_indices) = self._select_k(complete_candidates, k, min_distance)
+                if len(selected_indices) == k or len(process_bounds) == 0:
+                    return (selected_values, selected_indices)
+        else:
+            return self._select_k(candidates, k, min_distance)
+
+    def _select_k(self, sorted_candidates, k, min_distance):
+        selected_values = list()
+        selected_indices = list()
+        for (_, value, i) in sorted_candidates:
+            if len(selected_indices) == k:
+                break
+            if min_distance > 0. and any(
+                    sqrt(sum([(x - y)**2 for (x, y) in zip(self[i], self[j])])) < min_distance
+                    for j in selected_indices):
+                continue
+            selected_values.append(value)
+            selected_indices.append(i)
+        return (selected_values, selected_indices)
+
+    def _evaluate_batch(self, batch_generator, postprocessor):
+        if self.distributed_max and self.mpi_comm.size > 1:
+            # chunks of parameters are assigned to processes as soon as they are done with the previous one,
+            # so that processes evaluating cheaper parameters do not wait idle for the other ones
+            local_list_indices = list()
+            local_values = list()
+            for chunk in parallel_schedule(len(self), mpi_comm=self.mpi_comm):
+                chunk_values = batch_generator(self._parameters(chunk))
+                assert len(chunk_values) == len(chunk)
+                local_list_indices.extend(chunk)
+                local_values.extend(chunk_values)
+        else:
+            local_list_indices = list(range(len(self)))
+            local_values = batch_generator(self._parameters(local_list_indices))
+            assert len(local_values) == len(local_list_indices)
+        values = array(len(local_list_indices))
+        values_with_postprocessing = array(len(local_list_indices))
+        for i in range(len(local_list_indices)):
+            values[i] = local_values[i]
+            values_with_postprocessing[i] = postprocessor(values[i])
+        return (local_list_indices, values, values_with_postprocessing)
+
+    def _evaluate_batch_lazily(self, batch_generator, postprocessor, k):
+        # Values of all parameters are returned on every process, where parameters which have not been evaluated
+        # again carry their previous value, which is an upper bound of the current one
+        n = len(self)
+        if self._lazy_list is not self._storage() or len(self._lazy_values) != n:
+            # Nothing is known yet: evaluate all parameters at once
+            self._lazy_list = self._storage()
+            self._lazy_values = full(n, inf)
+            self._lazy_values_with_postprocessing = full(n, inf)
+            batch_size = n
+        else:
+            batch_size = self.mpi_comm.size if self.distributed_max else 1
+        values = self._lazy_values
+        values_with_postprocessing = self._lazy_values_with_postprocessing
+        candidates = argsort(- values_with_postprocessing, kind="stable")
+        evaluated = list()
+        p = 0
+        while p < n:
+            # Stop as soon as no previous value can be larger than the k-th largest current one
+            if len(evaluated) >= k:
+                current_values = values_with_postprocessing[evaluated]
+                if values_with_postprocessing[candidates[p]] <= partition(current_values, - k)[- k]:
+                    break
+            batch = candidates[p:p + batch_size]
+            if self.distributed_max:
+                local_batch = batch[self.mpi_comm.rank::self.mpi_comm.size]
+                local_values = (
+                    batch_generator(self._parameters(local_batch)) if len(local_batch) > 0 else list())
+                assert len(local_values) == len(local_batch)
+                batch_values = [
+                    (i, value) for process_batch_values in self.mpi_comm.allgather(list(zip(local_batch, local_values)))
+                    for (i, value) in process_batch_values]
+            else:
+                batch_values = list(zip(batch, batch_generator(self._parameters(batch))))
+                assert len(batch_values) == len(batch)
+            for (i, value) in batch_values:
+                values[i] = value
+                values_with_postprocessing[i] = postprocessor(value)
+            evaluated.extend(batch)
+            p += len(batch)
+            batch_size *= 2
+        return (list(range(n)), values, values_with_postprocessing)
+
     def serialize_maximum_computations(self):
         assert self.distributed_max is True
         self.distributed_max = False
 
     def diff(self, other_set):
-        output = ParameterSpaceSubset()
-        output.distributed_max = self.distributed_max
-        output._list = [mu for mu in self._list if mu not in other_set]
+        output = self._new_subset()
+        if isinstance(other_set, ParameterSpaceSubset) and other_set._array is not None:
+            other_array = other_set._array
+        else:
+            other_set = list(other_set)
+            other_array = _to_array(other_set)
+        if (self._array is not None and other_array is not None
+                and other_array.shape[1] == self._array.shape[1]):
+            # Compare the binary representation of each parameter, rather than the corresponding tuple
+            other_keys = set(_to_keys(other_array))
+            output._array = self._array[
+                fromiter((key not in other_keys for key in _to_keys(self._array)), dtype=bool, count=len(self))]
+        else:
+            try:
+                other_hashed_set = set(other_set)
+                output._extend([mu for mu in self if mu not in other_hashed_set])
+            except TypeError:  # parameters are not hashable, fall back to list membership
+                output._extend([mu for mu in self if mu not in other_set])
         return output
 
+    def set_distance_metric(self, weights=None, log_scale=None):
+        """
+        Set the metric employed to find closest parameters. Each component is first replaced by its logarithm
+        if the corresponding entry of log_scale is True (or for all components, if log_scale is True), and then
+        multiplied by the corresponding entry of weights. By default, the Euclidean distance is used.
+        """
+        self._distance_metric = (weights, log_scale)
+        self._tree = None
+
+    def _to_metric_space(self, parameters_array):
+        if self._distance_metric is None:
+            return parameters_array
+        (weights, log_scale) = self._distance_metric
+        parameters_array = parameters_array.copy()
+        if log_scale is True:
+            parameters_array = log(parameters_array)
+        elif log_scale is not None:
+            assert len(log_scale) == parameters_array.shape[1]
+            log_components = [p for (p, log_scale_p) in enumerate(log_scale) if log_scale_p]
+            parameters_array[:, log_components] = log(parameters_array[:, log_components])
+        if weights is not None:
+            assert len(weights) == parameters_array.shape[1]
+            parameters_array *= asarray(weights, dtype=float)
+        return parameters_array
+
+    def _get_tree(self):
+        if self._tree is None:
+            self._tree = cKDTree(self._to_metric_space(self._array))
+        return self._tree
+
     # M parameters in this set closest to mu
     def closest(self, M, mu):
+        return self.closest_batch(M, [mu])[0]
+
+    # M parameters in this set closest to each mu in mus
+    def closest_batch(self, M, mus):
         assert M <= len(self)
 
         # Trivial case 1:
         if M == len(self):
-            return self
-
-        output = ParameterSpaceSubset()
-        output.distributed_max = self.distributed_max
+            return [self for _ in mus]
 
         # Trivial case 2:
         if M == 0:
-            return output
-
-        parameters_and_distances = list()
-        for xi_i in self:
-            distance = sqrt(sum([(x - y)**2 for (x, y) in zip(mu, xi_i)]))
-            parameters_and_distances.append((xi_i, distance))
-        parameters_and_distances.sort(key=operator.itemgetter(1))
-        output._list = [xi_i for (xi_i, _) in parameters_and_distances[:M]]
-        return output
+            return [self._new_subset() for _ in mus]
+
+        outputs = list()
+        if self._array is not None:
+            tree = self._get_tree()
+            mus = self._to_metric_space(asarray(mus, dtype=float).reshape(len(mus), self._array.shape[1]))
+            # Get the distance of the M-th closest parameter, and then all parameters within that distance:
+            # parameters at the same distance are sorted by index, as a stable sort of the whole set would do
+            (distances, _) = tree.query(mus, k=[M])
+            candidates = tree.query_ball_point(mus, distances[:, 0] * (1. + 1.e-12))
+            for (mu, candidates_mu) in zip(mus, candidates):
+                candidates_mu = asarray(sorted(candidates_mu), dtype=int)
+                distances_mu = norm(tree.data[candidates_mu] - mu, axis=1)
+                output = self._new_subset()
+                output._array = self._array[candidates_mu[argsort(distances_mu, kind="stable")[:M]]]
+                outputs.append(output)
+        else:
+            # Parameters are not stored as floats, but distances are still computed in the metric space
+            P = len(self._list[0])
+            parameters_array = self._to_metric_space(asarray(self._list, dtype=float).reshape(len(self._list), P))
+            mus = self._to_metric_space(asarray(mus, dtype=float).reshape(len(mus), P))
+            for mu in mus:
+                distances_mu = norm(parameters_array - mu, axis=1)
+                output = self._new_subset()
+                output._list = [self._list[i] for i in argsort(distances_mu, kind="stable")[:M]]
+                outputs.append(output)
+        return outputs
+
+
+_brackets_to_spaces = str.maketrans("[]()", "    ")
+
+
+def _is_parameter(mu, P):
+    return isinstance(mu, tuple) and len(mu) == P and all(isinstance(mu_p, float) for mu_p in mu)
+
+
+def _is_float_literal(token):
+    # Floats are always written with a decimal point or an exponent (or as inf and nan), integers are not
+    return any(character in token for character in ".eEn")
+
+
+def _to_array(parameters):
+    # Convert parameters to a (n, P) array, or return None if they are not all tuples of floats,
+    # so that the type of parameters which are not stored as floats (e.g. integers) is preserved
+    if isinstance(parameters, ndarray):
+        assert len(parameters.shape) == 2
+        return asarray(parameters, dtype=float)
+    if len(parameters) == 0 or not all(
+            isinstance(mu, tuple) and all(isinstance(mu_p, float) for mu_p in mu) for mu in parameters):
+        return None
+    try:
+        parameters_array = asarray(parameters, dtype=float)
+    except (TypeError, ValueError):  # e.g. tuples of different lengths, or of objects which are not numbers
+        return None
+    return parameters_array.reshape(len(parameters), len(parameters[0]))
+
+
+def _to_keys(parameters_array):
+    # Adding zero replaces negative zeros by positive ones, so that their binary representations coincide
+    for mu in parameters_array + 0.:
+        yield mu.tobytes()
+
+
+def _to_tuples(parameters_array):
+    return [tuple(mu) for mu in parameters_array.tolist()]
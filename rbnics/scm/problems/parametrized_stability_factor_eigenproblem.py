@@ -59,7 +59,8 @@ class ParametrizedStabilityFactorEigenProblem(ParametrizedProblem):
             key_generator=_eigenvalue_cache_key_generator,
             import_=_eigenvalue_cache_import,
             export=_eigenvalue_cache_export,
-            filename_generator=_eigenvalue_cache_filename_generator
+            filename_generator=_eigenvalue_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
         def _eigenvector_cache_key_generator(*args, **kwargs):
@@ -80,7 +81,8 @@ class ParametrizedStabilityFactorEigenProblem(ParametrizedProblem):
             key_generator=_eigenvector_cache_key_generator,
             import_=_eigenvector_cache_import,
             export=_eigenvector_cache_export,
-            filename_generator=_eigenvector_cache_filename_generator
+            filename_generator=_eigenvector_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
     def init(self):
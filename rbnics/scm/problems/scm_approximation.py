@@ -6,7 +6,7 @@
 
 import os
 import hashlib
-from rbnics.backends import export, import_, LinearProgramSolver
+from rbnics.backends import BatchedLinearProgramSolver, export, import_, LinearProgramSolver
 from rbnics.backends.common.linear_program_solver import Error as LinearProgramSolverError, Matrix, Vector
 from rbnics.problems.base import ParametrizedProblem
 from rbnics.utils.cache import Cache
@@ -33,6 +33,9 @@ class SCMApproximation(ParametrizedProblem):
         self.training_set = None  # SCM algorithm needs the training set also in the online stage
         # greedy_selected_parameters: list storing the parameters selected during the training phase
         self.greedy_selected_parameters = GreedySelectedParametersList()
+        # greedy_selected_parameters_subset: dict, over N, of list storing the first N parameters
+        # selected during the training phase
+        self.greedy_selected_parameters_subset = dict()
         # greedy_selected_parameters_complement: dict, over N, of list storing the complement of parameters
         # selected during the training phase
         self.greedy_selected_parameters_complement = dict()
@@ -41,6 +44,9 @@ class SCMApproximation(ParametrizedProblem):
         self.upper_bound_vectors = UpperBoundsList()
         self.N = 0
 
+        # Linear program solver parameters
+        self._linear_program_solver_parameters = dict()
+
         # Storage for online computations
         self._stability_factor_lower_bound = 0.
         self._stability_factor_upper_bound = 0.
@@ -73,7 +79,8 @@ class SCMApproximation(ParametrizedProblem):
             key_generator=_stability_factor_cache_key_generator,
             import_=_stability_factor_lower_bound_cache_import,
             export=_stability_factor_lower_bound_cache_export,
-            filename_generator=_stability_factor_cache_filename_generator
+            filename_generator=_stability_factor_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
         def _stability_factor_upper_bound_cache_import(filename):
@@ -88,7 +95,8 @@ class SCMApproximation(ParametrizedProblem):
             key_generator=_stability_factor_cache_key_generator,
             import_=_stability_factor_upper_bound_cache_import,
             export=_stability_factor_upper_bound_cache_export,
-            filename_generator=_stability_factor_cache_filename_generator
+            filename_generator=_stability_factor_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
         # Stability factor eigen problem
@@ -109,6 +117,8 @@ class SCMApproximation(ParametrizedProblem):
             self.bounding_box_max.load(self.folder["reduced_operators"], "bounding_box_max")
             self.training_set.load(self.folder["reduced_operators"], "training_set")
             self.greedy_selected_parameters.load(self.folder["reduced_operators"], "greedy_selected_parameters")
+            self.greedy_selected_parameters_subset.clear()
+            self.greedy_selected_parameters_complement.clear()
             self.upper_bound_vectors.load(self.folder["reduced_operators"], "upper_bound_vectors")
             # Set the value of N
             self.N = len(self.greedy_selected_parameters)
@@ -129,6 +139,11 @@ class SCMApproximation(ParametrizedProblem):
     def evaluate_stability_factor(self):
         return self.stability_factor_calculator.solve()
 
+    # Set the parameters of the solver of the linear programs for the stability factor lower bound,
+    # e.g. {"solver": "highs", "batch_size": 16}
+    def set_linear_program_solver_parameters(self, parameters):
+        self._linear_program_solver_parameters = dict(parameters)
+
     # Get a lower bound for the stability factor
     def get_stability_factor_lower_bound(self, N=None):
         if N is None:
@@ -140,33 +155,102 @@ class SCMApproximation(ParametrizedProblem):
             self._stability_factor_lower_bound_cache[self.mu, N] = self._stability_factor_lower_bound
         return self._stability_factor_lower_bound
 
+    # Get lower bounds for the stability factor at several parameters, solving all linear programs at once
+    def get_stability_factor_lower_bounds(self, mus, N=None):
+        if N is None:
+            N = self.N
+        mu_bak = self.mu
+        stability_factor_lower_bounds = [None] * len(mus)
+        missing_indices = list()
+        for (i, mu) in enumerate(mus):
+            self.set_mu(mu)
+            try:
+                stability_factor_lower_bounds[i] = self._stability_factor_lower_bound_cache[self.mu, N]
+            except KeyError:
+                missing_indices.append(i)
+        if len(missing_indices) > 0:
+            missing_stability_factor_lower_bounds = self._get_stability_factor_lower_bounds(
+                [mus[i] for i in missing_indices], N)
+            for (i, stability_factor_lower_bound) in zip(missing_indices, missing_stability_factor_lower_bounds):
+                self.set_mu(mus[i])
+                self._stability_factor_lower_bound_cache[self.mu, N] = stability_factor_lower_bound
+                stability_factor_lower_bounds[i] = stability_factor_lower_bound
+        self.set_mu(mu_bak)
+        return stability_factor_lower_bounds
+
     def _get_stability_factor_lower_bound(self, N):
-        assert N <= len(self.greedy_selected_parameters)
-        Q = self.truth_problem.Q["stability_factor_left_hand_matrix"]
+        linear_program = LinearProgramSolver(*self._assemble_linear_program(N))
+        linear_program.set_parameters(self._linear_program_solver_parameters)
+        try:
+            stability_factor_lower_bound = linear_program.solve()
+        except LinearProgramSolverError:
+            stability_factor_lower_bound = self._linear_program_failure_fallback()
+
+        self._stability_factor_lower_bound = stability_factor_lower_bound
+
+    def _get_stability_factor_lower_bounds(self, mus, N):
+        mu_bak = self.mu
+        linear_programs = list()
+        theta_cache = dict()  # theta at parameters appearing in several linear programs are computed only once
+        # All selected parameters are among the closest ones to each mu, so that the corresponding constraints
+        # are shared by all linear programs, and are assembled only once
+        (M_e, M_p) = self._number_of_constraints(N)
+        shared_constraints = self._assemble_selected_parameters_constraints(
+            N, self.greedy_selected_parameters[:N], theta_cache)
+        all_closest_selected_parameters_complement = self._closest_unselected_parameters_batch(M_p, N, mus)
+        for (mu, closest_selected_parameters_complement) in zip(mus, all_closest_selected_parameters_complement):
+            self.set_mu(mu)
+            linear_programs.append(self._assemble_linear_program(
+                N, theta_cache, shared_constraints, closest_selected_parameters_complement))
+        batched_linear_program = BatchedLinearProgramSolver(*[list(inputs) for inputs in zip(*linear_programs)])
+        batched_linear_program.set_parameters(self._linear_program_solver_parameters)
+        stability_factor_lower_bounds = batched_linear_program.solve()
+        for (i, mu) in enumerate(mus):
+            if stability_factor_lower_bounds[i] is None:
+                self.set_mu(mu)
+                stability_factor_lower_bounds[i] = self._linear_program_failure_fallback()
+        self.set_mu(mu_bak)
+        return stability_factor_lower_bounds
+
+    def _linear_program_failure_fallback(self):
+        print("SCM warning at mu = " + str(self.mu) + ": error occured while solving linear program.")
+        print("Please consider switching to a different solver. A truth eigensolve will be performed.")
+
+        (stability_factor_lower_bound, _) = self.evaluate_stability_factor()
+        return stability_factor_lower_bound
+
+    def _compute_theta(self, theta_cache):
+        if theta_cache is None:
+            return self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
+        elif self.mu not in theta_cache:
+            theta_cache[self.mu] = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
+        return theta_cache[self.mu]
+
+    def _number_of_constraints(self, N):
         M_e = N
         M_p = min(N, len(self.training_set) - len(self.greedy_selected_parameters))
+        return (M_e, M_p)
 
-        # 1. Constrain the Q variables to be in the bounding box
-        bounds = list()  # of Q pairs
-        for q in range(Q):
-            assert self.bounding_box_min[q] <= self.bounding_box_max[q]
-            bounds.append((self.bounding_box_min[q], self.bounding_box_max[q]))
+    # Preallocate the constraints of the linear program, and fill in the first M_e rows, which are associated
+    # to the closest selected parameters
+    def _assemble_selected_parameters_constraints(self, N, closest_selected_parameters, theta_cache=None):
+        Q = self.truth_problem.Q["stability_factor_left_hand_matrix"]
+        (M_e, M_p) = self._number_of_constraints(N)
+        assert len(closest_selected_parameters) == M_e
 
-        # 2. Add three different sets of constraints.
-        #    Our constrains are of the form
-        #       a^T * x >= b
+        # Our constrains are of the form
+        #    a^T * x >= b
         constraints_matrix = Matrix(M_e + M_p + 1, Q)
         constraints_vector = Vector(M_e + M_p + 1)
 
-        # 2a. Add constraints: a constraint is added for the closest samples to mu among the selected parameters
+        # A constraint is added for the closest samples to mu among the selected parameters
         mu_bak = self.mu
-        closest_selected_parameters = self._closest_selected_parameters(M_e, N, self.mu)
         for (j, omega) in enumerate(closest_selected_parameters):
             # Overwrite parameter values
             self.set_mu(omega)
 
             # Compute theta
-            current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
+            current_theta = self._compute_theta(theta_cache)
 
             # Assemble the LHS of the constraint
             for q in range(Q):
@@ -176,16 +260,43 @@ class SCMApproximation(ParametrizedProblem):
             (constraints_vector[j], _) = self.evaluate_stability_factor()
         self.set_mu(mu_bak)
 
+        return (constraints_matrix, constraints_vector)
+
+    def _assemble_linear_program(self, N, theta_cache=None, shared_constraints=None,
+                                 closest_selected_parameters_complement=None):
+        assert N <= len(self.greedy_selected_parameters)
+        Q = self.truth_problem.Q["stability_factor_left_hand_matrix"]
+        (M_e, M_p) = self._number_of_constraints(N)
+
+        # 1. Constrain the Q variables to be in the bounding box
+        bounds = list()  # of Q pairs
+        for q in range(Q):
+            assert self.bounding_box_min[q] <= self.bounding_box_max[q]
+            bounds.append((self.bounding_box_min[q], self.bounding_box_max[q]))
+
+        # 2. Add three different sets of constraints.
+        #    Our constrains are of the form
+        #       a^T * x >= b
+        # 2a. Add constraints: a constraint is added for the closest samples to mu among the selected parameters.
+        #     If they are shared with other linear programs, only copy the preallocated constraints.
+        if shared_constraints is None:
+            (constraints_matrix, constraints_vector) = self._assemble_selected_parameters_constraints(
+                N, self._closest_selected_parameters(M_e, N, self.mu), theta_cache)
+        else:
+            constraints_matrix = shared_constraints[0].copy()
+            constraints_vector = shared_constraints[1].copy()
+
         # 2b. Add constraints: also constrain the closest point in the complement of selected parameters,
         #                      with RHS depending on previously computed lower bounds
         mu_bak = self.mu
-        closest_selected_parameters_complement = self._closest_unselected_parameters(M_p, N, self.mu)
+        if closest_selected_parameters_complement is None:
+            closest_selected_parameters_complement = self._closest_unselected_parameters(M_p, N, self.mu)
         for (j, nu) in enumerate(closest_selected_parameters_complement):
             # Overwrite parameter values
             self.set_mu(nu)
 
             # Compute theta
-            current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
+            current_theta = self._compute_theta(theta_cache)
 
             # Assemble the LHS of the constraint
             for q in range(Q):
@@ -200,7 +311,7 @@ class SCMApproximation(ParametrizedProblem):
 
         # 2c. Add constraints: also constrain the stability factor for mu to be positive
         # Compute theta
-        current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
+        current_theta = self._compute_theta(theta_cache)
 
         # Assemble the LHS of the constraint
         for q in range(Q):
@@ -214,17 +325,7 @@ class SCMApproximation(ParametrizedProblem):
         for q in range(Q):
             cost[q] = current_theta[q]
 
-        # 4. Solve the linear programming problem
-        linear_program = LinearProgramSolver(cost, constraints_matrix, constraints_vector, bounds)
-        try:
-            stability_factor_lower_bound = linear_program.solve()
-        except LinearProgramSolverError:
-            print("SCM warning at mu = " + str(self.mu) + ": error occured while solving linear program.")
-            print("Please consider switching to a different solver. A truth eigensolve will be performed.")
-
-            (stability_factor_lower_bound, _) = self.evaluate_stability_factor()
-
-        self._stability_factor_lower_bound = stability_factor_lower_bound
+        return (cost, constraints_matrix, constraints_vector, bounds)
 
     # Get an upper bound for the stability factor
     def get_stability_factor_upper_bound(self, N=None):
@@ -265,12 +366,17 @@ class SCMApproximation(ParametrizedProblem):
         return hashlib.sha1(str(self._cache_key(N)).encode("utf-8")).hexdigest()
 
     def _closest_selected_parameters(self, M, N, mu):
-        return self.greedy_selected_parameters[:N].closest(M, mu)
+        if N not in self.greedy_selected_parameters_subset:
+            self.greedy_selected_parameters_subset[N] = self.greedy_selected_parameters[:N]
+        return self.greedy_selected_parameters_subset[N].closest(M, mu)
 
     def _closest_unselected_parameters(self, M, N, mu):
+        return self._closest_unselected_parameters_batch(M, N, [mu])[0]
+
+    def _closest_unselected_parameters_batch(self, M, N, mus):
         if N not in self.greedy_selected_parameters_complement:
             self.greedy_selected_parameters_complement[N] = self.training_set.diff(self.greedy_selected_parameters[:N])
-        return self.greedy_selected_parameters_complement[N].closest(M, mu)
+        return self.greedy_selected_parameters_complement[N].closest_batch(M, mus)
 
     def export_stability_factor_lower_bound(self, folder=None, filename=None):
         if folder is None:
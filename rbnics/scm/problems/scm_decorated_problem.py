@@ -50,6 +50,10 @@ def SCMDecoratedProblem(
                 self.stability_factor_calculator = self.SCM_approximation.stability_factor_calculator
                 self.stability_factor_lower_bound_calculator = self.SCM_approximation
 
+            # Set the parameters of the solver of the linear programs for the stability factor lower bound
+            def set_linear_program_solver_parameters(self, parameters):
+                self.SCM_approximation.set_linear_program_solver_parameters(parameters)
+
         # return value (a class) for the decorator
         return SCMDecoratedProblem_Class
 
@@ -174,25 +174,29 @@ class SCMApproximationReductionMethod(ReductionMethod):
 
     # Choose the next parameter in the offline stage in a greedy fashion
     def greedy(self):
-        def solve_and_estimate_error(mu):
-            self.SCM_approximation.set_mu(mu)
+        def solve_and_estimate_errors(mus):
+            # Linear programs associated to all parameters are assembled and solved at once
+            stability_factor_lower_bounds = self.SCM_approximation.get_stability_factor_lower_bounds(mus)
+
+            error_estimators = list()
+            for (mu, stability_factor_lower_bound) in zip(mus, stability_factor_lower_bounds):
+                self.SCM_approximation.set_mu(mu)
 
-            stability_factor_lower_bound = self.SCM_approximation.get_stability_factor_lower_bound()
-            stability_factor_upper_bound = self.SCM_approximation.get_stability_factor_upper_bound()
-            ratio = stability_factor_lower_bound / stability_factor_upper_bound
+                stability_factor_upper_bound = self.SCM_approximation.get_stability_factor_upper_bound()
+                ratio = stability_factor_lower_bound / stability_factor_upper_bound
 
-            if ratio < 0. and not isclose(ratio, 0.):  # if ratio << 0
-                print("SCM warning at mu = " + str(mu)
-                      + ": stability factor lower bound = " + str(stability_factor_lower_bound) + " < 0")
-            if ratio > 1. and not isclose(ratio, 1.):  # if ratio >> 1
-                print("SCM warning at mu = " + str(mu)
-                      + ": stability factor lower bound = " + str(stability_factor_lower_bound)
-                      + " > stability factor upper bound = " + str(stability_factor_upper_bound))
+                if ratio < 0. and not isclose(ratio, 0.):  # if ratio << 0
+                    print("SCM warning at mu = " + str(mu)
+                          + ": stability factor lower bound = " + str(stability_factor_lower_bound) + " < 0")
+                if ratio > 1. and not isclose(ratio, 1.):  # if ratio >> 1
+                    print("SCM warning at mu = " + str(mu)
+                          + ": stability factor lower bound = " + str(stability_factor_lower_bound)
+                          + " > stability factor upper bound = " + str(stability_factor_upper_bound))
 
-            error_estimator = 1. - ratio
-            return error_estimator
+                error_estimators.append(1. - ratio)
+            return error_estimators
 
-        (error_estimator_max, error_estimator_argmax) = self.training_set.max(solve_and_estimate_error)
+        (error_estimator_max, error_estimator_argmax) = self.training_set.max_batch(solve_and_estimate_errors)
         self.SCM_approximation.set_mu(self.training_set[error_estimator_argmax])
         self.greedy_error_estimators.append(error_estimator_max)
         self.greedy_error_estimators.save(self.folder["post_processing"], "error_estimator_max")
@@ -5,10 +5,12 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from rbnics.utils.cache.cache import Cache, cache
+from rbnics.utils.cache.projections_cache import ProjectionsCache
 from rbnics.utils.cache.time_series_cache import TimeSeriesCache
 
 __all__ = [
     "Cache",
     "cache",
+    "ProjectionsCache",
     "TimeSeriesCache"
 ]
@@ -8,12 +8,15 @@ from collections.abc import MutableMapping
 from functools import wraps
 from logging import DEBUG, getLogger
 from pylru import lrucache
+from rbnics.utils.cache.disk_cache_index import DiskCacheIndex
+from rbnics.utils.cache.packed_storage import PackedStorage
 
 logger = getLogger("rbnics/utils/cache/cache.py")
 
 
 class Cache(object):
-    def __init__(self, config_section=None, key_generator=None, import_=None, export=None, filename_generator=None):
+    def __init__(self, config_section=None, key_generator=None, import_=None, export=None, filename_generator=None,
+                 folder=None):
         self._config_section = config_section
         if self._config_section is None:
             self._storage = dict()
@@ -21,6 +24,8 @@ class Cache(object):
             self._import = None
             self._export = None
             self._filename_generator = None
+            self._disk_index = None
+            self._packed_storage = None
         else:
             from rbnics.utils.config import config  # cannot import at global scope
             cache_options = config.get(self._config_section, "cache")
@@ -40,10 +45,23 @@ class Cache(object):
             else:
                 self._storage = DisabledStorage()
                 self._key_generator = key_generator
-            if "disk" in cache_options:
-                cache_size = config.get(self._config_section, "disk cache limit")
-                assert isinstance(cache_size, str)
-                assert cache_size == "unlimited"
+            if "disk" in cache_options or "packed" in cache_options:
+                assert not ("disk" in cache_options and "packed" in cache_options), (
+                    "Disk and packed caches cannot be enabled at the same time")
+                if "disk" in cache_options:
+                    cache_size = config.get(self._config_section, "disk cache limit")
+                    assert isinstance(cache_size, str)
+                    if cache_size == "unlimited":
+                        self._disk_index = None
+                    else:
+                        assert folder is not None
+                        cache_policy = config.get(self._config_section, "disk cache policy")
+                        self._disk_index = DiskCacheIndex(folder, cache_size, cache_policy)
+                    self._packed_storage = None
+                else:
+                    assert folder is not None
+                    self._disk_index = None
+                    self._packed_storage = PackedStorage(folder)
                 assert import_ is not None
                 self._import = import_
                 assert export is not None
@@ -54,6 +72,8 @@ class Cache(object):
                 self._import = None
                 self._export = None
                 self._filename_generator = None
+                self._disk_index = None
+                self._packed_storage = None
 
     def __len__(self):
         """
@@ -85,7 +105,7 @@ class Cache(object):
             if self._filename_generator is not None:
                 storage_filename = self._filename_generator(*args, **kwargs)
                 try:
-                    self._storage[storage_key] = self._import(storage_filename)
+                    self._storage[storage_key] = self._import_from_disk(storage_filename)
                 except OSError:
                     logger.log(DEBUG, "Could not load key " + str(storage_key)
                                + " (corresponding to args = " + str(args)
@@ -115,7 +135,24 @@ class Cache(object):
         self._storage[storage_key] = value
         if self._filename_generator is not None:
             storage_filename = self._filename_generator(*args, **kwargs)
-            self._export(storage_filename)
+            self._export_to_disk(storage_filename)
+
+    def _import_from_disk(self, storage_filename):
+        if self._packed_storage is not None:
+            with self._packed_storage.unpacked(storage_filename) as unpacked_filename:
+                return self._import(unpacked_filename)
+        else:
+            value = self._import(storage_filename)
+            if self._disk_index is not None:
+                self._disk_index.touch(storage_filename)
+            return value
+
+    def _export_to_disk(self, storage_filename):
+        self._export(storage_filename)
+        if self._packed_storage is not None:
+            self._packed_storage.pack(storage_filename)
+        elif self._disk_index is not None:
+            self._disk_index.add(storage_filename)
 
     def __delitem__(self, key):
         """
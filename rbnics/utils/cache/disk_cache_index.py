@@ -0,0 +1,260 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import atexit
+import glob
+import json
+import os
+import re
+import time
+from bisect import bisect_left
+from fcntl import flock, LOCK_EX, LOCK_UN
+from logging import DEBUG, getLogger
+from weakref import WeakSet
+from mpi4py.MPI import COMM_WORLD
+from rbnics.utils.mpi import get_parallel_io_communicator, parallel_io
+
+logger = getLogger("rbnics/utils/cache/disk_cache_index.py")
+
+
+class DiskCacheIndex(object):
+    """
+    Index of the entries stored by a disk cache, recording size, time of last access and number of accesses of
+    each entry. All files in the cache folder whose name starts with the filename of an entry belong to that entry.
+    Entries are evicted according to the prescribed policy ("LRU" or "LFU") as soon as the limits on the number
+    of entries or on their overall size in bytes are exceeded.
+    The index is kept in memory, and it is written to the cache folder only when entries are evicted and at exit,
+    so that accessing an entry does not require any I/O. The index is written while holding an exclusive lock,
+    after merging the entries recorded in the cache folder by other processes sharing the same cache folder.
+    While parallel I/O is restricted to a group of processes (see parallel_io_communicator()), each group records
+    its entries in a separate group index, so that concurrent groups never update the same index. Group indices
+    are merged into the main index when it is read, and removed once the main index is written. Limits are
+    always checked against the entries recorded by all groups.
+    Since entries evicted by a process are only known to that process until the index is written, entries whose
+    files do not exist anymore are dropped before evicting and writing.
+    """
+
+    index_filename = ".cache_index.json"
+    group_index_filename = ".cache_index.group_{rank}.json"
+    lock_filename = ".cache_index.lock"
+    units = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
+
+    def __init__(self, folder, limit, policy):
+        self.folder = folder
+        (self.max_entries, self.max_bytes) = self._parse_limit(limit)
+        assert policy in ("LRU", "LFU")
+        self.policy = policy
+        self._indices = dict()  # from index filename to index, loaded on first access
+        self._evicted = dict()  # from index filename to entries evicted since the index was last written
+        self._modified = set()  # index filenames modified since they were last written
+        _indices.add(self)
+
+    @classmethod
+    def _parse_limit(cls, limit):
+        # The limit is provided as a string containing a maximum number of entries (e.g. "1000"), a maximum size
+        # (e.g. "10GB"), or both separated by a space (e.g. "1000 10GB")
+        max_entries = None
+        max_bytes = None
+        for token in limit.split():
+            if token.isdigit():
+                assert max_entries is None, "Number of entries provided twice in disk cache limit"
+                max_entries = int(token)
+                assert max_entries > 0
+            else:
+                match = re.fullmatch(r"([0-9]+(?:\.[0-9]+)?)\s*([KMGT]?B)", token.upper())
+                assert match is not None, "Invalid disk cache limit " + limit
+                assert max_bytes is None, "Size provided twice in disk cache limit"
+                max_bytes = int(float(match.group(1)) * cls.units[match.group(2)])
+                assert max_bytes > 0
+        assert max_entries is not None or max_bytes is not None, "Invalid disk cache limit " + limit
+        return (max_entries, max_bytes)
+
+    def touch(self, filename):
+        """
+        Record an access to the entry associated to filename.
+        """
+        def touch_task():
+            index_filename = self._index_filename()
+            index = self._get_index(index_filename)
+            if filename not in index and index_filename == self.index_filename:
+                # the entry may have been added by a group of processes in the meantime
+                self._merge(index, self._read_group_indices(), self._evicted[index_filename])
+            if filename in index:
+                index[filename]["last_access"] = time.time()
+                index[filename]["accesses"] += 1
+                self._modified.add(index_filename)
+        parallel_io(touch_task)
+
+    def add(self, filename):
+        """
+        Add (or update) the entry associated to filename, and evict other entries if limits are exceeded.
+        """
+        def add_task():
+            index_filename = self._index_filename()
+            index = self._get_index(index_filename)
+            entry = index.setdefault(filename, {"accesses": 0})
+            entry["size"] = self._compute_size(filename)
+            entry["last_access"] = time.time()
+            entry["accesses"] += 1
+            self._evicted[index_filename].discard(filename)
+            self._modified.add(index_filename)
+            if self._is_over_limit(self._get_global_index(index_filename, index)):
+                self._write(index_filename, protected_filename=filename)
+        parallel_io(add_task)
+
+    def flush(self):
+        """
+        Write the indices modified by the current process to the cache folder.
+        """
+        for index_filename in list(self._modified):
+            self._write(index_filename)
+
+    def _index_filename(self):
+        if get_parallel_io_communicator().size < COMM_WORLD.size:
+            # The current process is the first process of a group, see parallel_io()
+            return self.group_index_filename.format(rank=COMM_WORLD.rank)
+        else:
+            return self.index_filename
+
+    def _get_index(self, index_filename):
+        if index_filename not in self._indices:
+            index = self._read(index_filename)
+            if index_filename == self.index_filename:
+                self._merge(index, self._read_group_indices(), set())
+            self._indices[index_filename] = index
+            self._evicted[index_filename] = set()
+        return self._indices[index_filename]
+
+    def _get_global_index(self, index_filename, index):
+        # Merge the main index and all group indices, using the in-memory index in place of the file it is written to
+        if index_filename == self.index_filename:
+            return index
+        global_index = self._read(self.index_filename)
+        for group_index_path in self._group_index_paths():
+            if os.path.basename(group_index_path) != index_filename:
+                self._merge(global_index, self._read(os.path.basename(group_index_path)), set())
+        self._merge(global_index, index, set())
+        return global_index
+
+    def _read(self, index_filename):
+        try:
+            with open(os.path.join(str(self.folder), index_filename), "r") as index_file:
+                return json.load(index_file)
+        except (FileNotFoundError, ValueError):
+            return dict()
+
+    def _group_index_paths(self):
+        return glob.glob(os.path.join(str(self.folder), glob.escape(self.group_index_filename).format(rank="*")))
+
+    def _read_group_indices(self):
+        group_indices = dict()
+        for group_index_path in self._group_index_paths():
+            self._merge(group_indices, self._read(os.path.basename(group_index_path)), set())
+        return group_indices
+
+    def _write(self, index_filename, protected_filename=None):
+        index_path = os.path.join(str(self.folder), index_filename)
+        lock_path = os.path.join(str(self.folder), self.lock_filename)
+        with open(lock_path, "a") as lock_file:
+            flock(lock_file, LOCK_EX)
+            try:
+                # Merge entries recorded by other processes, and possibly evict entries on the merged index
+                index = self._get_index(index_filename)
+                evicted = self._evicted[index_filename]
+                self._merge(index, self._read(index_filename), evicted)
+                if index_filename == self.index_filename:
+                    group_index_paths = self._group_index_paths()
+                    self._merge(index, self._read_group_indices(), evicted)
+                else:
+                    group_index_paths = list()
+                self._drop_missing_entries(index)
+                if protected_filename is not None:
+                    # Evict on the entries recorded by all groups, and then drop evicted entries from this index
+                    global_index = self._get_global_index(index_filename, index)
+                    if global_index is not index:
+                        self._drop_missing_entries(global_index)
+                    self._evict(global_index, protected_filename, evicted)
+                    for filename in evicted:
+                        index.pop(filename, None)
+                # Write to a temporary file first, so that the index is never found partially written
+                with open(index_path + "." + str(os.getpid()), "w") as index_file:
+                    json.dump(index, index_file)
+                os.replace(index_path + "." + str(os.getpid()), index_path)
+                # Group indices have now been merged into the main index
+                for group_index_path in group_index_paths:
+                    os.remove(group_index_path)
+                evicted.clear()
+                self._modified.discard(index_filename)
+            finally:
+                flock(lock_file, LOCK_UN)
+
+    @staticmethod
+    def _merge(index, other_index, evicted):
+        for (filename, other_entry) in other_index.items():
+            if filename in evicted:
+                continue
+            entry = index.get(filename)
+            if entry is None:
+                index[filename] = dict(other_entry)
+            else:
+                if other_entry["last_access"] > entry["last_access"]:
+                    entry["size"] = other_entry["size"]
+                    entry["last_access"] = other_entry["last_access"]
+                entry["accesses"] = max(entry["accesses"], other_entry["accesses"])
+
+    def _drop_missing_entries(self, index):
+        # Files are looked up in a sorted listing of the cache folder, rather than globbing once for each entry
+        paths = sorted(os.listdir(str(self.folder)))
+        for filename in list(index.keys()):
+            position = bisect_left(paths, filename)
+            if position == len(paths) or not paths[position].startswith(filename):
+                del index[filename]
+
+    def _compute_size(self, filename):
+        size = 0
+        for path in glob.iglob(os.path.join(str(self.folder), glob.escape(filename) + "*")):
+            if os.path.isfile(path):
+                size += os.path.getsize(path)
+        return size
+
+    def _is_over_limit(self, index):
+        return (
+            (self.max_entries is not None and len(index) > self.max_entries)
+            or (self.max_bytes is not None and sum(entry["size"] for entry in index.values()) > self.max_bytes)
+        )
+
+    def _evict(self, index, protected_filename, evicted):
+        if self.policy == "LRU":
+            def priority(filename):
+                return index[filename]["last_access"]
+        elif self.policy == "LFU":
+            def priority(filename):
+                return (index[filename]["accesses"], index[filename]["last_access"])
+        else:
+            raise ValueError("Invalid disk cache policy")
+        candidates = sorted([filename for filename in index if filename != protected_filename], key=priority)
+        for filename in candidates:
+            if not self._is_over_limit(index):
+                break
+            for path in glob.iglob(os.path.join(str(self.folder), glob.escape(filename) + "*")):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:  # already removed by another process
+                    pass
+            del index[filename]
+            evicted.add(filename)
+            logger.log(DEBUG, "Evicted " + filename + " from disk cache in " + str(self.folder))
+
+
+# Write all indices at exit
+_indices = WeakSet()
+
+
+@atexit.register
+def _flush_indices():
+    for index in list(_indices):
+        if os.path.isdir(str(index.folder)):  # the cache folder may have been removed in the meantime
+            index.flush()
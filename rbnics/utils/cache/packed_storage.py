@@ -0,0 +1,179 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import glob
+import hashlib
+import json
+import os
+import socket
+from contextlib import contextmanager
+from fcntl import flock, LOCK_EX, LOCK_UN
+from rbnics.utils.mpi import get_parallel_io_communicator, parallel_io
+
+
+class PackedStorage(object):
+    """
+    Content addressed storage of the files written by a disk cache. Rather than keeping one (or more) files per
+    cached entry, the content of each file is appended to a few large shards, and deduplicated by its sha1 digest.
+    An append-only index records the shard, offset and length of each content, and which contents are associated
+    to each entry. Since shards are only appended to, contents are read at their offsets without holding any lock,
+    which is only required to update or read the index, so that several processes may safely share the same cache
+    folder.
+    """
+
+    index_filename = ".packed_cache_index.jsonl"
+    lock_filename = ".packed_cache_index.lock"
+    shard_filename = ".packed_cache_{}.bin"
+    unpacked_folder = ".packed_cache_unpacked_{}_{}"
+    shard_size = 1024**3
+
+    def __init__(self, folder):
+        self.folder = folder
+        self._files = dict()  # from filename of an entry to a dict from file suffix to content digest
+        self._contents = dict()  # from content digest to (shard, offset, length)
+        self._index_position = 0
+        self._lock_file = None
+
+    def pack(self, filename):
+        """
+        Move all files associated to filename from the cache folder into the storage.
+        """
+        def pack_task():
+            paths = sorted(glob.glob(os.path.join(str(self.folder), glob.escape(filename) + "*")))
+            paths = [path for path in paths if os.path.isfile(path)]
+            if len(paths) == 0:
+                return
+            self._lock()
+            try:
+                self._read_index()
+                files = dict()
+                contents = dict()
+                for path in paths:
+                    with open(path, "rb") as file_:
+                        content = file_.read()
+                    digest = hashlib.sha1(content).hexdigest()
+                    if digest not in self._contents:
+                        contents[digest] = self._append_to_shard(content)
+                    files[os.path.basename(path)[len(filename):]] = digest
+                self._write_index({"filename": filename, "files": files, "contents": contents})
+                for path in paths:
+                    os.remove(path)
+            finally:
+                self._unlock()
+        parallel_io(pack_task)
+
+    def read(self, filename):
+        """
+        Return a dict from the suffix of each file associated to filename to its content. The lock is only held
+        while the index is updated, and contents are then read at their offsets in the shards.
+        """
+        self._lock()
+        try:
+            self._read_index()
+            locations = {suffix: self._contents[digest]
+                         for (suffix, digest) in self._files.get(filename, dict()).items()}
+        finally:
+            self._unlock()
+        contents = dict()
+        shard_files = dict()
+        try:
+            for (suffix, (shard, offset, length)) in locations.items():
+                if shard not in shard_files:
+                    shard_files[shard] = os.open(
+                        os.path.join(str(self.folder), self.shard_filename.format(shard)), os.O_RDONLY)
+                contents[suffix] = os.pread(shard_files[shard], length, offset)
+        finally:
+            for shard_file in shard_files.values():
+                os.close(shard_file)
+        return contents
+
+    @contextmanager
+    def unpacked(self, filename):
+        """
+        Temporarily extract all files associated to filename to a subfolder of the cache folder private to the
+        current process, and return the filename of the extracted files relative to the cache folder, so that they
+        can be imported without holding any lock. If no files are packed for filename (e.g. because they have not
+        been packed yet), filename itself is returned, and files available in the cache folder are left untouched.
+        """
+        def unpack_task():
+            contents = self.read(filename)
+            if len(contents) == 0:
+                return None
+            unpacked_folder = self.unpacked_folder.format(socket.gethostname(), os.getpid())
+            os.makedirs(os.path.join(str(self.folder), unpacked_folder), exist_ok=True)
+            for (suffix, content) in contents.items():
+                with open(os.path.join(str(self.folder), unpacked_folder, filename + suffix), "wb") as file_:
+                    file_.write(content)
+            return (unpacked_folder, list(contents.keys()))
+
+        def cleanup_task(unpacked_folder, suffixes):
+            for suffix in suffixes:
+                os.remove(os.path.join(str(self.folder), unpacked_folder, filename + suffix))
+            try:
+                os.rmdir(os.path.join(str(self.folder), unpacked_folder))
+            except OSError:  # still in use by a nested import
+                pass
+
+        if not os.path.isdir(str(self.folder)):
+            raise FileNotFoundError("Cache folder " + str(self.folder) + " does not exist")
+        unpacked = parallel_io(unpack_task)
+        if unpacked is None:
+            yield filename
+        else:
+            (unpacked_folder, suffixes) = unpacked
+            try:
+                yield os.path.join(unpacked_folder, filename)
+            finally:
+                get_parallel_io_communicator().barrier()  # wait for all processes to be done with the files
+                parallel_io(lambda: cleanup_task(unpacked_folder, suffixes))
+
+    def _append_to_shard(self, content):
+        shard = max([shard for (shard, _, _) in self._contents.values()], default=0)
+        shard_path = os.path.join(str(self.folder), self.shard_filename.format(shard))
+        offset = os.path.getsize(shard_path) if os.path.exists(shard_path) else 0
+        if offset > 0 and offset + len(content) > self.shard_size:
+            shard += 1
+            shard_path = os.path.join(str(self.folder), self.shard_filename.format(shard))
+            offset = 0
+        with open(shard_path, "ab") as file_:
+            file_.write(content)
+        self._contents[hashlib.sha1(content).hexdigest()] = (shard, offset, len(content))
+        return (shard, offset, len(content))
+
+    def _read_index(self):
+        # Only read records which have been appended (possibly by other processes) since the last read
+        index_path = os.path.join(str(self.folder), self.index_filename)
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as index_file:
+                index_file.seek(self._index_position)
+                records = index_file.read()
+            self._index_position += len(records)
+            for line in records.decode("utf-8").splitlines():
+                self._update_index(json.loads(line))
+
+    def _write_index(self, record):
+        index_path = os.path.join(str(self.folder), self.index_filename)
+        line = (json.dumps(record) + "\n").encode("utf-8")
+        with open(index_path, "ab") as index_file:
+            index_file.write(line)
+        self._index_position += len(line)
+        self._update_index(record)
+
+    def _update_index(self, record):
+        for (digest, location) in record["contents"].items():
+            self._contents[digest] = tuple(location)
+        self._files.setdefault(record["filename"], dict()).update(record["files"])
+
+    def _lock(self):
+        assert self._lock_file is None
+        self._lock_file = open(os.path.join(str(self.folder), self.lock_filename), "a")
+        flock(self._lock_file, LOCK_EX)
+
+    def _unlock(self):
+        if self._lock_file is not None:
+            flock(self._lock_file, LOCK_UN)
+            self._lock_file.close()
+            self._lock_file = None
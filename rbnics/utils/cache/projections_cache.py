@@ -0,0 +1,34 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from contextlib import contextmanager
+
+
+class ProjectionsCache(dict):
+    """
+    Storage of the projections of matrices and vectors onto lists of functions, which transpose() extends by
+    bordering when functions are added to the lists. Projections are stored (and reused) only within the use()
+    context, and matrices, vectors and functions must not be modified in place within such context.
+    Only reduced entries are stored, and functions are tracked by weak references, so that the cache does not
+    keep them alive.
+    """
+
+    _in_use = [None]
+
+    @contextmanager
+    def use(self):
+        ProjectionsCache._in_use.append(self)
+        try:
+            yield
+        finally:
+            ProjectionsCache._in_use.pop()
+
+    @classmethod
+    def current(cls):
+        """
+        Returns the cache currently in use, if any.
+        """
+        return cls._in_use[-1]
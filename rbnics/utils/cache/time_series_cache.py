@@ -21,8 +21,13 @@ class TimeSeriesCache(Cache):
             storage_filename = self._filename_generator(*args, **kwargs)
             original_append = value.append
 
+            # Items are appended to the same files one at a time: they are not moved to the packed storage,
+            # since they would need to be extracted again at the next append. They will be packed together
+            # with the next entry sharing the same filename, or read back from the cache folder otherwise.
             def patched_append(self_, item):
                 self._export(storage_filename, item, len(self_))
+                if self._disk_index is not None:
+                    self._disk_index.add(storage_filename)
                 original_append(item)
 
             PatchInstanceMethod(value, "append", patched_append).patch()
@@ -23,11 +23,13 @@ class Config(object):
         "EIM": {
             "cache": {"disk", "RAM"},
             "disk cache limit": "unlimited",
+            "disk cache policy": "LRU",
             "RAM cache limit": "1"
         },
         "problems": {
             "cache": {"disk", "RAM"},
             "disk cache limit": "unlimited",
+            "disk cache policy": "LRU",
             "RAM cache limit": "1"
         },
         "reduced problems": {
@@ -37,10 +39,27 @@ class Config(object):
         "SCM": {
             "cache": {"disk", "RAM"},
             "disk cache limit": "unlimited",
+            "disk cache policy": "LRU",
             "RAM cache limit": "1"
         }
     }
 
+    # Set allowed values of options which are sets, in case they differ from the default ones
+    choices = {
+        "EIM": {
+            "cache": {"disk", "packed", "RAM"}
+        },
+        "problems": {
+            "cache": {"disk", "packed", "RAM"}
+        },
+        "reduced problems": {
+            "cache": {"RAM"}
+        },
+        "SCM": {
+            "cache": {"disk", "packed", "RAM"}
+        }
+    }
+
     # Read in required backends
     required_backends = set()
     for root, dirs, files in os.walk(os.path.join(rbnics_directory, "backends")):
@@ -122,7 +141,7 @@ class Config(object):
     def _value_to_parser(self, section, option, value):
         default = self.defaults[section][option]
         assert isinstance(default, set)
-        assert value.issubset(default)
+        assert value.issubset(self.choices.get(section, dict()).get(option, default))
         value_str = ", ".join(str(v) for v in sorted(value))
         if len(value) < 2:
             value_str += ","  # to differentiate between str and a set with one element
@@ -4,12 +4,18 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from rbnics.utils.mpi.parallel_io import parallel_io
+from rbnics.utils.mpi.parallel_groups import parallel_groups
+from rbnics.utils.mpi.parallel_io import get_parallel_io_communicator, parallel_io, parallel_io_communicator
 from rbnics.utils.mpi.parallel_max import parallel_max
+from rbnics.utils.mpi.parallel_schedule import parallel_schedule
 from rbnics.utils.mpi.print import print
 
 __all__ = [
+    "get_parallel_io_communicator",
+    "parallel_groups",
     "parallel_io",
+    "parallel_io_communicator",
     "parallel_max",
+    "parallel_schedule",
     "print"
 ]
@@ -0,0 +1,22 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from mpi4py.MPI import COMM_WORLD
+
+
+# Identify disjoint groups of processes, e.g. each one owning a copy of the mesh
+def parallel_groups(group_mpi_comm, mpi_comm=None):
+    """
+    Split the processes of mpi_comm in the disjoint groups of processes sharing the same group_mpi_comm.
+    Return the index of the group of the current process and the number of groups, so that groups may
+    carry out independent tasks concurrently. Groups are numbered according to the rank of their first process.
+    This is a collective operation.
+    """
+    if mpi_comm is None:
+        mpi_comm = COMM_WORLD
+    group_leader = group_mpi_comm.bcast(mpi_comm.rank, root=0)
+    group_leaders = sorted(set(mpi_comm.allgather(group_leader)))
+    return (group_leaders.index(group_leader), len(group_leaders))
@@ -5,12 +5,15 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import sys
+from contextlib import contextmanager
 from mpi4py.MPI import COMM_WORLD
 
+_default_mpi_comm = [COMM_WORLD]
+
 
 def parallel_io(lambda_function, mpi_comm=None):
     if mpi_comm is None:
-        mpi_comm = COMM_WORLD
+        mpi_comm = _default_mpi_comm[-1]
     return_value = None
     error_raised = False
     error_type = None
@@ -30,3 +33,23 @@ def parallel_io(lambda_function, mpi_comm=None):
         error_type = mpi_comm.bcast(error_type, root=0)
         error_instance_args = mpi_comm.bcast(error_instance_args, root=0)
         raise error_type(*error_instance_args)
+
+
+def get_parallel_io_communicator():
+    """
+    Return the communicator currently used by default by parallel_io().
+    """
+    return _default_mpi_comm[-1]
+
+
+@contextmanager
+def parallel_io_communicator(mpi_comm):
+    """
+    Use mpi_comm rather than MPI_COMM_WORLD as default communicator of parallel_io() in the body of a with
+    statement, e.g. while disjoint groups of processes carry out I/O on their own files.
+    """
+    _default_mpi_comm.append(mpi_comm)
+    try:
+        yield
+    finally:
+        _default_mpi_comm.pop()
@@ -4,7 +4,8 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from mpi4py.MPI import COMM_WORLD, MAX
+from math import inf
+from mpi4py.MPI import COMM_WORLD, MAXLOC
 
 
 # Get max in parallel
@@ -14,22 +15,19 @@ def parallel_max(local_value_max, local_args=None, postprocessor=None, mpi_comm=
             return value
     if mpi_comm is None:
         mpi_comm = COMM_WORLD
-    local_value_max_with_postprocessing = postprocessor(local_value_max)
-    global_value_max_with_postprocessing = mpi_comm.allreduce(local_value_max_with_postprocessing, op=MAX)
-    global_value_processor_argmax = -1
-    if global_value_max_with_postprocessing == local_value_max_with_postprocessing:
-        global_value_processor_argmax = mpi_comm.rank
-    global_value_processor_argmax = mpi_comm.allreduce(global_value_processor_argmax, op=MAX)
-    assert global_value_processor_argmax >= 0
-    global_value_max = mpi_comm.bcast(local_value_max, root=global_value_processor_argmax)
+    if local_args is not None and not isinstance(local_args, tuple):
+        local_args = (local_args, )
+    if local_value_max is not None:
+        local_value_max_with_postprocessing = postprocessor(local_value_max)
+    else:  # no value is available on the current process
+        local_value_max_with_postprocessing = - inf
+    # Carry out a single reduction, in which the location also contains value and args of each process.
+    # Since MAXLOC picks the smallest location, ties are broken in favor of the smallest args (e.g. the smallest
+    # global index), so that the result does not depend on how values are distributed among processes
+    local_key = local_args if local_args is not None else tuple()
+    (_, (_, _, global_value_max, global_args)) = mpi_comm.allreduce(
+        (local_value_max_with_postprocessing, (local_key, mpi_comm.rank, local_value_max, local_args)), op=MAXLOC)
     if local_args is not None:
-        if not isinstance(local_args, tuple):
-            local_args = (local_args, )
-        global_args = list()
-        for local_arg in local_args:
-            global_args.append(
-                mpi_comm.bcast(local_arg, root=global_value_processor_argmax)
-            )
-        return (global_value_max, tuple(global_args))
+        return (global_value_max, global_args)
     else:
         return global_value_max
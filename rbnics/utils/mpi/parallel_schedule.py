@@ -0,0 +1,45 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from mpi4py.MPI import COMM_WORLD, INT64_T, SUM, Win
+from numpy import frombuffer, int64, ones, zeros
+
+
+# Split range(n) in chunks which are dynamically assigned to processes
+def parallel_schedule(n, chunk_size=None, mpi_comm=None):
+    """
+    Generate the chunks of range(n) assigned to the current process. Chunks are not assigned in advance:
+    each process, once done with its previous chunk, atomically increments a counter stored on process 0 to
+    get the next one, so that processes which are faster (e.g. because of cheaper evaluations) process more
+    chunks. This is a collective operation, and the generator must be exhausted on all processes.
+    """
+    if mpi_comm is None:
+        mpi_comm = COMM_WORLD
+    if chunk_size is None:
+        # Aim at a few chunks per process, to balance the load while limiting the number of accesses to the counter
+        chunk_size = max(1, n // (4 * mpi_comm.size))
+    if mpi_comm.size == 1:
+        for start in range(0, n, chunk_size):
+            yield range(start, min(start + chunk_size, n))
+        return
+    itemsize = INT64_T.Get_size()
+    window = Win.Allocate(itemsize if mpi_comm.rank == 0 else 0, itemsize, comm=mpi_comm)
+    try:
+        if mpi_comm.rank == 0:
+            frombuffer(window.tomemory(), dtype=int64)[:] = 0
+        mpi_comm.Barrier()
+        increment = ones(1, dtype=int64)
+        chunk = zeros(1, dtype=int64)
+        while True:
+            window.Lock(0)
+            window.Fetch_and_op(increment, chunk, 0, op=SUM)
+            window.Unlock(0)
+            start = int(chunk[0]) * chunk_size
+            if start >= n:
+                break
+            yield range(start, min(start + chunk_size, n))
+    finally:
+        window.Free()
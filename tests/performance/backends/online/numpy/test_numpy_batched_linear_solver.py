@@ -0,0 +1,73 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import eye, isclose
+from numpy.linalg import norm, solve
+from rbnics.backends import BatchedLinearSolver as FactoryBatchedLinearSolver
+from rbnics.backends.online import OnlineBatchedLinearSolver, OnlineFunction, OnlineLinearSolver
+from rbnics.backends.online.numpy import BatchedLinearSolver as NumpyBatchedLinearSolver
+from test_numpy_utils import RandomNumpyMatrix, RandomNumpyVector
+
+BatchedLinearSolver = None
+AllBatchedLinearSolver = {"numpy": NumpyBatchedLinearSolver, "online": OnlineBatchedLinearSolver,
+                          "factory": FactoryBatchedLinearSolver}
+
+
+class Data(object):
+    def __init__(self, N, n_mus):
+        self.N = N
+        self.n_mus = n_mus
+
+    def generate_random(self):
+        lhs = list()
+        rhs = list()
+        for _ in range(self.n_mus):
+            # Generate random (non singular) matrix
+            A = RandomNumpyMatrix(self.N, self.N)
+            A[:, :] = A.content + self.N * norm(A.content) * eye(self.N)
+            lhs.append(A)
+            # Generate random vector
+            rhs.append(RandomNumpyVector(self.N))
+        # Return
+        return (lhs, rhs)
+
+    def evaluate_builtin(self, lhs, rhs):
+        result_builtin = list()
+        for (A, F) in zip(lhs, rhs):
+            result_builtin.append(solve(A.content, F.content))
+        return result_builtin
+
+    def evaluate_backend(self, lhs, rhs):
+        result_backend = [OnlineFunction(self.N) for _ in range(self.n_mus)]
+        solver = BatchedLinearSolver(lhs, result_backend, rhs)
+        solver.set_parameters({})
+        solver.solve()
+        return result_backend
+
+    def assert_backend(self, lhs, rhs, result_backend):
+        for (A, F, result_backend_i) in zip(lhs, rhs, result_backend):
+            result_builtin_i = OnlineFunction(self.N)
+            OnlineLinearSolver(A, result_builtin_i, F).solve()
+            relative_error = (norm(result_builtin_i.vector().content - result_backend_i.vector().content)
+                              / norm(result_builtin_i.vector().content))
+            assert isclose(relative_error, 0., atol=1e-12)
+
+
+@pytest.mark.parametrize("N", [2**i for i in range(1, 8)])
+@pytest.mark.parametrize("n_mus", [10**i for i in range(1, 4)])
+@pytest.mark.parametrize("test_type", ["builtin"] + list(AllBatchedLinearSolver.keys()))
+def test_numpy_batched_linear_solver(N, n_mus, test_type, benchmark):
+    data = Data(N, n_mus)
+    print("N = " + str(N) + ", n_mus = " + str(n_mus))
+    if test_type == "builtin":
+        print("Testing", test_type)
+        benchmark(data.evaluate_builtin, setup=data.generate_random)
+    else:
+        print("Testing", test_type, "backend")
+        global BatchedLinearSolver
+        BatchedLinearSolver = AllBatchedLinearSolver[test_type]
+        benchmark(data.evaluate_backend, setup=data.generate_random, teardown=data.assert_backend)
@@ -0,0 +1,63 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import isclose
+from numpy.linalg import norm
+from rbnics.backends import batched_product as factory_batched_product
+from rbnics.backends.online import online_batched_product, OnlineAffineExpansionStorage, online_product, online_sum
+from rbnics.backends.online.numpy import batched_product as numpy_batched_product
+from test_numpy_utils import RandomNumpyMatrix, RandomTuple
+
+batched_product = None
+all_batched_product = {"numpy": numpy_batched_product, "online": online_batched_product,
+                       "factory": factory_batched_product}
+
+
+class Data(object):
+    def __init__(self, N, Q, n_mus):
+        self.N = N
+        self.Q = Q
+        self.n_mus = n_mus
+
+    def generate_random(self):
+        A = OnlineAffineExpansionStorage(self.Q)
+        for i in range(self.Q):
+            # Generate random matrix
+            A[i] = RandomNumpyMatrix(self.N, self.N)
+        # Genereate random thetas
+        thetas = [RandomTuple(self.Q) for _ in range(self.n_mus)]
+        # Return
+        return (thetas, A)
+
+    def evaluate_builtin(self, thetas, A):
+        return [online_sum(online_product(theta, A)) for theta in thetas]
+
+    def evaluate_backend(self, thetas, A):
+        return batched_product(thetas, A)
+
+    def assert_backend(self, thetas, A, result_backend):
+        result_builtin = self.evaluate_builtin(thetas, A)
+        for (result_builtin_i, result_backend_i) in zip(result_builtin, result_backend):
+            relative_error = norm(result_builtin_i - result_backend_i) / norm(result_builtin_i)
+            assert isclose(relative_error, 0., atol=1e-12)
+
+
+@pytest.mark.parametrize("N", [2**i for i in range(1, 9)])
+@pytest.mark.parametrize("Q", [2 + 4 * j for j in range(1, 3)])
+@pytest.mark.parametrize("n_mus", [10**i for i in range(1, 4)])
+@pytest.mark.parametrize("test_type", ["builtin"] + list(all_batched_product.keys()))
+def test_numpy_matrix_batched_assembly(N, Q, n_mus, test_type, benchmark):
+    data = Data(N, Q, n_mus)
+    print("N = " + str(N) + ", Q = " + str(Q) + ", n_mus = " + str(n_mus))
+    if test_type == "builtin":
+        print("Testing", test_type)
+        benchmark(data.evaluate_builtin, setup=data.generate_random)
+    else:
+        print("Testing", test_type, "backend")
+        global batched_product
+        batched_product = all_batched_product[test_type]
+        benchmark(data.evaluate_backend, setup=data.generate_random, teardown=data.assert_backend)
@@ -5,6 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from numpy import isclose
+from rbnics.backends.common.batched_linear_program_solver import BatchedLinearProgramSolver
 from rbnics.backends.common.linear_program_solver import LinearProgramSolver, Matrix, Vector
 
 """
@@ -37,3 +38,67 @@ def test_linear_program_solver():
     solver = LinearProgramSolver(c, A, b, bounds)
     optimal_cost = solver.solve()
     assert isclose(optimal_cost, 0.625)
+
+
+def test_linear_program_solver_highs():
+    c = Vector(2)
+    A = Matrix(2, 2)
+    b = Vector(2)
+    bounds = [None] * 2
+
+    c[0], c[1] = 0.5, 1.
+    A[0, 0], A[0, 1] = 1., 1.
+    A[1, 0], A[1, 1] = -1., 1.
+    b[0], b[1] = 1., -0.5
+    bounds[0] = (0., 1.)
+    bounds[1] = (0., 1.)
+
+    solver = LinearProgramSolver(c, A, b, bounds)
+    solver.set_parameters({"solver": "highs"})
+    optimal_cost = solver.solve()
+    assert isclose(optimal_cost, 0.625)
+
+
+"""
+Solve a batch of linear programs obtained by scaling the cost of the previous one by k = 1, 2, 3,
+with optimal costs 0.625 k, and an additional one with the first constraint replaced by
+    x + y >= 3
+which is infeasible.
+"""
+
+
+def test_batched_linear_program_solver():
+    costs = list()
+    As = list()
+    bs = list()
+    bounds = list()
+    for k in (1., 2., 3., 1.):
+        c = Vector(2)
+        A = Matrix(2, 2)
+        b = Vector(2)
+
+        c[0], c[1] = 0.5 * k, 1. * k
+        A[0, 0], A[0, 1] = 1., 1.
+        A[1, 0], A[1, 1] = -1., 1.
+        b[0], b[1] = 1., -0.5
+        costs.append(c)
+        As.append(A)
+        bs.append(b)
+        bounds.append([(0., 1.), (0., 1.)])
+    bs[3][0] = 3.
+
+    for (solver_name, batch_size) in (("glpk", 16), ("highs", 16), ("highs", 2)):
+        solver = BatchedLinearProgramSolver(costs[:3], As[:3], bs[:3], bounds[:3])
+        solver.set_parameters({"solver": solver_name, "batch_size": batch_size})
+        optimal_costs = solver.solve()
+        assert len(optimal_costs) == 3
+        for (k, optimal_cost) in enumerate(optimal_costs):
+            assert isclose(optimal_cost, 0.625 * (k + 1))
+
+        solver = BatchedLinearProgramSolver(costs, As, bs, bounds)
+        solver.set_parameters({"solver": solver_name, "batch_size": batch_size})
+        optimal_costs = solver.solve()
+        assert len(optimal_costs) == 4
+        for (k, optimal_cost) in enumerate(optimal_costs[:3]):
+            assert isclose(optimal_cost, 0.625 * (k + 1))
+        assert optimal_costs[3] is None
@@ -125,6 +125,30 @@ def _test_reduced_mesh_elliptic_matrix(V, reduced_mesh):
     assert isclose(A_dofs, A_N_reduced_dofs).all()
 
 
+@generate_meshes
+@enable_reduced_mesh_logging
+def test_reduced_mesh_io_elliptic_matrix_materialized_on_load(mesh, tempdir):
+    test_logger.log(DEBUG, "*** Elliptic case, matrix, reduced meshes materialized after load ***")
+    V = EllipticFunctionSpace(mesh)
+    reduced_mesh = ReducedMesh((V, V))
+    dofs = [(1, 2), (11, 12), (48, 12), (41, 41)]
+
+    for pair in dofs:
+        test_logger.log(DEBUG, "Adding " + str(pair))
+        reduced_mesh.append(pair)
+
+    reduced_mesh.save(tempdir, "test_reduced_mesh_elliptic_matrix_materialized_on_load")
+
+    loaded_reduced_mesh = ReducedMesh((V, V))
+    loaded_reduced_mesh.load(tempdir, "test_reduced_mesh_elliptic_matrix_materialized_on_load")
+
+    for N in range(len(dofs)):
+        test_logger.log(DEBUG, "Checking N = " + str(N))
+        _test_reduced_mesh_elliptic_matrix(V, loaded_reduced_mesh[:(N + 1)])
+        assert (loaded_reduced_mesh.get_reduced_mesh(N).num_cells()
+                == reduced_mesh.get_reduced_mesh(N).num_cells())
+
+
 # === Vector computation === #
 @generate_meshes
 @enable_reduced_mesh_logging
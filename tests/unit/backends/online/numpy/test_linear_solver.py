@@ -0,0 +1,66 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import eye, isclose, random
+from numpy.linalg import solve
+from rbnics.backends.online.numpy import Function, LinearSolver, Matrix, Vector
+
+
+# Helper functions
+def random_spd_matrix(N):
+    matrix = Matrix(N, N)
+    A = random.rand(N, N)
+    matrix.content[:] = A.dot(A.T) + N * eye(N)
+    return matrix
+
+
+def random_vector(N):
+    vector = Vector(N)
+    vector.content[:] = random.rand(N)
+    return vector
+
+
+def solve_reusing_factorization(lhs, rhs, bcs=None, factorization="cholesky"):
+    solution = Function(lhs.M)
+    solver = LinearSolver(lhs, solution, rhs, bcs)
+    solver.set_parameters({"reuse_factorization": True, "factorization": factorization})
+    solver.solve()
+    return solution.vector().content
+
+
+# Test that factorizations of sliced matrices are stored in the matrix they are sliced from
+def test_linear_solver_reuse_factorization():
+    matrix = random_spd_matrix(5)
+    rhs = random_vector(3)
+    solution = solve_reusing_factorization(matrix[:3, :3], rhs)
+    assert isclose(solution, solve(matrix.content[:3, :3], rhs.content)).all()
+    assert len(matrix._factorizations) == 1
+    factors = matrix._factorizations.peek(("cholesky", matrix[:3, :3]._factorization_source[1]))
+    # A new slice with the same size reuses the factorization
+    solution = solve_reusing_factorization(matrix[:3, :3], rhs)
+    assert isclose(solution, solve(matrix.content[:3, :3], rhs.content)).all()
+    assert len(matrix._factorizations) == 1
+    assert matrix._factorizations.peek(("cholesky", matrix[:3, :3]._factorization_source[1])) is factors
+    # A slice with a different size, or with boundary conditions, requires a new factorization
+    solution = solve_reusing_factorization(matrix[:4, :4], random_vector(4))
+    assert len(matrix._factorizations) == 2
+    solution = solve_reusing_factorization(matrix[:3, :3], rhs, factorization="lu")
+    assert isclose(solution, solve(matrix.content[:3, :3], rhs.content)).all()
+    assert len(matrix._factorizations) == 3
+    lhs_with_bcs = matrix[:3, :3]
+    lhs_with_bcs[0, :] = 0.
+    lhs_with_bcs[0, 0] = 1.
+    rhs_with_bcs = Vector(3)
+    rhs_with_bcs.content[:] = rhs.content
+    solution = solve_reusing_factorization(matrix[:3, :3], rhs_with_bcs, (2., ), factorization="lu")
+    assert isclose(solution, solve(lhs_with_bcs.content, [2.] + list(rhs.content[1:]))).all()
+    assert len(matrix._factorizations) == 4
+    # Changing the matrix discards its factorizations
+    matrix[4, 4] = 2. * matrix[4, 4]
+    assert matrix._factorizations is None
+    solution = solve_reusing_factorization(matrix[:3, :3], rhs)
+    assert isclose(solution, solve(matrix.content[:3, :3], rhs.content)).all()
+    assert len(matrix._factorizations) == 1
@@ -0,0 +1,54 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineMatrix
+from rbnics.eim.problems.eim_approximation import EIMApproximation
+
+
+# Helper functions
+def EIM_approximation_with_interpolation_matrix(basis_generation, upper_entry):
+    # Avoid the allocation of a parametrized expression, as only the interpolation matrix is required here
+    EIM_approximation = object.__new__(EIMApproximation)
+    EIM_approximation.basis_generation = basis_generation
+    EIM_approximation._interpolation_matrix_blocks = dict()
+    EIM_approximation.interpolation_matrix = OnlineAffineExpansionStorage(1)
+    interpolation_matrix = OnlineMatrix(3, 3)
+    for (i, j, value) in ((0, 0, 1.), (1, 0, 0.5), (1, 1, 2.), (2, 0, 0.2), (2, 1, 0.3), (2, 2, 1.)):
+        interpolation_matrix[i, j] = value
+    interpolation_matrix[0, 2] = upper_entry
+    EIM_approximation.interpolation_matrix[0] = interpolation_matrix
+    return EIM_approximation
+
+
+def is_lower_triangular(EIM_approximation):
+    return [EIM_approximation._get_interpolation_matrix_block(N)[1] for N in (1, 2, 3)]
+
+
+# Test that blocks of the interpolation matrix are lower triangular only for a greedy basis generation,
+# regardless of round-off errors above the diagonal
+def test_eim_approximation_interpolation_matrix_block_greedy():
+    EIM_approximation = EIM_approximation_with_interpolation_matrix("Greedy", 1.e-10)
+    assert is_lower_triangular(EIM_approximation) == [True, True, True]
+
+
+def test_eim_approximation_interpolation_matrix_block_POD():
+    EIM_approximation = EIM_approximation_with_interpolation_matrix("POD", 0.)
+    assert is_lower_triangular(EIM_approximation) == [False, False, False]
+
+
+# Test that blocks are computed again once the interpolation matrix has been updated
+def test_eim_approximation_interpolation_matrix_block_reset():
+    EIM_approximation = EIM_approximation_with_interpolation_matrix("Greedy", 1.e-10)
+    (block, _) = EIM_approximation._get_interpolation_matrix_block(3)
+    assert block[0, 2] == 1.e-10
+    updated_interpolation_matrix = OnlineMatrix(3, 3)
+    updated_interpolation_matrix[:, :] = EIM_approximation.interpolation_matrix[0].content
+    updated_interpolation_matrix[0, 2] = 0.
+    EIM_approximation.interpolation_matrix[0] = updated_interpolation_matrix
+    assert EIM_approximation._get_interpolation_matrix_block(3)[0] is block
+    EIM_approximation.reset_interpolation_matrix_blocks()
+    (block, _) = EIM_approximation._get_interpolation_matrix_block(3)
+    assert block[0, 2] == 0.
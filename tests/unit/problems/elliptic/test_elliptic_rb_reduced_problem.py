@@ -0,0 +1,167 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from mpi4py import MPI
+from numpy import array, eye, isclose, random
+from numpy.linalg import solve
+from rbnics.backends.online import (OnlineAffineExpansionStorage, OnlineBasisFunctionsMatrix, OnlineFunction,
+                                    OnlineFunctionsList, OnlineMatrix, OnlineNonAffineExpansionStorage,
+                                    OnlineVector)
+from rbnics.problems.elliptic import EllipticRBReducedProblem
+
+
+# Helper functions
+def reduced_problem_with_error_estimation_operators(ExpansionStorage):
+    # Avoid the allocation of a truth problem, as only error estimation operators are required here
+    reduced_problem = object.__new__(EllipticRBReducedProblem)
+    reduced_problem.error_estimation_terms = [("f", "f"), ("a", "f"), ("a", "a")]
+    reduced_problem.error_estimation_operator = {
+        term: ExpansionStorage(1, 1) for term in reduced_problem.error_estimation_terms}
+    reduced_problem._solution = OnlineFunction(1)
+    return reduced_problem
+
+
+def online_function(value):
+    function = OnlineFunction(1)
+    function.vector()[0] = value
+    return function
+
+
+# Test detection of error estimation operators which can be shared by all parameters
+def test_elliptic_rb_reduced_problem_has_affine_error_estimation_operators():
+    reduced_problem = reduced_problem_with_error_estimation_operators(OnlineAffineExpansionStorage)
+    assert reduced_problem._has_affine_error_estimation_operators()
+
+
+def test_elliptic_rb_reduced_problem_has_non_affine_error_estimation_operators():
+    reduced_problem = reduced_problem_with_error_estimation_operators(OnlineNonAffineExpansionStorage)
+    assert not reduced_problem._has_affine_error_estimation_operators()
+
+
+# Test that error estimation with exactly evaluated operators falls back to one parameter at a time
+def test_elliptic_rb_reduced_problem_estimate_error_batch_non_affine():
+    reduced_problem = reduced_problem_with_error_estimation_operators(OnlineNonAffineExpansionStorage)
+    reduced_problem.set_mu = lambda mu: setattr(reduced_problem, "mu", mu)
+    reduced_problem.estimate_error = lambda: reduced_problem.mu[0] * reduced_problem._solution.vector()[0]
+    mus = [(1., ), (2., ), (3., )]
+    solutions = [online_function(value) for value in (4., 5., 6.)]
+    error_estimators = reduced_problem._estimate_error_batch(mus, solutions)
+    assert isclose(error_estimators, [4., 10., 18.]).all()
+
+
+# Test assembly of the operators for error estimation with more than one affine term for each term
+class Space(object):
+    mpi_comm = MPI.COMM_WORLD
+
+
+class ErrorEstimationOperatorExpansionStorage(OnlineAffineExpansionStorage):
+    def save(self, directory, filename):
+        pass
+
+
+class CountingMatrix(object):
+    def __init__(self, matrix):
+        self.matrix = matrix
+        self.products = 0
+
+    def __mul__(self, function):
+        self.products += 1
+        return self.matrix * function
+
+
+def random_online_function(N):
+    function = OnlineFunction(N)
+    function.vector().content[:] = random.rand(N)
+    return function
+
+
+def enrich_riesz(riesz_term_q, function):
+    # The online backend does not support copies of functions in FunctionsList.enrich()
+    if isinstance(riesz_term_q, OnlineBasisFunctionsMatrix):
+        riesz_term_q["u"]._list.append(function)
+        riesz_term_q._update_component_name_to_basis_component_length("u")
+    else:
+        riesz_term_q._list.append(function)
+
+
+def riesz_to_array(riesz_term_q):
+    return array([function.vector().content for function in riesz_term_q]).T
+
+
+def test_elliptic_rb_reduced_problem_assemble_error_estimation_operators():
+    (N, Q) = (6, 2)
+    reduced_problem = object.__new__(EllipticRBReducedProblem)
+    reduced_problem.components = ["u"]
+    reduced_problem.terms_order = {"a": 2, "f": 1}
+    reduced_problem.Q = {"a": Q, "f": Q}
+    reduced_problem.error_estimation_terms = [("f", "f"), ("a", "f"), ("a", "a")]
+    reduced_problem.riesz = {"a": OnlineAffineExpansionStorage(Q), "f": OnlineAffineExpansionStorage(Q)}
+    for q in range(Q):
+        riesz_a_q = OnlineBasisFunctionsMatrix(Space())
+        riesz_a_q.init(reduced_problem.components)
+        reduced_problem.riesz["a"][q] = riesz_a_q
+        reduced_problem.riesz["f"][q] = OnlineFunctionsList(Space())
+        enrich_riesz(reduced_problem.riesz["f"][q], random_online_function(N))
+    reduced_problem.error_estimation_operator = {
+        term: ErrorEstimationOperatorExpansionStorage(Q, Q) for term in reduced_problem.error_estimation_terms}
+    inner_product = OnlineMatrix(N, N)
+    inner_product.content[:] = random.rand(N, N)
+    reduced_problem._error_estimation_inner_product = CountingMatrix(inner_product)
+    reduced_problem._error_estimation_inner_product_times_riesz = dict()
+    reduced_problem.folder = {"error_estimation": None}
+    for n in range(3):
+        for q in range(Q):
+            enrich_riesz(reduced_problem.riesz["a"][q], random_online_function(N))
+        for term in reduced_problem.error_estimation_terms:
+            reduced_problem.assemble_error_estimation_operators(term, "offline")
+        # Products of the inner product matrix with each Riesz representor are computed only once
+        assert reduced_problem._error_estimation_inner_product.products == Q * (n + 2)
+        for (term0, term1) in reduced_problem.error_estimation_terms:
+            for q0 in range(Q):
+                for q1 in range(Q):
+                    assert isclose(
+                        array(reduced_problem.error_estimation_operator[term0, term1][q0, q1]).reshape(-1),
+                        (riesz_to_array(reduced_problem.riesz[term0][q0]).T.dot(inner_product.content).dot(
+                            riesz_to_array(reduced_problem.riesz[term1][q1]))).reshape(-1)).all()
+
+
+# Test that reduced systems for several parameters are assembled and solved at once
+class EmptyCache(dict):
+    def __getitem__(self, key):
+        raise KeyError
+
+    def __setitem__(self, key, value):
+        pass
+
+
+def test_elliptic_rb_reduced_problem_solve_batch():
+    (N, Q) = (4, 2)
+    reduced_problem = object.__new__(EllipticRBReducedProblem)
+    reduced_problem.components = ["u"]
+    reduced_problem.N = N
+    reduced_problem.N_bc = 0
+    reduced_problem.dirichlet_bc = None
+    reduced_problem.dirichlet_bc_are_homogeneous = None
+    reduced_problem._solution_cache = EmptyCache()
+    reduced_problem._linear_solver_parameters = dict()
+    reduced_problem.set_mu = lambda mu: setattr(reduced_problem, "mu", mu)
+    reduced_problem.compute_theta = lambda term: (
+        (1., reduced_problem.mu[0]) if term == "a" else (reduced_problem.mu[0], 2.))
+    reduced_problem.operator = {"a": OnlineAffineExpansionStorage(Q), "f": OnlineAffineExpansionStorage(Q)}
+    for q in range(Q):
+        operator_a_q = OnlineMatrix({"u": N}, {"u": N})
+        operator_a_q.content[:] = random.rand(N, N) + N * eye(N)
+        reduced_problem.operator["a"][q] = operator_a_q
+        operator_f_q = OnlineVector({"u": N})
+        operator_f_q.content[:] = random.rand(N)
+        reduced_problem.operator["f"][q] = operator_f_q
+    assert reduced_problem.ProblemSolver(reduced_problem, N)._eval_batch_is_customized_as_eval()
+    mus = [(1., ), (2., ), (3., )]
+    solutions = reduced_problem._solve_batch(mus)
+    for (mu, solution) in zip(mus, solutions):
+        lhs = reduced_problem.operator["a"][0].content + mu[0] * reduced_problem.operator["a"][1].content
+        rhs = mu[0] * reduced_problem.operator["f"][0].content + 2. * reduced_problem.operator["f"][1].content
+        assert isclose(solution.vector().content, solve(lhs, rhs)).all()
@@ -4,7 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from math import log
+from math import log, sqrt
 from numpy import linspace, random
 import scipy.stats as stats
 import matplotlib
@@ -186,3 +186,69 @@ def test_sampling_composite_log_uniform_and_beta():
     plot(0, box, parameter_space_subset, bins, stats_loguniform, loc=box[0][min], scale=box[0][max] - box[0][min])
     plot(1, box, parameter_space_subset, bins, stats.beta, a=2, b=5, loc=box[1][min], scale=box[1][max] - box[1][min])
     plt.show()
+
+
+# Save, load and difference of parameter space subsets
+def test_sampling_save_load_diff(tempdir):
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(box, n)
+    parameter_space_subset.save(tempdir, "parameter_space_subset")
+    loaded_parameter_space_subset = ParameterSpaceSubset()
+    loaded_parameter_space_subset.load(tempdir, "parameter_space_subset")
+    assert list(loaded_parameter_space_subset) == list(parameter_space_subset)
+    assert all(isinstance(mu, tuple) for mu in loaded_parameter_space_subset)
+    diff_parameter_space_subset = parameter_space_subset.diff(parameter_space_subset[:10])
+    assert list(diff_parameter_space_subset) == list(parameter_space_subset[10:])
+
+
+# Closest parameters
+def test_sampling_closest():
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(box, n, sampling=EquispacedDistribution())  # many parameters at the same distance
+    mus = [parameter_space_subset[0], parameter_space_subset[n // 2], (3.5, 500.)]
+    for (mu, closest_parameter_space_subset) in zip(mus, parameter_space_subset.closest_batch(10, mus)):
+        distances = [sqrt(sum([(x - y)**2 for (x, y) in zip(mu, xi)])) for xi in parameter_space_subset]
+        expected = [parameter_space_subset[i] for i in sorted(range(len(distances)), key=distances.__getitem__)[:10]]
+        assert list(closest_parameter_space_subset) == expected
+        assert list(parameter_space_subset.closest(10, mu)) == expected
+
+
+# Parameters provided by the user keep their type, also after save and load
+def test_sampling_integer_parameters(tempdir):
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.extend([(1, 2.5), (3, 4.5)])
+    parameter_space_subset.append((5, 6.5))
+    assert list(parameter_space_subset) == [(1, 2.5), (3, 4.5), (5, 6.5)]
+    assert all(isinstance(mu[0], int) for mu in parameter_space_subset)
+    parameter_space_subset.save(tempdir, "parameter_space_subset")
+    loaded_parameter_space_subset = ParameterSpaceSubset()
+    loaded_parameter_space_subset.load(tempdir, "parameter_space_subset")
+    assert list(loaded_parameter_space_subset) == list(parameter_space_subset)
+    assert all(isinstance(mu[0], int) for mu in loaded_parameter_space_subset)
+
+
+# Distance metric is employed also for parameters which are not stored as floats
+def test_sampling_closest_distance_metric():
+    mus = [(1, 1.), (2, 10.), (3, 100.)]
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.extend(mus)
+    float_parameter_space_subset = ParameterSpaceSubset()
+    float_parameter_space_subset.extend([tuple(float(mu_p) for mu_p in mu) for mu in mus])
+    assert list(parameter_space_subset.closest(1, (1, 90.))) == [(3, 100.)]
+    for subset in (parameter_space_subset, float_parameter_space_subset):
+        subset.set_distance_metric(weights=[100., 1.], log_scale=[False, True])
+    assert list(parameter_space_subset.closest(1, (1, 90.))) == [(1, 1.)]
+    assert list(float_parameter_space_subset.closest(1, (1, 90.))) == [(1., 1.)]
+
+
+# Ties in maxima are broken by index, independently of how parameters are distributed among processes
+def test_sampling_max_ties():
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.extend([(float(i), ) for i in range(20)])
+
+    def batch_generator(mus):
+        return [float(int(mu[0]) % 5 == 3) for mu in mus]
+
+    assert parameter_space_subset.max_batch(batch_generator) == (1., 3)
+    assert parameter_space_subset.max_k_batch(batch_generator, 3) == ([1., 1., 1.], [3, 8, 13])
+    assert parameter_space_subset.max_k_batch(batch_generator, 3, min_distance=6.) == ([1., 1., 0.], [3, 13, 19])
@@ -0,0 +1,146 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import json
+import os
+import pytest
+from rbnics.utils.cache.disk_cache_index import DiskCacheIndex
+
+
+def _store(tempdir, index, filename, size):
+    with open(os.path.join(tempdir, filename + ".dat"), "w") as f:
+        f.write("x" * size)
+    index.add(filename)
+
+
+def _stored(tempdir, filename):
+    return os.path.exists(os.path.join(tempdir, filename + ".dat"))
+
+
+@pytest.mark.parametrize("limit, expected", [
+    ("3", (3, None)),
+    ("2KB", (None, 2048)),
+    ("3 1.5MB", (3, 1572864))
+])
+def test_disk_cache_index_limit(limit, expected):
+    assert DiskCacheIndex._parse_limit(limit) == expected
+
+
+def test_disk_cache_index_LRU_entries(tempdir):
+    index = DiskCacheIndex(tempdir, "2", "LRU")
+    _store(tempdir, index, "a", 1)
+    _store(tempdir, index, "b", 1)
+    index.touch("a")
+    _store(tempdir, index, "c", 1)
+    assert _stored(tempdir, "a")
+    assert not _stored(tempdir, "b")
+    assert _stored(tempdir, "c")
+
+
+def test_disk_cache_index_LFU_entries(tempdir):
+    index = DiskCacheIndex(tempdir, "2", "LFU")
+    _store(tempdir, index, "a", 1)
+    index.touch("a")
+    _store(tempdir, index, "b", 1)
+    _store(tempdir, index, "c", 1)
+    assert _stored(tempdir, "a")
+    assert not _stored(tempdir, "b")
+    assert _stored(tempdir, "c")
+
+
+def test_disk_cache_index_LRU_bytes(tempdir):
+    index = DiskCacheIndex(tempdir, "10B", "LRU")
+    _store(tempdir, index, "a", 4)
+    _store(tempdir, index, "b", 4)
+    _store(tempdir, index, "c", 4)
+    assert not _stored(tempdir, "a")
+    assert _stored(tempdir, "b")
+    assert _stored(tempdir, "c")
+    # A second index on the same folder shares the same state
+    other_index = DiskCacheIndex(tempdir, "10B", "LRU")
+    _store(tempdir, other_index, "d", 4)
+    assert not _stored(tempdir, "b")
+    assert _stored(tempdir, "c")
+    assert _stored(tempdir, "d")
+
+
+def test_disk_cache_index_flush(tempdir):
+    index = DiskCacheIndex(tempdir, "2", "LRU")
+    _store(tempdir, index, "a", 1)
+    index.touch("a")
+    # Accesses are only recorded in memory until the index is flushed
+    assert not os.path.exists(os.path.join(tempdir, DiskCacheIndex.index_filename))
+    index.flush()
+    other_index = DiskCacheIndex(tempdir, "2", "LRU")
+    _store(tempdir, other_index, "b", 1)
+    _store(tempdir, other_index, "c", 1)
+    assert not _stored(tempdir, "a")
+    assert _stored(tempdir, "b")
+    assert _stored(tempdir, "c")
+
+
+def test_disk_cache_index_group_indices(tempdir):
+    # Store an entry as the first process of a group would do
+    with open(os.path.join(tempdir, "a.dat"), "w") as f:
+        f.write("x")
+    group_index_filename = DiskCacheIndex.group_index_filename.format(rank=1)
+    with open(os.path.join(tempdir, group_index_filename), "w") as f:
+        json.dump({"a": {"size": 1, "last_access": 0., "accesses": 1}}, f)
+    # The main index merges the group index, and removes it once written
+    index = DiskCacheIndex(tempdir, "2", "LRU")
+    _store(tempdir, index, "b", 1)
+    _store(tempdir, index, "c", 1)
+    assert not _stored(tempdir, "a")
+    assert _stored(tempdir, "b")
+    assert _stored(tempdir, "c")
+    assert not os.path.exists(os.path.join(tempdir, group_index_filename))
+
+
+def test_disk_cache_index_evicted_by_other_index(tempdir):
+    index = DiskCacheIndex(tempdir, "3", "LFU")
+    _store(tempdir, index, "a", 1)
+    _store(tempdir, index, "b", 1)
+    _store(tempdir, index, "c", 1)
+    index.flush()
+    # A second index on the same folder evicts "a", which the first index keeps accessing in memory
+    other_index = DiskCacheIndex(tempdir, "3", "LFU")
+    other_index.touch("b")
+    other_index.touch("c")
+    _store(tempdir, other_index, "d", 1)
+    assert not _stored(tempdir, "a")
+    for _ in range(3):
+        index.touch("a")
+    # The entry evicted by the second index must not count towards the limits of the first one
+    _store(tempdir, index, "e", 1)
+    assert _stored(tempdir, "b")
+    assert _stored(tempdir, "c")
+    assert not _stored(tempdir, "d")
+    assert _stored(tempdir, "e")
+    with open(os.path.join(tempdir, DiskCacheIndex.index_filename), "r") as f:
+        assert set(json.load(f).keys()) == {"b", "c", "e"}
+
+
+class GroupDiskCacheIndex(DiskCacheIndex):
+    def __init__(self, folder, limit, policy, rank):
+        DiskCacheIndex.__init__(self, folder, limit, policy)
+        self.rank = rank
+
+    def _index_filename(self):
+        # Behave as the first process of a group would do
+        return self.group_index_filename.format(rank=self.rank)
+
+
+def test_disk_cache_index_group_limits(tempdir):
+    index = GroupDiskCacheIndex(tempdir, "2", "LRU", 1)
+    other_index = GroupDiskCacheIndex(tempdir, "2", "LRU", 2)
+    _store(tempdir, index, "a", 1)
+    _store(tempdir, index, "b", 1)
+    index.flush()
+    # Limits apply to the entries of all groups
+    _store(tempdir, other_index, "c", 1)
+    assert not _stored(tempdir, "a")
+    assert _stored(tempdir, "b")
+    assert _stored(tempdir, "c")
@@ -0,0 +1,57 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+from rbnics.utils.cache.packed_storage import PackedStorage
+
+
+def _write(tempdir, filename, content):
+    with open(os.path.join(tempdir, filename), "w") as f:
+        f.write(content)
+
+
+def _read(tempdir, filename):
+    with open(os.path.join(tempdir, filename), "r") as f:
+        return f.read()
+
+
+def test_packed_storage(tempdir):
+    storage = PackedStorage(tempdir)
+    _write(tempdir, "a.dat", "first")
+    _write(tempdir, "a_output.dat", "shared")
+    storage.pack("a")
+    _write(tempdir, "b_output.dat", "shared")
+    storage.pack("b")
+    # Files have been moved to the storage, and identical contents are stored only once
+    assert sorted(f for f in os.listdir(tempdir) if not f.startswith(".")) == []
+    assert os.path.getsize(os.path.join(tempdir, ".packed_cache_0.bin")) == len("first") + len("shared")
+    # Contents are read directly from the shard
+    assert storage.read("a") == {".dat": b"first", "_output.dat": b"shared"}
+    # Files are available to import only while unpacked, in a folder private to the current process
+    with storage.unpacked("a") as unpacked_filename:
+        assert unpacked_filename != "a"
+        assert _read(tempdir, unpacked_filename + ".dat") == "first"
+        assert _read(tempdir, unpacked_filename + "_output.dat") == "shared"
+        assert not os.path.exists(os.path.join(tempdir, os.path.dirname(unpacked_filename), "b_output.dat"))
+        # The lock is not held while files are imported
+        assert storage._lock_file is None
+    assert sorted(f for f in os.listdir(tempdir) if not f.startswith(".packed_cache_")) == []
+    assert not os.path.exists(os.path.join(tempdir, os.path.dirname(unpacked_filename)))
+    # A second storage on the same folder shares the same index
+    other_storage = PackedStorage(tempdir)
+    with other_storage.unpacked("b") as unpacked_filename:
+        assert _read(tempdir, unpacked_filename + "_output.dat") == "shared"
+    _write(tempdir, "b.dat", "second")
+    other_storage.pack("b")
+    with storage.unpacked("b") as unpacked_filename:
+        assert _read(tempdir, unpacked_filename + ".dat") == "second"
+        assert _read(tempdir, unpacked_filename + "_output.dat") == "shared"
+    # Files which have not been packed are imported from the cache folder
+    _write(tempdir, "c.dat", "third")
+    with storage.unpacked("c") as unpacked_filename:
+        assert unpacked_filename == "c"
+        assert _read(tempdir, "c.dat") == "third"
+    assert _read(tempdir, "c.dat") == "third"
@@ -0,0 +1,71 @@
+# Copyright (C) 2015-2021 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import array, isclose, random
+from rbnics.backends.basic.transpose import _project_matrix
+from rbnics.backends.online.numpy import Function, Matrix
+from rbnics.backends.online.numpy.transpose import wrapping
+from rbnics.utils.cache import ProjectionsCache
+
+
+# Helper classes and functions
+class FunctionsList(list):
+    pass
+
+
+def random_function(N):
+    function = Function(N)
+    function.vector().content[:] = random.rand(N)
+    return function
+
+
+def to_array(functions):
+    return array([function.vector().content for function in functions]).T
+
+
+class CountingWrapping(object):
+    def __init__(self):
+        self.products = 0
+
+    def __getattr__(self, name):
+        return getattr(wrapping, name)
+
+    def matrix_mul_vectors(self, matrix, vectors):
+        self.products += len(vectors)
+        return wrapping.matrix_mul_vectors(matrix, vectors)
+
+    def matrix_transpose_mul_vectors(self, matrix, vectors):
+        self.products += len(vectors)
+        return wrapping.matrix_transpose_mul_vectors(matrix, vectors)
+
+
+def project(counting_wrapping, matrix, left, right):
+    output = Matrix(len(left), len(right))
+    _project_matrix(counting_wrapping, left, list(left), matrix, right, list(right), output)
+    assert isclose(array(output.content), to_array(left).T.dot(matrix.content).dot(to_array(right))).all()
+
+
+# Test that projections are reused only while the cache is in use
+def test_projections_cache():
+    N = 6
+    matrix = Matrix(N, N)
+    matrix.content[:] = random.rand(N, N)
+    left = FunctionsList([random_function(N) for _ in range(3)])
+    right = FunctionsList([random_function(N) for _ in range(2)])
+    counting_wrapping = CountingWrapping()
+    cache = ProjectionsCache()
+    with cache.use():
+        project(counting_wrapping, matrix, left, right)
+        assert counting_wrapping.products == 2
+        left.append(random_function(N))
+        right.append(random_function(N))
+        project(counting_wrapping, matrix, left, right)
+        assert counting_wrapping.products == 4
+    assert len(cache) == 1
+    project(counting_wrapping, matrix, left, right)
+    assert counting_wrapping.products == 7
+    cache.clear()
+    assert len(cache) == 0
@@ -5,8 +5,8 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import pytest
-from mpi4py.MPI import COMM_WORLD
-from rbnics.utils.mpi import parallel_io
+from mpi4py.MPI import COMM_SELF, COMM_WORLD
+from rbnics.utils.mpi import parallel_groups, parallel_io, parallel_io_communicator
 
 
 def test_parallel_io_without_return_value():
@@ -49,3 +49,18 @@ def test_parallel_io_with_error_2():
     with pytest.raises(CustomError) as excinfo:
         parallel_io(task)
     assert str(excinfo.value) == str((exception_message_1, exception_message_2))
+
+
+def test_parallel_io_communicator():
+    # Each process is a group on its own, and thus carries out the task on its own
+    (group, groups) = parallel_groups(COMM_SELF)
+    assert group == COMM_WORLD.rank
+    assert groups == COMM_WORLD.size
+
+    def task():
+        return COMM_WORLD.rank
+    with parallel_io_communicator(COMM_SELF):
+        return_value = parallel_io(task)
+    assert return_value == COMM_WORLD.rank
+    return_value = parallel_io(task)
+    assert return_value == 0